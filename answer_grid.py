@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Cevap tablosu ayrıştırma modülü
+Cevap anahtarı sayfasının kelimelerini konumlarıyla tek geçişte tarar: satırları ve sütun
+bölümlerini kutu koordinatlarından çıkarır, her cevabı üstündeki test başlığının sütununa atar.
+Konum bilgisi olmayan metin (OCR çıktısı) için sıralı metin ayrıştırıcısı kullanılır.
+"""
+
+import re
+from bisect import bisect_right
+from collections import namedtuple
+from typing import Dict, List, Optional, Tuple
+
+# Başlık bulunamazsa kullanılan test adı
+DEFAULT_TEST_TITLE = 'GENEL'
+
+# Kabul edilen soru numarası aralığı
+MAX_QUESTION_NUMBER = 50
+
+# "12. B", "12.B", "12) B", "12-B"
+ANSWER_RE = re.compile(r'(?<![\d.])(\d{1,2})\s*[.)\-]\s*([ABCDE])(?![A-Za-zÇĞİÖŞÜçğıöşü])')
+
+# Sadece büyük harf ve boşluktan oluşan satır (PDF'ten İ harfi boşluk olarak gelebilir)
+UPPERCASE_LINE_RE = re.compile(r'^[A-ZÇĞIİÖŞÜ][A-ZÇĞIİÖŞÜ\s]*$')
+
+# Test başlığı anahtar kelimeleri (İ düşmüş yazımlar dahil)
+TEST_TITLE_RE = re.compile(
+    r'TEST|MATEM[AE]T|T[ÜU]RK[ÇC]E|\bFEN\b|SOSYAL|F[İI ]Z[İI ]K|K[İI ]MYA|B[İI ]YOLOJ|TAR[İI ]H|'
+    r'CO[ĞG]RAFYA|FELSEFE|GEOMETR|D[İI ]N K[ÜU]LT'
+)
+
+# Aynı satırdaki kelimeler arasında bu kadar (satır yüksekliği katı) boşluk varsa ayrı sütundur
+COLUMN_GAP_FACTOR = 1.5
+
+# Sağa yaslı cevap harfi numarasından uzak olabilir: "1." ve "A" arasındaki boşluk sütun ayırmaz
+NUMBER_TOKEN_RE = re.compile(r'^\d{1,2}[.)\-]$')
+ANSWER_LETTER_RE = re.compile(r'^[ABCDE]$')
+
+# Test başlığı: ad ve kutu
+TestTitle = namedtuple('TestTitle', ['name', 'x0', 'y0', 'x1', 'y1'])
+
+def clean_title(text: str) -> str:
+    """Başlıktaki fazla boşlukları temizle"""
+    return ' '.join(text.split())
+
+def is_test_title(text: str) -> bool:
+    """Metin bir test başlığı mı - büyük harf, tek harfli başlık satırı (A B C D E) değil"""
+    text = clean_title(text)
+    if not 3 < len(text) < 50 or not UPPERCASE_LINE_RE.match(text):
+        return False
+    if all(len(word) == 1 for word in text.split()):
+        return False
+    return TEST_TITLE_RE.search(text) is not None
+
+def _accept(table: Dict[str, Dict[str, str]], title: str, number: str, answer: str):
+    """Cevabı tabloya ekle - her testte bir soru numarasının ilk cevabı geçerlidir"""
+    if not 1 <= int(number) <= MAX_QUESTION_NUMBER:
+        return
+    answers = table.setdefault(title, {})
+    if str(int(number)) not in answers:
+        answers[str(int(number))] = answer
+
+def group_rows(words) -> List[List[tuple]]:
+    """Kelimeleri dikey merkezlerine göre görsel satırlara ayırır - satır içinde soldan sağa"""
+    
+    rows = []
+    current = []
+    current_center = None
+    current_height = 0.0
+    
+    for word in sorted(words, key=lambda w: ((w[1] + w[3]) / 2, w[0])):
+        center = (word[1] + word[3]) / 2
+        height = word[3] - word[1]
+        if current and abs(center - current_center) <= max(current_height, height) / 2:
+            current.append(word)
+            continue
+        
+        if current:
+            rows.append(sorted(current, key=lambda w: w[0]))
+        current = [word]
+        current_center = center
+        current_height = height
+    
+    if current:
+        rows.append(sorted(current, key=lambda w: w[0]))
+    return rows
+
+def split_segments(row) -> List[List[tuple]]:
+    """Satırı büyük yatay boşluklardan sütun parçalarına böler - numara ve cevap harfi ayrılmaz"""
+    
+    height = max(word[3] - word[1] for word in row)
+    segments = [[row[0]]]
+    for previous, word in zip(row, row[1:]):
+        is_pair = NUMBER_TOKEN_RE.match(previous[4]) and ANSWER_LETTER_RE.match(word[4])
+        if word[0] - previous[2] > COLUMN_GAP_FACTOR * height and not is_pair:
+            segments.append([word])
+        else:
+            segments[-1].append(word)
+    return segments
+
+class _Band:
+    """Aynı satırdaki test başlıkları - sütun sınırları başlık merkezlerinin orta noktaları"""
+    
+    def __init__(self, titles: List[TestTitle]):
+        self.titles = sorted(titles, key=lambda t: t.x0 + t.x1)
+        self.y0 = min(t.y0 for t in titles)
+        centers = [(t.x0 + t.x1) / 2 for t in self.titles]
+        self.boundaries = [(a + b) / 2 for a, b in zip(centers, centers[1:])]
+    
+    def title_at(self, x: float) -> str:
+        return self.titles[bisect_right(self.boundaries, x)].name
+
+def parse_answer_words(words, carry: Optional[_Band] = None) -> Tuple[Dict[str, Dict[str, str]], Optional[_Band]]:
+    """Sayfa kelimelerinden (fitz "words": x0, y0, x1, y1, metin, ...) test -> soru -> cevap tablosu
+    
+    Kelimeler bir kez satırlara ve sütun parçalarına ayrılır; her parça ya başlık ya da cevap
+    içerir. Cevaplar en yakın üst başlık satırında yatay konumuna göre sütununa atanır.
+    Sayfada üstte başlık yoksa önceki sayfanın son başlık satırı (carry) kullanılır.
+    Dönüş: (tablo, sonraki sayfaya taşınacak başlık satırı)
+    """
+    
+    bands = []  # y sırasıyla başlık satırları
+    entries = []  # (x merkezi, y, soru, cevap)
+    
+    for row in group_rows(w for w in words if w[4].strip()):
+        row_titles = []
+        for segment in split_segments(row):
+            text = ' '.join(word[4] for word in segment)
+            
+            if is_test_title(text):
+                row_titles.append(TestTitle(
+                    clean_title(text), segment[0][0], min(w[1] for w in segment),
+                    segment[-1][2], max(w[3] for w in segment)
+                ))
+                continue
+            
+            # Eşleşmenin konumunu bulmak için kelime başlangıç ofsetleri
+            offsets = []
+            position = 0
+            for word in segment:
+                offsets.append(position)
+                position += len(word[4]) + 1
+            
+            for match in ANSWER_RE.finditer(text):
+                first = segment[bisect_right(offsets, match.start()) - 1]
+                last = segment[bisect_right(offsets, match.end() - 1) - 1]
+                entries.append(((first[0] + last[2]) / 2, first[1], match.group(1), match.group(2)))
+        
+        if row_titles:
+            bands.append(_Band(row_titles))
+    
+    table = {}
+    band_tops = [band.y0 for band in bands]
+    for x, y, number, answer in entries:
+        index = bisect_right(band_tops, y) - 1
+        band = bands[index] if index >= 0 else carry
+        _accept(table, band.title_at(x) if band else DEFAULT_TEST_TITLE, number, answer)
+    
+    return table, (bands[-1] if bands else carry)
+
+def parse_answer_text(text: str, current_title: Optional[str] = None) -> Tuple[Dict[str, Dict[str, str]], Optional[str]]:
+    """Konum bilgisi olmayan metinden (OCR) tablo - cevaplar metinde kendinden önceki başlığa atanır
+    
+    Dönüş: (tablo, sonraki sayfaya taşınacak son başlık)
+    """
+    
+    table = {}
+    for line in text.splitlines():
+        if is_test_title(line):
+            current_title = clean_title(line)
+            continue
+        for match in ANSWER_RE.finditer(line):
+            _accept(table, current_title or DEFAULT_TEST_TITLE, match.group(1), match.group(2))
+    
+    return table, current_title
+
+def merge_answer_tables(target: Dict[str, Dict[str, str]], table: Dict[str, Dict[str, str]]):
+    """Sayfa tablosunu belge tablosuna ekle (önceki sayfadaki cevap korunur)"""
+    for title, answers in table.items():
+        merged = target.setdefault(title, {})
+        for number, answer in answers.items():
+            merged.setdefault(number, answer)
@@ -6,51 +6,80 @@ Cevap anahtarı çıkarma modülü
 """
 
 import fitz  # PyMuPDF
-import re
 import json
 import os
 from typing import Dict, List, Tuple, Optional
-from PIL import Image
-import io
-from mistralai import Mistral
-import base64
 from bot_config import BOT_CONFIG
+from answer_keys import ANSWER_KEY_MANIFEST_FILENAME, find_answer_key_pdfs
+from answer_grid import merge_answer_tables, parse_answer_text, parse_answer_words
+from ingestion_manifest import IngestionManifest, file_sha256
+from ocr_backends import ConcurrentOCR, default_ocr_runner
+from ocr_cache import OCRCache
+
+# OCR ayarları
+OCR_RENDER_SCALE = 3.0  # 3x büyütme (Mistral AI için daha iyi)
+OCR_PROMPT = """
+Bu görüntüdeki metni tam olarak okuyup çıkar. Bu bir cevap anahtarı PDF'i sayfası.
+Soru numaraları ve cevapları (A, B, C, D, E) formatında bulun.
+Örnek format: "1. A 2. B 3. C" şeklinde.
+Sadece metni çıkar, başka açıklama yapma.
+"""
+
+def default_ocr_cache() -> OCRCache:
+    """Konfigürasyondaki OCR önbelleğini oluştur"""
+    return OCRCache(
+        BOT_CONFIG.get('OCR_CACHE_DIR', os.path.join('.cache', 'ocr')),
+        max_bytes=BOT_CONFIG.get('OCR_CACHE_MAX_MB', 100) * 1024 * 1024
+    )
 
 class AnswerKeyExtractor:
-    def __init__(self, pdf_path: str):
-        """Cevap anahtarı PDF'ini yükle"""
+    def __init__(self, pdf_path: str, ocr_backend=None, ocr_cache: Optional[OCRCache] = None, ocr_runner: Optional[ConcurrentOCR] = None):
+        """Cevap anahtarı PDF'ini yükle
+        
+        ocr_backend: complete(prompt, image_png) metoduna sahip OCR backend'i (varsayılan: Mistral AI)
+        ocr_cache: OCR sonuç önbelleği (varsayılan: konfigürasyondaki disk önbelleği)
+        ocr_runner: sayfaları birlikte OCR'a gönderen çalıştırıcı - birden fazla PDF aynı client'ı
+        ve hız sınırını paylaşsın diye dışarıdan verilebilir (varsayılan: ocr_backend ile yeni çalıştırıcı)
+        """
         self.pdf_path = pdf_path
         self.doc = fitz.open(pdf_path)
         self.answers = {}
+        self.ocr_runner = ocr_runner or default_ocr_runner(ocr_backend)
+        self.ocr_backend = self.ocr_runner.backend
+        self.ocr_cache = ocr_cache or default_ocr_cache()
         
     def extract_answers(self) -> Dict[str, Dict[str, str]]:
         """Cevap anahtarından cevapları çıkar"""
         try:
             print(f"Cevap anahtarı işleniyor: {self.pdf_path}")
             
-            # Tüm sayfaları işle
-            for page_num in range(len(self.doc)):
-                page = self.doc[page_num]
-                text = page.get_text()
-                
-                # Eğer metin çıkarılamadıysa OCR kullan
-                if not text or len(text.strip()) < 10:
-                    print(f"  Sayfa {page_num + 1}: Metin çıkarılamadı, OCR kullanılıyor...")
-                    text = self._extract_text_with_ocr(page)
+            # Sayfa metinlerini al
+            page_texts = [self.doc[page_num].get_text() for page_num in range(len(self.doc))]
+            
+            # Metin çıkarılamayan sayfalar birlikte OCR'a gönderilir, sonuçlar sayfa sırasına yerleşir
+            ocr_pages = [page_num for page_num, text in enumerate(page_texts) if not text or len(text.strip()) < 10]
+            if ocr_pages:
+                print(f"  {len(ocr_pages)} sayfada metin çıkarılamadı, OCR kullanılıyor...")
+                for page_num, text in zip(ocr_pages, self._extract_texts_with_ocr(ocr_pages)):
+                    page_texts[page_num] = text
+            
+            # Tüm sayfaları sırayla tek geçişte ayrıştır - başlık sütunu sonraki sayfaya taşınır
+            carry_band = None
+            carry_title = None
+            ocr_page_set = set(ocr_pages)
+            for page_num, text in enumerate(page_texts):
+                if not text or len(text.strip()) <= 10:
+                    print(f"  Sayfa {page_num + 1}: OCR ile de metin çıkarılamadı")
+                    continue
                 
-                if text and len(text.strip()) > 10:
-                    # Test başlıklarını bul
-                    test_titles = self._find_test_titles(text)
-                    
-                    for title in test_titles:
-                        if title not in self.answers:
-                            self.answers[title] = {}
-                        
-                        # Bu test için cevapları bul
-                        answers = self._extract_answers_for_test(text, title)
-                        self.answers[title].update(answers)
+                if page_num in ocr_page_set:
+                    # OCR metninde konum yok - cevaplar metinde önceki başlığa atanır
+                    table, carry_title = parse_answer_text(text, carry_title)
                 else:
-                    print(f"  Sayfa {page_num + 1}: OCR ile de metin çıkarılamadı")
+                    # Kelime kutularından sütunlara göre ayrıştır
+                    table, carry_band = parse_answer_words(self.doc[page_num].get_text("words"), carry_band)
+                
+                merge_answer_tables(self.answers, table)
             
             print(f"Toplam {len(self.answers)} test bulundu")
             for test_name, answers in self.answers.items():
@@ -62,136 +91,43 @@ class AnswerKeyExtractor:
             print(f"Cevap anahtarı çıkarılırken hata: {e}")
             return {}
     
-    def _find_test_titles(self, text: str) -> List[str]:
-        """Basit başlık bulma - sadece soru-cevap eşleştirmesi için"""
-        # Başlık aramayı basitleştir - sadece "TEST" içeren başlıkları bul
-        test_titles = []
+    def _extract_texts_with_ocr(self, page_numbers: List[int]) -> List[str]:
+        """Sayfaları OCR ile okur - önbellekte olmayanlar birlikte gönderilir, sonuçlar sayfa sırasıyla döner"""
         
-        # Basit pattern ile başlık bul
-        patterns = [
-            r'[A-ZÇĞIİÖŞÜ][A-ZÇĞIİÖŞÜ\s]*TEST[İI]?',
-            r'[A-ZÇĞIİÖŞÜ][A-ZÇĞIİÖŞÜ\s]+',
-        ]
+        texts = [""] * len(page_numbers)
+        pending = []  # (sonuç sırası, önbellek anahtarı, görüntü)
         
-        for pattern in patterns:
-            matches = re.findall(pattern, text)
-            for match in matches:
-                clean_match = match.strip()
-                if 3 < len(clean_match) < 50:
-                    test_titles.append(clean_match)
-        
-        # Tekrarları kaldır ve en yaygın olanları seç
-        unique_titles = list(set(test_titles))
-        
-        if unique_titles:
-            # Matematik ile ilgili başlıkları öncelikle seç
-            math_related = [title for title in unique_titles if any(keyword in title.upper() for keyword in ['MATEMAT', 'MATEMET', 'MATH'])]
-            if math_related:
-                return math_related[:3]  # En fazla 3 başlık
+        for i, page_num in enumerate(page_numbers):
+            try:
+                # Sayfayı yüksek çözünürlükte görüntüye dönüştür (fitz thread güvenli değil - seri)
+                mat = fitz.Matrix(OCR_RENDER_SCALE, OCR_RENDER_SCALE)
+                img_data = self.doc[page_num].get_pixmap(matrix=mat).tobytes("png")
+            except Exception as e:
+                print(f"    Sayfa {page_num + 1}: görüntü oluşturulamadı: {e}")
+                continue
+            
+            # Aynı görüntü daha önce OCR'dan geçtiyse önbellekten al
+            cache_key = OCRCache.make_key(img_data, OCR_RENDER_SCALE, self.ocr_backend.model, OCR_PROMPT)
+            cached_text = self.ocr_cache.get(cache_key)
+            if cached_text is not None:
+                print(f"    Sayfa {page_num + 1}: OCR sonucu önbellekten alındı")
+                texts[i] = cached_text
             else:
-                return unique_titles[:3]  # En fazla 3 başlık
-        
-        return ['GENEL']  # Varsayılan başlık
-    
-    def _extract_text_with_ocr(self, page) -> str:
-        """OCR ile sayfadan metin çıkar - Sadece Mistral AI kullanarak"""
-        try:
-            print("    Mistral AI OCR kullanılıyor...")
-            text = self._extract_with_mistral_ai(page)
-            if text:
-                print(f"    Mistral AI ile {len(text)} karakter çıkarıldı")
-                return text.strip()
-            
-            return ""
-            
-        except Exception as e:
-            print(f"    OCR hatası: {e}")
-            return ""
-    
-    def _extract_with_mistral_ai(self, page) -> str:
-        """Mistral AI ile metin çıkar"""
-        try:
-            # Sayfayı yüksek çözünürlükte görüntüye dönüştür
-            mat = fitz.Matrix(3.0, 3.0)  # 3x büyütme (Mistral AI için daha iyi)
-            pix = page.get_pixmap(matrix=mat)
-            
-            # PIL Image'a dönüştür
-            img_data = pix.tobytes("png")
-            img = Image.open(io.BytesIO(img_data))
-            
-            # Görüntüyü base64'e dönüştür
-            img_buffer = io.BytesIO()
-            img.save(img_buffer, format='PNG')
-            img_base64 = base64.b64encode(img_buffer.getvalue()).decode()
-            
-            # Mistral AI client'ı oluştur
-            api_key = BOT_CONFIG.get('MISTRAL_API_KEY') or os.getenv('MISTRAL_API_KEY')
-            if not api_key:
-                print("    ❌ Mistral AI API key bulunamadı!")
-                print("    Lütfen bot_config.py dosyasında MISTRAL_API_KEY'i ayarlayın")
-                return ""
-            
-            client = Mistral(api_key=api_key)
-            
-            # OCR prompt'u
-            prompt = """
-Bu görüntüdeki metni tam olarak okuyup çıkar. Bu bir cevap anahtarı PDF'i sayfası.
-Soru numaraları ve cevapları (A, B, C, D, E) formatında bulun.
-Örnek format: "1. A 2. B 3. C" şeklinde.
-Sadece metni çıkar, başka açıklama yapma.
-"""
-            
-            # Mistral AI'ye gönder
-            response = client.chat.complete(
-                model="pixtral-12b-2409",
-                messages=[
-                    {
-                        "role": "user",
-                        "content": [
-                            {"type": "text", "text": prompt},
-                            {
-                                "type": "image_url",
-                                "image_url": {
-                                    "url": f"data:image/png;base64,{img_base64}"
-                                }
-                            }
-                        ]
-                    }
-                ],
-                max_tokens=2000
-            )
-            
-            text = response.choices[0].message.content
-            return text.strip()
-            
-        except Exception as e:
-            print(f"    Mistral AI hatası: {e}")
-            return ""
-    
-    def _extract_answers_for_test(self, text: str, test_title: str) -> Dict[str, str]:
-        """Belirli bir test için cevapları çıkar"""
-        answers = {}
+                pending.append((i, cache_key, img_data))
         
-        try:
-            # Tüm metinde soru numarası ve cevap eşleştirmesi yap
-            pattern = r'(\d+)\.\s*([ABCDE])'
-            matches = re.findall(pattern, text)
-            
-            # Her soru numarası için sadece ilk cevabı kaydet
-            seen_questions = set()
-            for question_num, answer in matches:
-                if question_num not in seen_questions:
-                    # 1-50 arası soruları al (daha geniş aralık)
-                    if 1 <= int(question_num) <= 50:
-                        answers[question_num] = answer
-                        seen_questions.add(question_num)
-            
-            print(f"  {test_title}: {len(answers)} soru bulundu")
-            
-        except Exception as e:
-            print(f"Test {test_title} için cevap çıkarılırken hata: {e}")
+        if pending:
+            print(f"    {len(pending)} sayfa OCR'a gönderiliyor ({self.ocr_backend.model})...")
+            results = self.ocr_runner.complete_many(OCR_PROMPT, [img_data for _, _, img_data in pending])
+            
+            for (i, cache_key, _), text in zip(pending, results):
+                text = (text or "").strip()
+                # Boş sonuçlar önbelleğe yazılmaz (ör. API key eksikken)
+                if text:
+                    self.ocr_cache.put(cache_key, text, model=self.ocr_backend.model, source=os.path.basename(self.pdf_path))
+                    print(f"    Sayfa {page_numbers[i] + 1}: {len(text)} karakter çıkarıldı")
+                texts[i] = text
         
-        return answers
+        return texts
     
     def save_answers(self, output_json_path: str):
         """Cevapları JSON dosyasına kaydet"""
@@ -211,35 +147,53 @@ Sadece metni çıkar, başka açıklama yapma.
         if hasattr(self, 'doc'):
             self.doc.close()
 
-def process_answer_key_pdfs(output_dir: str = "output") -> Dict[str, str]:
-    """Output klasöründeki cevap anahtarı PDF'lerini işle"""
+def process_answer_key_pdfs(output_dir: str = "output", force: bool = False) -> Dict[str, str]:
+    """Output klasöründeki cevap anahtarı PDF'lerini işle
+    
+    JSON'u güncel olan PDF'ler atlanır: JSON yoksa, PDF içeriğinin hash'i değiştiyse veya
+    (hash kaydı yokken) PDF JSON'dan yeniyse yeniden işlenir. force=True hepsini işler.
+    """
     answer_key_files = {}
     
     try:
+        manifest = IngestionManifest(os.path.join(output_dir, ANSWER_KEY_MANIFEST_FILENAME))
+        
+        # Tüm PDF'ler tek OCR client'ını, hız sınırını ve önbelleği paylaşır
+        ocr_runner = default_ocr_runner()
+        ocr_cache = default_ocr_cache()
+        
         # Output klasöründeki tüm alt klasörleri tara
-        for root, dirs, files in os.walk(output_dir):
-            for file in files:
-                if file.endswith('.pdf') and ('cevap' in file.lower() or 'anahtar' in file.lower()):
-                    pdf_path = os.path.join(root, file)
-                    
-                    # Ana PDF adını çıkar (klasör adından)
-                    folder_name = os.path.basename(root)
-                    
-                    print(f"Cevap anahtarı bulundu: {pdf_path}")
-                    print(f"Ana PDF: {folder_name}")
-                    
-                    # Cevap anahtarını işle
-                    extractor = AnswerKeyExtractor(pdf_path)
-                    answers = extractor.extract_answers()
-                    
-                    if answers:
-                        # JSON dosyasına kaydet
-                        json_path = os.path.join(root, f"{folder_name}_answers.json")
-                        extractor.save_answers(json_path)
-                        answer_key_files[folder_name] = json_path
-                    
-                    extractor.close()
+        for folder_name, pdf_path, json_path in find_answer_key_pdfs(output_dir):
+            pdf_hash = file_sha256(pdf_path)
+            entry = manifest.get(pdf_path)
+            
+            if not force and os.path.exists(json_path):
+                if entry is not None:
+                    is_stale = entry.get('sha256') != pdf_hash
+                else:
+                    is_stale = os.path.getmtime(pdf_path) > os.path.getmtime(json_path)
+                
+                if not is_stale:
+                    manifest.set(pdf_path, {'sha256': pdf_hash, 'json_path': json_path})
+                    answer_key_files[folder_name] = json_path
+                    continue
+            
+            print(f"Cevap anahtarı bulundu: {pdf_path}")
+            print(f"Ana PDF: {folder_name}")
+            
+            # Cevap anahtarını işle
+            extractor = AnswerKeyExtractor(pdf_path, ocr_cache=ocr_cache, ocr_runner=ocr_runner)
+            answers = extractor.extract_answers()
+            
+            if answers:
+                # JSON dosyasına kaydet
+                extractor.save_answers(json_path)
+                answer_key_files[folder_name] = json_path
+                manifest.set(pdf_path, {'sha256': pdf_hash, 'json_path': json_path})
+            
+            extractor.close()
         
+        manifest.save()
         return answer_key_files
         
     except Exception as e:
@@ -247,6 +201,12 @@ def process_answer_key_pdfs(output_dir: str = "output") -> Dict[str, str]:
         return {}
 
 if __name__ == "__main__":
-    # Test
-    answer_key_files = process_answer_key_pdfs()
+    import sys
+    
+    # Çevrimdışı adım: sadece değişen cevap anahtarlarını işler (--force: hepsini)
+    answer_key_files = process_answer_key_pdfs(force='--force' in sys.argv)
     print(f"İşlenen cevap anahtarı dosyaları: {answer_key_files}")
+    
+    # Katalogdaki cevapları güncelle
+    from question_catalog import write_catalog
+    write_catalog()
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Cevap anahtarı dosyaları modülü
+Önceden üretilmiş *_answers.json dosyalarını bulur ve yükler (PDF işlemez, fitz gerektirmez)
+"""
+
+import json
+import os
+from typing import Dict, List, Optional, Tuple
+
+ANSWER_KEY_MANIFEST_FILENAME = "answer_keys_manifest.json"
+
+def is_answer_key_pdf(filename: str) -> bool:
+    """Dosya adı cevap anahtarı PDF'ine mi ait"""
+    lower_name = filename.lower()
+    return lower_name.endswith('.pdf') and ('cevap' in lower_name or 'anahtar' in lower_name)
+
+def answer_json_path(folder_path: str) -> str:
+    """Klasör için cevap JSON dosyasının yolunu döndür"""
+    folder_name = os.path.basename(folder_path)
+    return os.path.join(folder_path, f"{folder_name}_answers.json")
+
+def find_answer_key_pdfs(output_dir: str = "output") -> List[Tuple[str, str, str]]:
+    """Output klasöründeki cevap anahtarı PDF'lerini bul - (klasör adı, PDF yolu, JSON yolu)"""
+    found = []
+    for root, dirs, files in os.walk(output_dir):
+        dirs.sort()
+        for file in sorted(files):
+            if is_answer_key_pdf(file):
+                found.append((os.path.basename(root), os.path.join(root, file), answer_json_path(root)))
+    return found
+
+def load_answer_key_json(folder_path: str) -> Optional[Dict[str, Dict[str, str]]]:
+    """Tek PDF klasörünün cevap JSON'unu yükle - yoksa veya okunamazsa None"""
+    json_path = answer_json_path(folder_path)
+    if not os.path.isfile(json_path):
+        return None
+    try:
+        with open(json_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except Exception as e:
+        print(f"Cevap anahtarı okunamadı ({json_path}): {e}")
+        return None
+
+def load_answer_key_jsons(output_dir: str = "output") -> Dict[str, Dict[str, Dict[str, str]]]:
+    """Her PDF klasöründeki önceden üretilmiş cevap JSON'unu yükle - {klasör adı: {test: {soru: cevap}}}"""
+    answers = {}
+    if not os.path.isdir(output_dir):
+        return answers
+    
+    for folder_name in sorted(os.listdir(output_dir)):
+        test_answers = load_answer_key_json(os.path.join(output_dir, folder_name))
+        if test_answers is not None:
+            answers[folder_name] = test_answers
+    return answers
+
+def find_stale_answer_keys(output_dir: str = "output") -> List[str]:
+    """JSON'u eksik veya PDF'ten eski olan cevap anahtarlarını bul (sadece dosya zamanlarına bakar)"""
+    stale = []
+    for folder_name, pdf_path, json_path in find_answer_key_pdfs(output_dir):
+        if not os.path.exists(json_path) or os.path.getmtime(pdf_path) > os.path.getmtime(json_path):
+            stale.append(pdf_path)
+    return stale
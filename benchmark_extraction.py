@@ -0,0 +1,275 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Soru çıkarma performans ölçümü
+Paketteki kitapçıklar üzerinde aşama bazında süre, sayfa/sn, soru/sn ve en yüksek bellek (RSS)
+ölçer; sonuçları JSON olarak kaydeder ve önceki bir sonuç dosyasıyla karşılaştırır.
+
+Kullanım:
+    python benchmark_extraction.py                      # dizindeki tüm PDF'ler
+    python benchmark_extraction.py 2013-ygs.pdf --repeat 3
+    python benchmark_extraction.py --compare benchmark_results.json --fail-on-regression
+"""
+
+import argparse
+import contextlib
+import glob
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+BENCHMARK_VERSION = 2  # 2: render aşaması tespiti tekrarlamaz
+DEFAULT_RESULTS_FILE = "benchmark_results.json"
+
+# Ölçülen aşamalar (rapor sırası)
+STAGES = ['section_locate', 'math_test_export', 'preprocess', 'detect', 'render']
+
+# Karşılaştırmada bu süreden kısa aşamalar gürültü sayılır (saniye)
+MIN_COMPARABLE_SECONDS = 0.05
+
+def peak_rss_mb():
+    """Sürecin en yüksek bellek kullanımı (MB)"""
+    if resource is None:
+        return None
+    
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux'ta KB, macOS'ta bayt
+    if sys.platform == 'darwin':
+        return peak / (1024 * 1024)
+    return peak / 1024
+
+def benchmark_pdf(pdf_path, render_profile_name="default", quiet=True):
+    """Tek bir PDF için aşama sürelerini ölçer - ayrı bir süreçte çalıştırılır (RSS ölçümü için)"""
+    
+    # Hat çıktısı (soru başına satır) ölçüme dahil edilmez
+    if quiet:
+        with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+            return benchmark_pdf(pdf_path, render_profile_name, quiet=False)
+    
+    from ingest_metrics import IngestMetrics
+    from question_extractor import QuestionExtractor, extract_math_test_from_pdf, render_question_image
+    from render_profiles import resolve_render_profile
+    from section_locator import MATH_SECTION, SectionIndex
+    
+    timings = {}
+    
+    # Test bölümlerini bul
+    start = time.perf_counter()
+    sections = SectionIndex.from_pdf(pdf_path)
+    timings['section_locate'] = time.perf_counter() - start
+    
+    math_section = sections.get_split(MATH_SECTION)
+    page_range = (math_section.start_page, math_section.end_page) if math_section else None
+    
+    # Matematik testini ayrı PDF olarak dışa aktarma (geçici klasöre)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        start = time.perf_counter()
+        extract_math_test_from_pdf(pdf_path, os.path.join(tmp_dir, "matematik_testi.pdf"))
+        timings['math_test_export'] = time.perf_counter() - start
+    
+    extractor = QuestionExtractor(pdf_path, page_range=page_range, render_profile=resolve_render_profile(render_profile_name),
+                                  metrics=IngestMetrics())
+    
+    # Ön işleme (talimat kutusu, sayfa bölme)
+    start = time.perf_counter()
+    extractor.preprocess_pdf()
+    timings['preprocess'] = time.perf_counter() - start
+    
+    # Soru tespiti ve kesim planlama (span indeksleme dahil, sayfa başına tek geçiş)
+    start = time.perf_counter()
+    plans = list(extractor.iter_question_plans(output_dir=None))
+    timings['detect'] = time.perf_counter() - start
+    detected = extractor.metrics.counters.get('questions_detected', 0)
+    
+    # Render + kodlama - tespit tekrarlanmadan hazır planlardan (dosya yazmadan)
+    doc = extractor.processed_doc
+    questions = 0
+    start = time.perf_counter()
+    for plan in plans:
+        page = doc.load_page(plan['page_num'])
+        render_question_image(page, plan['clip'], extractor.render_profile)
+        questions += 1
+    timings['render'] = time.perf_counter() - start
+    
+    pages = len(extractor.page_range)
+    extractor.doc.close()
+    
+    pipeline_seconds = timings['preprocess'] + timings['detect'] + timings['render']
+    return {
+        'pdf': os.path.basename(pdf_path),
+        'pages': pages,
+        'detected_questions': detected,
+        'questions': questions,
+        'timings': timings,
+        'pages_per_second': pages / pipeline_seconds if pipeline_seconds else None,
+        'questions_per_second': questions / pipeline_seconds if pipeline_seconds else None,
+        'peak_rss_mb': peak_rss_mb()
+    }
+
+def run_isolated(pdf_path, render_profile_name, quiet=True):
+    """Ölçümü yeni bir süreçte çalıştırır - en yüksek RSS her PDF için ayrı ölçülür"""
+    with ProcessPoolExecutor(max_workers=1) as executor:
+        return executor.submit(benchmark_pdf, pdf_path, render_profile_name, quiet).result()
+
+def best_of(runs):
+    """Tekrarlı ölçümlerde her aşamanın en kısa süresini alır"""
+    best = dict(runs[0])
+    best['timings'] = {stage: min(run['timings'][stage] for run in runs) for stage in runs[0]['timings']}
+    best['peak_rss_mb'] = max((run['peak_rss_mb'] or 0) for run in runs) or None
+    
+    pipeline_seconds = best['timings']['preprocess'] + best['timings']['detect'] + best['timings']['render']
+    if pipeline_seconds:
+        best['pages_per_second'] = best['pages'] / pipeline_seconds
+        best['questions_per_second'] = best['questions'] / pipeline_seconds
+    best['repeat'] = len(runs)
+    return best
+
+def git_revision():
+    """Çalışma dizininin git sürümü (yoksa None)"""
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'],
+            capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except Exception:
+        return None
+
+def environment_info():
+    """Sonuçlarla birlikte kaydedilen ortam bilgisi"""
+    try:
+        import fitz
+        pymupdf_version = fitz.VersionBind
+    except Exception:
+        pymupdf_version = None
+    
+    return {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'pymupdf': pymupdf_version,
+        'cpu_count': os.cpu_count(),
+        'git_revision': git_revision()
+    }
+
+def print_results(results):
+    """Sonuç tablosunu yazdırır"""
+    header = f"{'PDF':<45} {'sayfa':>5} {'soru':>5} " + " ".join(f"{stage:>16}" for stage in STAGES)
+    print(header)
+    print("-" * len(header))
+    for result in results:
+        stage_cells = " ".join(f"{result['timings'][stage]:>15.3f}s" for stage in STAGES)
+        print(f"{result['pdf']:<45} {result['pages']:>5} {result['questions']:>5} {stage_cells}")
+    
+    print()
+    for result in results:
+        rss = f"{result['peak_rss_mb']:.1f} MB" if result['peak_rss_mb'] is not None else "ölçülemedi"
+        pages_per_second = result['pages_per_second'] or 0
+        questions_per_second = result['questions_per_second'] or 0
+        print(f"{result['pdf']}: {pages_per_second:.2f} sayfa/sn, {questions_per_second:.2f} soru/sn, en yüksek RSS {rss}")
+
+def compare_results(previous, current, threshold):
+    """Önceki sonuçlarla karşılaştırır - eşikten fazla yavaşlayan aşamaların listesini döndürür"""
+    
+    previous_by_pdf = {result['pdf']: result for result in previous.get('results', [])}
+    regressions = []
+    
+    print(f"\n=== KARŞILAŞTIRMA (önceki: {previous.get('environment', {}).get('git_revision')}, {previous.get('created_at')}) ===")
+    if previous.get('version') != current.get('version'):
+        print(f"Önceki sonuç dosyasının sürümü farklı ({previous.get('version')}), aşama tanımları karşılaştırılamaz")
+        return regressions
+    for result in current['results']:
+        old = previous_by_pdf.get(result['pdf'])
+        if old is None:
+            print(f"{result['pdf']}: önceki sonuç yok")
+            continue
+        
+        for stage in STAGES:
+            old_seconds = old['timings'].get(stage)
+            new_seconds = result['timings'][stage]
+            if old_seconds is None or old_seconds < MIN_COMPARABLE_SECONDS:
+                continue
+            
+            change = (new_seconds - old_seconds) / old_seconds
+            marker = ""
+            if change > threshold:
+                marker = "  ⚠️ YAVAŞLAMA"
+                regressions.append((result['pdf'], stage, old_seconds, new_seconds))
+            print(f"{result['pdf']:<45} {stage:<16} {old_seconds:>8.3f}s -> {new_seconds:>8.3f}s ({change:+.1%}){marker}")
+        
+        if old.get('peak_rss_mb') and result.get('peak_rss_mb'):
+            print(f"{result['pdf']:<45} {'peak_rss':<16} {old['peak_rss_mb']:>7.1f}MB -> {result['peak_rss_mb']:>7.1f}MB")
+    
+    return regressions
+
+def main():
+    """Ana fonksiyon - ölç, kaydet, karşılaştır"""
+    
+    parser = argparse.ArgumentParser(description="Soru çıkarma hattının performans ölçümü")
+    parser.add_argument('pdfs', nargs='*', help="Ölçülecek PDF'ler (varsayılan: --pdf-dir altındaki tüm PDF'ler)")
+    parser.add_argument('--pdf-dir', default=".", help="PDF dosyalarının bulunduğu klasör")
+    parser.add_argument('--repeat', type=int, default=1, help="Her PDF için tekrar sayısı (en iyi süre alınır)")
+    parser.add_argument('--render-profile', default="default", help="Render profili")
+    parser.add_argument('--save', default=DEFAULT_RESULTS_FILE, help="Sonuçların kaydedileceği JSON dosyası")
+    parser.add_argument('--compare', help="Karşılaştırılacak önceki sonuç dosyası")
+    parser.add_argument('--threshold', type=float, default=0.10, help="Yavaşlama eşiği (0.10 = %%10)")
+    parser.add_argument('--verbose', action='store_true', help="Hat çıktısını da yazdır")
+    parser.add_argument('--fail-on-regression', action='store_true', help="Yavaşlama varsa sıfırdan farklı kodla çık")
+    args = parser.parse_args()
+    
+    pdf_files = args.pdfs or sorted(glob.glob(os.path.join(args.pdf_dir, "*.pdf")))
+    if not pdf_files:
+        print("Ölçülecek PDF dosyası bulunamadı!")
+        return 1
+    
+    # Karşılaştırma dosyası kaydetmeden önce okunur (aynı dosya olabilir)
+    previous = None
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            previous = json.load(f)
+    
+    results = []
+    for pdf_path in pdf_files:
+        print(f"⏱️  Ölçülüyor: {os.path.basename(pdf_path)}")
+        runs = [run_isolated(pdf_path, args.render_profile, quiet=not args.verbose) for _ in range(max(1, args.repeat))]
+        results.append(best_of(runs))
+    
+    report = {
+        'version': BENCHMARK_VERSION,
+        'created_at': datetime.now().isoformat(timespec='seconds'),
+        'render_profile': args.render_profile,
+        'repeat': max(1, args.repeat),
+        'environment': environment_info(),
+        'results': results
+    }
+    
+    print()
+    print_results(results)
+    
+    with open(args.save, 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f"\nSonuçlar kaydedildi: {args.save}")
+    
+    if previous is not None:
+        regressions = compare_results(previous, report, args.threshold)
+        if regressions:
+            print(f"\n⚠️  {len(regressions)} aşamada %{args.threshold * 100:.0f} üzeri yavaşlama")
+            if args.fail_on_regression:
+                return 1
+        else:
+            print("\n✅ Yavaşlama yok")
+    
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
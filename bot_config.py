@@ -13,9 +13,64 @@ BOT_CONFIG = {
     # Output klasörü yolu
     'OUTPUT_DIR': 'output',
     
+    # Başlangıçta cevap anahtarı PDF'lerini (sadece değişenleri) yeniden işle
+    # False ise bot sadece hazır *_answers.json dosyalarını yükler: python answer_key_extractor.py
+    'REFRESH_ANSWER_KEYS_ON_START': False,
+    
+    # Telegram'a yüklenen soru görsellerinin file_id kayıtları (görseller sadece ilk kez yüklenir)
+    'FILE_ID_CACHE_PATH': '.cache/telegram_file_ids.json',
+    'FILE_ID_FLUSH_SECONDS': 5.0,  # Yeni file_id'ler arka planda bu aralıkla toplu yazılır
+    
+    # Güncelleme işleme: aynı anda işlenecek en fazla güncelleme (aynı sohbet her zaman sıralı)
+    'MAX_CONCURRENT_UPDATES': 64,
+    
+    # Webhook modu - WEBHOOK_URL ayarlanırsa polling yerine yerel HTTP sunucusu kullanılır
+    'WEBHOOK_URL': None,  # Örnek: 'https://bot.example.com'
+    'WEBHOOK_LISTEN': '127.0.0.1',
+    'WEBHOOK_PORT': 8443,
+    'WEBHOOK_PATH': 'telegram',
+    'WEBHOOK_SECRET_TOKEN': None,
+    
+    # Telegram API adresi (yerel sahte uç nokta ile test için, None: api.telegram.org)
+    'TELEGRAM_API_BASE_URL': None,  # Örnek: 'http://127.0.0.1:8081/bot'
+    'TELEGRAM_API_BASE_FILE_URL': None,
+    
+    # Soru paketi (output/questions.pack) varsa görseller oradan mmap ile okunur
+    'USE_QUESTION_PACK': True,
+    
+    # Soru görsellerinin bellekte tutulacağı en fazla boyut (MB)
+    'IMAGE_CACHE_MAX_MB': 64,
+    
+    # Yerel metrik uç noktası (Prometheus metin formatı, http://METRICS_LISTEN:METRICS_PORT/metrics)
+    'METRICS_LISTEN': '127.0.0.1',
+    'METRICS_PORT': 9464,  # None: kapalı
+    
+    # Klasör istatistiklerinin arka planda yenilenme aralığı (saniye)
+    'STATS_REFRESH_SECONDS': 300,
+    
+    # Output klasörünün yeni/değişen kitapçıklar için taranma aralığı (saniye, None: kapalı)
+    # Değişen klasörlerden yeni katalog arka planda üretilir ve yeniden başlatmadan devreye alınır
+    'CATALOG_RELOAD_SECONDS': 30,
+    
+    # OCR önbelleği (aynı sayfa görüntüsü için OCR tekrar çağrılmaz)
+    'OCR_CACHE_DIR': '.cache/ocr',
+    'OCR_CACHE_MAX_MB': 100,  # Önbellek boyut sınırı - aşılınca en eski girdiler silinir
+    
+    # OCR istekleri: sayfalar birlikte gönderilir
+    'OCR_MAX_WORKERS': 4,  # Aynı anda en fazla istek
+    'OCR_RATE_PER_SECOND': 1.0,  # Hız sınırı (0: sınırsız)
+    'OCR_BURST': 1,  # Birikebilecek en fazla istek hakkı
+    'OCR_MAX_RETRIES': 3,  # 429/5xx/bağlantı hatalarında tekrar (üstel bekleme)
+    
     # Bot ayarları
-    'MAX_QUESTIONS_PER_DAY': 50,  # Kullanıcı başına günlük maksimum soru
-    'ADMIN_USER_IDS': [],  # Admin kullanıcı ID'leri
+    'MAX_QUESTIONS_PER_DAY': 50,  # Kullanıcı başına günlük (son 24 saat) maksimum soru (None: sınırsız)
+    'ADMIN_USER_IDS': [],  # Admin kullanıcı ID'leri (kotadan muaf)
+    
+    # Kullanıcı durumu (son soru, soru sırası, kota) - SQLite WAL, değişiklikler arka planda toplu yazılır
+    'USER_STATE_DB_PATH': '.cache/user_state.sqlite3',
+    'USER_STATE_FLUSH_SECONDS': 2.0,  # Toplu yazma aralığı
+    'USER_STATE_TTL_SECONDS': 3600,  # Bu süre etkileşimsiz kullanıcılar bellekten çıkarılır
+    'USER_STATE_MAX_CACHED': 10000,  # Bellekteki en fazla kullanıcı
     
     # Mesaj ayarları
     'WELCOME_MESSAGE': """
@@ -0,0 +1,246 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Bot ölçüm modülü
+Handler gecikme histogramları, işlem sayaçları ve önbellek isabet oranları;
+yerel bir HTTP uç noktasından Prometheus metin formatında sunulur.
+"""
+
+import asyncio
+import contextvars
+import functools
+import time
+from bisect import bisect_left
+from typing import Callable, Dict, List, Optional, Tuple
+
+# Prometheus istemcilerinin varsayılan gecikme kovaları (saniye)
+LATENCY_BUCKETS = [0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0]
+
+# Metrik açıklamaları (# HELP satırları)
+METRIC_HELP = {
+    'bot_handler_duration_seconds': "Handler çalışma süresi",
+    'bot_handler_in_flight': "Şu anda çalışan handler sayısı",
+    'bot_handler_errors_total': "Handler hataları",
+    'bot_questions_sent_total': "Gönderilen sorular",
+    'bot_answers_shown_total': "Gösterilen cevaplar",
+    'bot_photo_sends_total': "Soru görseli gönderimleri (file_id veya yükleme)",
+    'bot_cache_hits_total': "Önbellek isabetleri",
+    'bot_cache_misses_total': "Önbellek ıskaları",
+    'bot_cache_hit_ratio': "Önbellek isabet oranı",
+    'bot_quota_rejections_total': "Günlük kota nedeniyle reddedilen soru istekleri",
+    'bot_user_state_cached': "Bellekte tutulan kullanıcı durumu sayısı",
+    'bot_catalog_reloads_total': "Devreye alınan yeni katalog nesilleri",
+}
+
+# Şu anda ölçülen handler (her güncelleme kendi görevinde, yani kendi bağlamında çalışır)
+_current_handler = contextvars.ContextVar('current_handler', default=None)
+
+# Toplayıcıların döndürdüğü örnek: (tür, ad, etiketler, değer)
+Sample = Tuple[str, str, Dict[str, str], float]
+
+def _label_key(labels: Dict) -> Tuple:
+    return tuple(sorted((key, str(value)) for key, value in labels.items()))
+
+def _format_labels(label_key: Tuple, extra: Optional[Tuple] = None) -> str:
+    items = list(label_key) + list(extra or ())
+    if not items:
+        return ""
+    # Etiket değerlerindeki ters bölü, tırnak ve satır sonu kaçırılır
+    escaped = (
+        key + '="' + value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n') + '"'
+        for key, value in items
+    )
+    return "{" + ",".join(escaped) + "}"
+
+def _format_value(value: float) -> str:
+    if value == float('inf'):
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+class Histogram:
+    """Sabit kovalı gecikme histogramı"""
+    
+    def __init__(self, buckets: List[float] = LATENCY_BUCKETS):
+        self.buckets = list(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)  # Son kova: +Inf
+        self.sum = 0.0
+        self.count = 0
+    
+    def observe(self, value: float):
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+    
+    def cumulative(self) -> List[Tuple[str, int]]:
+        """(le, birikimli sayı) - Prometheus kova satırları için"""
+        total = 0
+        result = []
+        for bound, count in zip(self.buckets + [float('inf')], self.counts):
+            total += count
+            result.append((_format_value(bound), total))
+        return result
+
+class BotMetrics:
+    def __init__(self, buckets: List[float] = LATENCY_BUCKETS):
+        """Bot metrik kayıt defteri - tüm erişimler event loop üzerinden yapılır (kilit gerekmez)"""
+        self.buckets = list(buckets)
+        self.counters: Dict[Tuple[str, Tuple], float] = {}
+        self.gauges: Dict[Tuple[str, Tuple], float] = {}
+        self.histograms: Dict[Tuple[str, Tuple], Histogram] = {}
+        self.collectors: List[Callable[[], List[Sample]]] = []
+    
+    def inc(self, name: str, value: float = 1, **labels):
+        """Sayacı arttır"""
+        key = (name, _label_key(labels))
+        self.counters[key] = self.counters.get(key, 0) + value
+    
+    def add_gauge(self, name: str, delta: float, **labels):
+        """Göstergeyi delta kadar değiştir"""
+        key = (name, _label_key(labels))
+        self.gauges[key] = self.gauges.get(key, 0) + delta
+    
+    def observe(self, name: str, value: float, **labels):
+        """Histograma ölçüm ekle"""
+        key = (name, _label_key(labels))
+        histogram = self.histograms.get(key)
+        if histogram is None:
+            histogram = Histogram(self.buckets)
+            self.histograms[key] = histogram
+        histogram.observe(value)
+    
+    def add_collector(self, collector: Callable[[], List[Sample]]):
+        """Her sunumda çağrılan toplayıcı ekle (örn. önbellek sayaçlarını okumak için)"""
+        self.collectors.append(collector)
+    
+    def track(self, handler: str):
+        """Async handler dekoratörü - süre, eşzamanlı çalışma ve yakalanmamış hataları ölçer
+        
+        Ölçülen bir handler başka bir ölçülen handler'ı çağırırsa (örn. buton -> soru gönder)
+        sadece dıştaki handler ölçülür; her güncelleme bir kez sayılır.
+        """
+        
+        def decorator(func):
+            @functools.wraps(func)
+            async def wrapper(*args, **kwargs):
+                if _current_handler.get() is not None:
+                    return await func(*args, **kwargs)
+                
+                token = _current_handler.set(handler)
+                self.add_gauge('bot_handler_in_flight', 1, handler=handler)
+                start = time.perf_counter()
+                try:
+                    return await func(*args, **kwargs)
+                except Exception:
+                    self.inc('bot_handler_errors_total', handler=handler)
+                    raise
+                finally:
+                    self.observe('bot_handler_duration_seconds', time.perf_counter() - start, handler=handler)
+                    self.add_gauge('bot_handler_in_flight', -1, handler=handler)
+                    _current_handler.reset(token)
+            return wrapper
+        
+        return decorator
+    
+    def render(self) -> str:
+        """Tüm metrikleri Prometheus metin formatında döndürür"""
+        
+        # ad -> (tür, [(etiketler, değer)])
+        families: Dict[str, Tuple[str, List]] = {}
+        
+        def add(kind, name, label_key, value):
+            families.setdefault(name, (kind, []))[1].append((label_key, value))
+        
+        for (name, label_key), value in self.counters.items():
+            add('counter', name, label_key, value)
+        for (name, label_key), value in self.gauges.items():
+            add('gauge', name, label_key, value)
+        for collector in self.collectors:
+            for kind, name, labels, value in collector():
+                add(kind, name, _label_key(labels), value)
+        for (name, label_key), histogram in self.histograms.items():
+            add('histogram', name, label_key, histogram)
+        
+        lines = []
+        for name in sorted(families):
+            kind, samples = families[name]
+            if name in METRIC_HELP:
+                lines.append(f"# HELP {name} {METRIC_HELP[name]}")
+            lines.append(f"# TYPE {name} {kind}")
+            for label_key, value in sorted(samples, key=lambda sample: sample[0]):
+                if kind == 'histogram':
+                    for le, count in value.cumulative():
+                        lines.append(f"{name}_bucket{_format_labels(label_key, (('le', le),))} {count}")
+                    lines.append(f"{name}_sum{_format_labels(label_key)} {_format_value(value.sum)}")
+                    lines.append(f"{name}_count{_format_labels(label_key)} {value.count}")
+                else:
+                    lines.append(f"{name}{_format_labels(label_key)} {_format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+def cache_samples(cache_name: str, hits: int, misses: int) -> List[Sample]:
+    """Önbellek isabet/ıska sayaçlarından örnekler (oran dahil)"""
+    total = hits + misses
+    return [
+        ('counter', 'bot_cache_hits_total', {'cache': cache_name}, hits),
+        ('counter', 'bot_cache_misses_total', {'cache': cache_name}, misses),
+        ('gauge', 'bot_cache_hit_ratio', {'cache': cache_name}, hits / total if total else 0.0),
+    ]
+
+class MetricsServer:
+    def __init__(self, metrics: BotMetrics, host: str = "127.0.0.1", port: int = 9464, path: str = "/metrics"):
+        """Metrikleri sunan küçük HTTP sunucusu - bot ile aynı event loop'ta çalışır"""
+        self.metrics = metrics
+        self.host = host
+        self.port = port
+        self.path = path
+        self._server = None
+    
+    async def start(self):
+        self._server = await asyncio.start_server(self._handle, self.host, self.port)
+    
+    async def stop(self):
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+    
+    async def _handle(self, reader, writer):
+        """Tek bir HTTP isteğini yanıtla (sadece GET/HEAD)"""
+        try:
+            request_line = await asyncio.wait_for(reader.readline(), timeout=5)
+            # Başlıkları atla
+            while True:
+                line = await asyncio.wait_for(reader.readline(), timeout=5)
+                if line in (b'\r\n', b'\n', b''):
+                    break
+            
+            parts = request_line.decode('latin-1').split()
+            method = parts[0] if parts else ""
+            target = parts[1].split('?', 1)[0] if len(parts) > 1 else ""
+            
+            if method in ('GET', 'HEAD') and target == self.path:
+                status = "200 OK"
+                content_type = "text/plain; version=0.0.4; charset=utf-8"
+                body = self.metrics.render().encode('utf-8')
+            else:
+                status = "404 Not Found"
+                content_type = "text/plain; charset=utf-8"
+                body = b"not found\n"
+            
+            headers = (
+                f"HTTP/1.1 {status}\r\n"
+                f"Content-Type: {content_type}\r\n"
+                f"Content-Length: {len(body)}\r\n"
+                "Connection: close\r\n\r\n"
+            ).encode('latin-1')
+            writer.write(headers if method == 'HEAD' else headers + body)
+            await writer.drain()
+        except (asyncio.TimeoutError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+# Bot genelinde kullanılan kayıt defteri
+METRICS = BotMetrics()
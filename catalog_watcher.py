@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Katalog izleme modülü
+Output klasörünü periyodik olarak tarar ve değişiklik varsa yeni bir katalog nesli (katalog +
+cevap anahtarları) üretir. Soru id'lerinin tek kaynağı ingestion'ın yazdığı catalog.json'dur:
+katalog dosyası değişince aynen yeniden yüklenir, izleyici kendisi id vermez. Klasör değişiklikleri
+sadece önbellekleri geçersiz kılar, cevapları yeniler ve silinen görsellerin id'lerini boşaltır.
+Tarama ve yükleme disk erişimi yapar; event loop dışında çağrılmalıdır.
+"""
+
+import os
+from collections import namedtuple
+from typing import Dict, Optional, Tuple
+
+from answer_keys import answer_json_path, load_answer_key_json
+from question_catalog import CATALOG_FILENAME, QUESTION_FILENAME_RE, QuestionCatalog, list_question_folders
+from question_pack import PACK_FILENAME
+
+# Dosya durumu: (mtime_ns, boyut)
+FileStat = Tuple[int, int]
+
+# Katalog nesli - bot bu üçlüyü tek adımda değiştirir
+CatalogGeneration = namedtuple('CatalogGeneration', ['number', 'catalog', 'answers'])
+
+# Değişiklik: yeni nesil, değişen/silinen klasörler, içeriği değişen veya silinen dosya yolları,
+# soru paketi dosyası değişti mi
+CatalogUpdate = namedtuple('CatalogUpdate', ['generation', 'folders', 'changed_paths', 'pack_changed'])
+
+def file_stat(path: str) -> Optional[FileStat]:
+    """Dosyanın (mtime_ns, boyut) çifti - yoksa None"""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+def scan_folder(output_dir: str, folder_name: str) -> Dict[str, FileStat]:
+    """Klasördeki soru görsellerinin ve cevap JSON'unun durumları - yol -> (mtime_ns, boyut)"""
+    stats = {}
+    folder_path = os.path.join(output_dir, folder_name)
+    
+    for root, dirs, files in os.walk(folder_path):
+        for file in files:
+            if not QUESTION_FILENAME_RE.match(file):
+                continue
+            path = os.path.join(root, file)
+            stat = file_stat(path)
+            if stat is not None:
+                stats[path] = stat
+    
+    json_path = answer_json_path(folder_path)
+    stat = file_stat(json_path)
+    if stat is not None:
+        stats[json_path] = stat
+    return stats
+
+class CatalogWatcher:
+    def __init__(self, output_dir: str, catalog: QuestionCatalog, answers: Dict):
+        """Bot'un yüklediği katalog ve cevaplarla başlar - başlangıç taraması disk erişimi yapar"""
+        self.output_dir = output_dir
+        self.pack_path = os.path.join(output_dir, PACK_FILENAME)
+        self.catalog_path = os.path.join(output_dir, CATALOG_FILENAME)
+        self.generation = CatalogGeneration(0, catalog, answers)
+        
+        # Nesle yansıtılmış durum ve bir önceki tarama (yazımı süren klasörleri ayırt etmek için)
+        self._applied = self.scan()
+        self._last_scan = dict(self._applied)
+        self._pack_stat = file_stat(self.pack_path)
+        self._last_pack_stat = self._pack_stat
+        self._catalog_stat = file_stat(self.catalog_path)
+        self._last_catalog_stat = self._catalog_stat
+    
+    def scan(self) -> Dict[str, Dict[str, FileStat]]:
+        """Tüm PDF klasörlerinin dosya durumları"""
+        return {folder: scan_folder(self.output_dir, folder) for folder in list_question_folders(self.output_dir)}
+    
+    def poll(self) -> Optional[CatalogUpdate]:
+        """Output klasörünü tara - değişiklik varsa yeni nesil üretir, yoksa None
+        
+        Yazımı süren değişiklikler beklenir: bir klasör veya dosya ancak art arda iki taramada
+        aynı görünüyorsa alınır.
+        """
+        
+        scan = self.scan()
+        last_scan, self._last_scan = self._last_scan, scan
+        pack_stat = file_stat(self.pack_path)
+        last_pack_stat, self._last_pack_stat = self._last_pack_stat, pack_stat
+        catalog_stat = file_stat(self.catalog_path)
+        last_catalog_stat, self._last_catalog_stat = self._last_catalog_stat, catalog_stat
+        
+        folders = sorted(
+            folder for folder in set(scan) | set(self._applied)
+            if scan.get(folder) != self._applied.get(folder) and scan.get(folder) == last_scan.get(folder)
+        )
+        pack_changed = pack_stat != self._pack_stat and pack_stat == last_pack_stat
+        catalog_changed = (
+            catalog_stat is not None and catalog_stat != self._catalog_stat and catalog_stat == last_catalog_stat
+        )
+        if not folders and not pack_changed and not catalog_changed:
+            return None
+        
+        if pack_changed:
+            self._pack_stat = pack_stat
+        
+        catalog = self.generation.catalog
+        if catalog_changed:
+            # Id'ler ingestion'ın yazdığı dosyadan gelir - bot yeniden başlasa da aynı id'leri görür
+            try:
+                catalog = QuestionCatalog.load(self.catalog_path)
+                self._catalog_stat = catalog_stat
+            except (OSError, ValueError) as e:
+                print(f"Katalog yeniden yüklenemedi, sonraki taramada denenecek: {e}")
+                catalog_changed = False
+        
+        changed_paths = []
+        answers = self.generation.answers
+        if folders:
+            answers = dict(answers)
+            for folder in folders:
+                old_stats = self._applied.get(folder, {})
+                new_stats = scan.get(folder)
+                
+                # Klasör silindi
+                if new_stats is None:
+                    changed_paths.extend(old_stats)
+                    answers.pop(folder, None)
+                    del self._applied[folder]
+                    continue
+                
+                changed_paths.extend(path for path, stat in old_stats.items() if new_stats.get(path) != stat)
+                test_answers = load_answer_key_json(os.path.join(self.output_dir, folder))
+                if test_answers is None:
+                    answers.pop(folder, None)
+                else:
+                    answers[folder] = test_answers
+                self._applied[folder] = new_stats
+            
+            # Katalog dosyası henüz yeniden yazılmadıysa silinen görsellerin id'leri boş kalır;
+            # yeni görseller id'lerini ingestion catalog.json'u yazdığında alır
+            missing = {path for path in changed_paths if not os.path.exists(path)}
+            if missing:
+                catalog = QuestionCatalog([
+                    None if row is None or row[5] in missing else row
+                    for row in catalog.rows()
+                ])
+        
+        if not folders and not pack_changed and not catalog_changed:
+            return None
+        if folders or catalog_changed:
+            self.generation = CatalogGeneration(self.generation.number + 1, catalog, answers)
+        
+        return CatalogUpdate(self.generation, folders, changed_paths, pack_changed)
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Telegram file_id önbelleği modülü
+Bir soru görseli Telegram'a bir kez yüklendikten sonra dönen file_id ile tekrar gönderilir.
+Handler'lar sadece bellekteki kaydı günceller; değişiklikler arka plan thread'inde toplu yazılır.
+"""
+
+import json
+import os
+import threading
+from typing import Dict, Optional
+
+class FileIdCache:
+    def __init__(self, path: str, bot_id: str = "", flush_interval: float = 5.0):
+        """Önbellek dosyasını yükle - file_id'ler bot'a özel olduğundan farklı bot'un kayıtları yok sayılır
+        
+        start() ile arka plan yazıcısı başlatılır; değişiklikler en geç flush_interval saniyede yazılır.
+        """
+        self.path = path
+        self.bot_id = bot_id
+        self.flush_interval = flush_interval
+        self.file_ids = {}
+        self.hits = 0
+        self.misses = 0
+        self._dirty = False
+        self._lock = threading.Lock()  # file_ids ve _dirty
+        self._write_lock = threading.Lock()  # Anlık görüntü + yazma sırası
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread = None
+        self.load()
+    
+    @staticmethod
+    def make_key(image_path: str, width: int = 0, height: int = 0) -> str:
+        """Görsel yolu ve boyutundan anahtar üret (yeniden render edilen görsel yeni anahtar alır)"""
+        return f"{image_path}|{width}x{height}"
+    
+    def load(self):
+        """Kayıtlı file_id'leri diskten oku"""
+        if not os.path.exists(self.path):
+            return
+        
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('bot_id') == self.bot_id:
+                self.file_ids = data.get('file_ids', {})
+        except Exception as e:
+            print(f"file_id önbelleği okunamadı: {e}")
+            self.file_ids = {}
+    
+    def get(self, key: str) -> Optional[str]:
+        """Kayıtlı file_id'yi döndür"""
+        file_id = self.file_ids.get(key)
+        if file_id is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return file_id
+    
+    def set(self, key: str, file_id: str):
+        """Yeni file_id kaydet - diske arka planda yazılır"""
+        with self._lock:
+            self.file_ids[key] = file_id
+            self._dirty = True
+    
+    def discard(self, key: str):
+        """Telegram'ın reddettiği veya görseli değişen file_id'yi sil - diske arka planda yazılır"""
+        with self._lock:
+            if self.file_ids.pop(key, None) is not None:
+                self._dirty = True
+    
+    def snapshot(self) -> Dict[str, str]:
+        """Diske yazmak için anlık kopya al"""
+        with self._lock:
+            return dict(self.file_ids)
+    
+    @property
+    def dirty(self) -> bool:
+        """Yazılmayı bekleyen değişiklik var mı"""
+        return self._dirty
+    
+    def flush(self) -> bool:
+        """Değişiklik varsa önbelleği atomik olarak diske yaz - yazıldıysa True
+        
+        Anlık görüntü yazma kilidi altında alınır; yazmalar sırayla yapıldığından eski bir
+        anlık görüntü yenisinin üzerine yazılamaz.
+        """
+        with self._write_lock:
+            with self._lock:
+                if not self._dirty:
+                    return False
+                file_ids = dict(self.file_ids)
+                self._dirty = False
+            
+            try:
+                directory = os.path.dirname(self.path)
+                if directory:
+                    os.makedirs(directory, exist_ok=True)
+                
+                tmp_path = f"{self.path}.tmp"
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    json.dump({'bot_id': self.bot_id, 'file_ids': file_ids}, f, ensure_ascii=False)
+                os.replace(tmp_path, self.path)
+            except OSError as e:
+                print(f"file_id önbelleği yazılamadı, tekrar denenecek: {e}")
+                with self._lock:
+                    self._dirty = True
+                return False
+        return True
+    
+    def start(self):
+        """Arka plan yazıcı thread'ini başlat"""
+        if self._thread is None:
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="file-id-writer", daemon=True)
+            self._thread.start()
+    
+    def close(self):
+        """Yazıcıyı durdur ve bekleyen değişiklikleri yaz"""
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        self.flush()
+    
+    def _run(self):
+        """Periyodik toplu yazma"""
+        while not self._stop.is_set():
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            self.flush()
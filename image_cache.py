@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Görsel bayt önbelleği modülü
+Soru görsellerini boyut sınırlı LRU önbellekte tutar; diskten okuma event loop dışında yapılır
+"""
+
+import asyncio
+from collections import OrderedDict
+from typing import Optional
+
+def read_file_bytes(path: str) -> bytes:
+    """Dosyayı bayt olarak oku"""
+    with open(path, 'rb') as f:
+        return f.read()
+
+class ImageBytesCache:
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024):
+        """Toplam boyutu max_bytes ile sınırlı LRU önbellek"""
+        self.max_bytes = max_bytes
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._items = OrderedDict()
+    
+    def get_cached(self, key: str) -> Optional[bytes]:
+        """Önbellekteki baytları döndür (disk erişimi yok)"""
+        data = self._items.get(key)
+        if data is not None:
+            self._items.move_to_end(key)
+        return data
+    
+    def put(self, key: str, data: bytes):
+        """Baytları önbelleğe ekle ve sınır aşıldıysa en eski girdileri çıkar"""
+        if len(data) > self.max_bytes:
+            return
+        
+        old = self._items.pop(key, None)
+        if old is not None:
+            self.total_bytes -= len(old)
+        
+        self._items[key] = data
+        self.total_bytes += len(data)
+        
+        while self.total_bytes > self.max_bytes:
+            _, evicted = self._items.popitem(last=False)
+            self.total_bytes -= len(evicted)
+    
+    def discard(self, key: str):
+        """Girdiyi önbellekten çıkar (dosya değiştiğinde)"""
+        data = self._items.pop(key, None)
+        if data is not None:
+            self.total_bytes -= len(data)
+    
+    async def get(self, path: str) -> bytes:
+        """Görsel baytlarını döndür - önbellekte yoksa thread havuzunda diskten okur"""
+        data = self.get_cached(path)
+        if data is not None:
+            self.hits += 1
+            return data
+        
+        self.misses += 1
+        data = await asyncio.to_thread(read_file_bytes, path)
+        self.put(path, data)
+        return data
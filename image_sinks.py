@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Görsel kodlama ve hedef (sink) modülü
+Render edilen soru görsellerini PNG/WebP baytlarına kodlar ve seçilen hedefe aktarır:
+dosya sistemi, bellek veya (tek dosyada) paket.
+"""
+
+import io
+import os
+from typing import Dict, Optional
+
+# Desteklenen görsel formatları -> dosya uzantısı
+IMAGE_FORMATS = {
+    'png': '.png',
+    'webp': '.webp',
+}
+DEFAULT_IMAGE_FORMAT = 'png'
+
+# compress_level verilmezse WebP kalitesi
+WEBP_DEFAULT_QUALITY = 80
+
+def image_extension(image_format: str) -> str:
+    """Görsel formatının dosya uzantısı"""
+    if image_format not in IMAGE_FORMATS:
+        raise ValueError(f"Desteklenmeyen görsel formatı: {image_format}")
+    return IMAGE_FORMATS[image_format]
+
+def encode_pixmap(pix, image_format: str = DEFAULT_IMAGE_FORMAT, compress_level: Optional[int] = None) -> bytes:
+    """Pixmap'i kodlanmış görsel baytlarına çevirir
+    
+    PNG için compress_level zlib seviyesidir (0-9), WebP için kalitedir (0-100).
+    Varsayılan PNG, pix.save() ile aynı çıktıyı üretir.
+    """
+    
+    image_extension(image_format)
+    
+    if image_format == 'png' and compress_level is None:
+        return pix.tobytes("png")
+    
+    # PIL ile kodla (sadece gerektiğinde yüklenir - bot tarafı PIL'e ihtiyaç duymaz)
+    from PIL import Image
+    
+    if pix.alpha:
+        mode = "RGBA"
+    elif pix.n == 1:
+        mode = "L"
+    else:
+        mode = "RGB"
+    return encode_image(Image.frombytes(mode, (pix.width, pix.height), pix.samples), image_format, compress_level)
+
+def encode_image(image, image_format: str = DEFAULT_IMAGE_FORMAT, compress_level: Optional[int] = None) -> bytes:
+    """PIL görselini kodlanmış baytlara çevirir (compress_level anlamı encode_pixmap ile aynı)"""
+    
+    image_extension(image_format)
+    
+    buffer = io.BytesIO()
+    if image_format == 'png':
+        if compress_level is None:
+            image.save(buffer, format='PNG')
+        else:
+            image.save(buffer, format='PNG', compress_level=compress_level)
+    else:
+        quality = WEBP_DEFAULT_QUALITY if compress_level is None else compress_level
+        image.save(buffer, format='WEBP', quality=quality, method=6)
+    return buffer.getvalue()
+
+class ImageSink:
+    """Kodlanmış görselleri alan hedef - put() kaydedilen yerin yolunu/anahtarını döndürür"""
+    
+    def put(self, filename: str, data: bytes) -> str:
+        raise NotImplementedError
+    
+    def close(self):
+        """Hedefi kapat (gerekirse)"""
+        pass
+
+class FileSystemSink(ImageSink):
+    """Görselleri klasöre ayrı dosyalar olarak yazar"""
+    
+    def __init__(self, output_dir: str):
+        self.output_dir = output_dir
+        os.makedirs(output_dir, exist_ok=True)
+    
+    def put(self, filename: str, data: bytes) -> str:
+        path = os.path.join(self.output_dir, filename)
+        with open(path, 'wb') as f:
+            f.write(data)
+        return path
+
+class MemorySink(ImageSink):
+    """Görselleri bellekte tutar - aynı makinede işleme ve sunum için dosya yazılmaz"""
+    
+    def __init__(self):
+        self.images: Dict[str, bytes] = {}
+    
+    def put(self, filename: str, data: bytes) -> str:
+        self.images[filename] = data
+        return filename
+    
+    def get(self, filename: str) -> Optional[bytes]:
+        return self.images.get(filename)
+    
+    def __len__(self):
+        return len(self.images)
@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+İşleme ölçüm modülü
+Soru çıkarma hattının aşamaları için süre ölçerleri, sayaçlar ve histogramlar.
+Süreçler arası aktarım için ölçümler sözlük anlık görüntüsü (snapshot) olarak taşınır ve birleştirilir;
+profilleyici veya metrik aktarıcılar MetricsHook ile olaylara abone olabilir.
+"""
+
+import json
+import os
+import time
+from contextlib import contextmanager
+from typing import Dict, List, Optional
+
+METRICS_FILENAME = "ingest_metrics.json"
+METRICS_VERSION = 1
+
+# Hat aşamaları (rapor sırası)
+STAGES = ['hash', 'open', 'section_detect', 'top_cut', 'split', 'detect', 'render', 'encode', 'write']
+
+# Histogram kova üst sınırları (saniye) - son kova sınırsız
+HISTOGRAM_BUCKETS = [0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0]
+
+class MetricsHook:
+    """Ölçüm olaylarını alan abone - gerekli metotları ezmek yeterli
+    
+    Seri işlemde olaylar ölçüldükleri anda gelir. Paralel işlemde süreçlerin anlık görüntüleri
+    ana süreçte PDF bittiğinde tekrar oynatılır (replay_snapshot): aşama süreleri aşama sırasıyla,
+    sayaçlar PDF başına tek toplam değerle gelir, ardından on_pdf_done çağrılır.
+    """
+    
+    def on_timing(self, pdf_name: Optional[str], stage: str, seconds: float):
+        """Bir aşama ölçümü tamamlandığında"""
+        pass
+    
+    def on_count(self, pdf_name: Optional[str], name: str, value: int):
+        """Bir sayaç arttırıldığında"""
+        pass
+    
+    def on_pdf_done(self, pdf_name: str, snapshot: Dict):
+        """Bir PDF'in tüm ölçümleri toplandığında"""
+        pass
+
+class IngestMetrics:
+    def __init__(self, pdf_name: Optional[str] = None, hooks: Optional[List[MetricsHook]] = None):
+        """Tek PDF'in (veya pdf_name None ise toplu işlemin) ölçümleri"""
+        self.pdf_name = pdf_name
+        self.hooks = list(hooks or [])
+        self.timings: Dict[str, List[float]] = {}
+        self.counters: Dict[str, int] = {}
+    
+    @contextmanager
+    def time(self, stage: str):
+        """with bloğunun süresini aşamaya ekler"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(stage, time.perf_counter() - start)
+    
+    def observe(self, stage: str, seconds: float):
+        """Aşama için bir süre ölçümü ekle"""
+        self.timings.setdefault(stage, []).append(seconds)
+        for hook in self.hooks:
+            hook.on_timing(self.pdf_name, stage, seconds)
+    
+    def count(self, name: str, value: int = 1):
+        """Sayacı arttır"""
+        self.counters[name] = self.counters.get(name, 0) + value
+        for hook in self.hooks:
+            hook.on_count(self.pdf_name, name, value)
+    
+    def snapshot(self) -> Dict:
+        """Süreçler arası aktarılabilir (pickle/JSON) anlık görüntü"""
+        return {
+            'pdf_name': self.pdf_name,
+            'timings': {stage: list(samples) for stage, samples in self.timings.items()},
+            'counters': dict(self.counters)
+        }
+    
+    def merge(self, snapshot: Dict):
+        """Başka bir süreçten gelen anlık görüntüyü ekle - abonelere tekrar bildirilmez"""
+        for stage, samples in snapshot.get('timings', {}).items():
+            self.timings.setdefault(stage, []).extend(samples)
+        for name, value in snapshot.get('counters', {}).items():
+            self.counters[name] = self.counters.get(name, 0) + value
+    
+    def summary(self) -> Dict:
+        """Aşama özetleri (histogram dahil) ve sayaçlar"""
+        return summarize_snapshot(self.snapshot())
+
+class NullMetrics(IngestMetrics):
+    """Ölçüm istenmediğinde kullanılan boş ölçer"""
+    
+    @contextmanager
+    def time(self, stage: str):
+        yield
+    
+    def observe(self, stage: str, seconds: float):
+        pass
+    
+    def count(self, name: str, value: int = 1):
+        pass
+
+NULL_METRICS = NullMetrics()
+
+def replay_snapshot(snapshot: Dict, hooks: Optional[List[MetricsHook]]):
+    """Başka süreçte toplanmış anlık görüntüyü abonelere on_timing/on_count olayları olarak bildirir"""
+    pdf_name = snapshot.get('pdf_name')
+    for hook in hooks or []:
+        for stage in sorted(snapshot.get('timings', {}), key=_stage_order):
+            for seconds in snapshot['timings'][stage]:
+                hook.on_timing(pdf_name, stage, seconds)
+        for name, value in sorted(snapshot.get('counters', {}).items()):
+            hook.on_count(pdf_name, name, value)
+
+def percentile(sorted_samples: List[float], fraction: float) -> float:
+    """Sıralı örneklerden yüzdelik (en yakın sıra yöntemi)"""
+    index = min(len(sorted_samples) - 1, max(0, int(round(fraction * (len(sorted_samples) - 1)))))
+    return sorted_samples[index]
+
+def histogram(samples: List[float], buckets: List[float] = HISTOGRAM_BUCKETS) -> Dict[str, int]:
+    """Kova üst sınırı -> örnek sayısı (birikimsiz)"""
+    counts = {f"<={bound}": 0 for bound in buckets}
+    counts['>' + str(buckets[-1])] = 0
+    for value in samples:
+        for bound in buckets:
+            if value <= bound:
+                counts[f"<={bound}"] += 1
+                break
+        else:
+            counts['>' + str(buckets[-1])] += 1
+    return counts
+
+def summarize_samples(samples: List[float]) -> Dict:
+    """Bir aşamanın süre özetini hesaplar"""
+    ordered = sorted(samples)
+    total = sum(ordered)
+    return {
+        'count': len(ordered),
+        'total': total,
+        'mean': total / len(ordered) if ordered else 0.0,
+        'min': ordered[0] if ordered else 0.0,
+        'max': ordered[-1] if ordered else 0.0,
+        'p50': percentile(ordered, 0.50) if ordered else 0.0,
+        'p95': percentile(ordered, 0.95) if ordered else 0.0,
+        'histogram': histogram(ordered)
+    }
+
+def _stage_order(stage: str):
+    """Bilinen aşamalar hat sırasıyla, diğerleri sonda alfabetik"""
+    return (STAGES.index(stage) if stage in STAGES else len(STAGES), stage)
+
+def summarize_snapshot(snapshot: Dict) -> Dict:
+    """Anlık görüntüden aşama özetleri ve sayaçları üretir"""
+    return {
+        'pdf_name': snapshot.get('pdf_name'),
+        'stages': {
+            stage: summarize_samples(snapshot['timings'][stage])
+            for stage in sorted(snapshot.get('timings', {}), key=_stage_order)
+        },
+        'counters': dict(sorted(snapshot.get('counters', {}).items()))
+    }
+
+def write_metrics_report(output_dir: str, per_pdf: Dict[str, Dict], aggregate: IngestMetrics) -> str:
+    """PDF bazında ve toplam ölçümleri makine tarafından okunabilir JSON olarak yazar"""
+    
+    path = os.path.join(output_dir, METRICS_FILENAME)
+    report = {
+        'version': METRICS_VERSION,
+        'stages': STAGES,
+        'histogram_buckets': HISTOGRAM_BUCKETS,
+        'aggregate': aggregate.summary(),
+        'pdfs': {name: summarize_snapshot(snapshot) for name, snapshot in sorted(per_pdf.items())}
+    }
+    
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, path)
+    return path
+
+def format_stage_table(summary: Dict) -> List[str]:
+    """Aşama özetini rapor satırlarına çevirir (en çok zaman alan aşama önce)"""
+    
+    stages = summary['stages']
+    overall = sum(stage['total'] for stage in stages.values()) or 1.0
+    lines = []
+    for name, stage in sorted(stages.items(), key=lambda item: -item[1]['total']):
+        lines.append(
+            f"{name:<15} {stage['total']:>9.3f} sn (%{100 * stage['total'] / overall:>5.1f})  "
+            f"n={stage['count']:<5} ort={stage['mean'] * 1000:.1f} ms  p95={stage['p95'] * 1000:.1f} ms"
+        )
+    return lines
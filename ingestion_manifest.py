@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+İşleme manifestosu modülü
+PDF içerik hash'i ve çıkarıcı ayarlarına göre değişmeyen kitapçıkları yeniden işlememek için kullanılır
+"""
+
+import hashlib
+import json
+import os
+from typing import Dict, Optional
+
+MANIFEST_FILENAME = "manifest.json"
+MANIFEST_VERSION = 1
+
+def file_sha256(path: str, chunk_size: int = 1 << 20) -> str:
+    """Dosyanın içerik hash'ini (SHA-256) hesaplar"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def settings_key(settings: Dict) -> str:
+    """Ayar sözlüğünden kararlı bir anahtar üretir"""
+    payload = json.dumps(settings, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()[:16]
+
+class IngestionManifest:
+    def __init__(self, path: str):
+        """Manifesto dosyasını yükle (yoksa boş başlar)"""
+        self.path = path
+        self.entries = {}
+        self.load()
+    
+    def load(self):
+        """Manifestoyu diskten oku"""
+        if not os.path.exists(self.path):
+            return
+        
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            
+            # Farklı sürümdeki manifestolar yok sayılır (tam yeniden işleme)
+            if data.get('version') == MANIFEST_VERSION:
+                self.entries = data.get('entries', {})
+        except Exception as e:
+            print(f"Manifesto okunamadı, yeniden oluşturulacak: {e}")
+            self.entries = {}
+    
+    def get(self, key: str) -> Optional[Dict]:
+        """Kayıtlı girdiyi döndür"""
+        return self.entries.get(key)
+    
+    def set(self, key: str, entry: Dict):
+        """Girdiyi güncelle"""
+        self.entries[key] = entry
+    
+    def remove(self, key: str):
+        """Girdiyi sil"""
+        self.entries.pop(key, None)
+    
+    def save(self):
+        """Manifestoyu atomik olarak diske yaz"""
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'version': MANIFEST_VERSION, 'entries': self.entries}, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, self.path)
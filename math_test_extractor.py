@@ -8,57 +8,33 @@ Birden fazla ders içeren PDF'lerden sadece matematik testini çıkarır
 
 import fitz  # PyMuPDF
 import os
-import re
 from typing import Tuple, Optional
+from section_locator import MATH_SECTION, SectionIndex, write_section_pdf
 
 class MathTestExtractor:
     def __init__(self, pdf_path: str):
         """PDF dosyasını yükle"""
         self.pdf_path = pdf_path
         self.doc = fitz.open(pdf_path)
+        self.sections = None
         
     def find_math_test_boundaries(self) -> Tuple[Optional[int], Optional[int]]:
-        """Matematik testinin başlangıç ve bitiş sayfalarını bulur"""
+        """Matematik testinin başlangıç ve bitiş sayfalarını bulur (bitiş hariç)"""
         
         print(f"Matematik testi sınırları aranıyor: {self.pdf_path}")
         
-        start_page = None
-        end_page = None
+        # Tüm bölüm başlangıçlarını tek geçişte indeksle
+        self.sections = SectionIndex.from_document(self.doc)
+        for section in self.sections:
+            print(f"✅ {section.name} testi: Sayfa {section.start_page + 1} - {section.end_page}")
         
-        # Matematik testi başlangıç metni
-        math_start_text = "2. Cevaplarınızı, cevap kâğıdının Temel Matematik Testi için ayrılan kısmına işaretleyiniz."
-        
-        # Fen bilimleri testi başlangıç metni (matematik testi bitişi)
-        fen_start_text = "2. Cevaplarınızı, cevap kâğıdının Fen Bilimleri Testi için ayrılan kısmına işaretleyiniz."
-        
-        # Tüm sayfaları tara
-        for page_num in range(len(self.doc)):
-            page = self.doc[page_num]
-            page_text = page.get_text()
-            
-            # Matematik testi başlangıcını bul
-            if math_start_text in page_text and start_page is None:
-                start_page = page_num
-                print(f"✅ Matematik testi başlangıcı bulundu: Sayfa {page_num + 1}")
-                print(f"   Metin: {math_start_text}")
-            
-            # Fen bilimleri testi başlangıcını bul (matematik testi bitişi)
-            if fen_start_text in page_text and end_page is None:
-                end_page = page_num
-                print(f"✅ Matematik testi bitişi bulundu: Sayfa {page_num + 1}")
-                print(f"   Metin: {fen_start_text}")
-                break  # İlk fen bilimleri testi bulunduğunda dur
-        
-        if start_page is not None and end_page is not None:
-            print(f"📊 Matematik testi: Sayfa {start_page + 1} - {end_page} (toplam {end_page - start_page} sayfa)")
-            return start_page, end_page
-        else:
+        math_section = self.sections.get_split(MATH_SECTION)
+        if math_section is None:
             print("❌ Matematik testi sınırları bulunamadı!")
-            if start_page is None:
-                print("   - Matematik testi başlangıcı bulunamadı")
-            if end_page is None:
-                print("   - Fen bilimleri testi başlangıcı bulunamadı")
             return None, None
+        
+        print(f"📊 Matematik testi: Sayfa {math_section.start_page + 1} - {math_section.end_page} (toplam {math_section.end_page - math_section.start_page} sayfa)")
+        return math_section.start_page, math_section.end_page
     
     def extract_math_test(self, output_path: str) -> bool:
         """Matematik testini ayrı PDF olarak çıkarır"""
@@ -71,19 +47,8 @@ class MathTestExtractor:
                 print("❌ Matematik testi çıkarılamadı - sınırlar bulunamadı")
                 return False
             
-            # Yeni PDF oluştur
-            math_doc = fitz.open()
-            
             # Matematik testi sayfalarını kopyala (ilk sayfa dahil, son sayfa hariç)
-            for page_num in range(start_page, end_page):
-                page = self.doc[page_num]
-                new_page = math_doc.new_page(width=page.rect.width, height=page.rect.height)
-                new_page.show_pdf_page(new_page.rect, self.doc, page_num)
-                print(f"   Sayfa {page_num + 1} kopyalandı")
-            
-            # Matematik testi PDF'ini kaydet
-            math_doc.save(output_path)
-            math_doc.close()
+            write_section_pdf(self.doc, self.sections.get_split(MATH_SECTION), output_path)
             
             print(f"✅ Matematik testi çıkarıldı: {output_path}")
             print(f"📄 Sayfa sayısı: {end_page - start_page}")
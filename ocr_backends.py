@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+OCR backend modülü
+Cevap anahtarı sayfaları için uzak (Mistral AI) ve yerel OCR backend'leri; sayfaları
+sınırlı eşzamanlılık, hız sınırı ve tekrar deneme ile birlikte işleyen çalıştırıcı
+"""
+
+import base64
+import hashlib
+import os
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Union
+
+from bot_config import BOT_CONFIG
+
+# Varsayılan OCR modeli
+MISTRAL_OCR_MODEL = "pixtral-12b-2409"
+
+# Tekrar denenebilir HTTP durum kodları (hız sınırı ve geçici sunucu hataları)
+TRANSIENT_STATUS_CODES = {408, 429, 500, 502, 503, 504}
+
+class TransientOCRError(Exception):
+    """Tekrar denendiğinde geçebilecek OCR hatası"""
+    pass
+
+def is_transient_error(error: Exception) -> bool:
+    """Hata tekrar denemeye değer mi - bağlantı/zaman aşımı veya 429/5xx"""
+    if isinstance(error, (TransientOCRError, ConnectionError, TimeoutError)):
+        return True
+    status_code = getattr(error, 'status_code', None)
+    if status_code is None:
+        status_code = getattr(getattr(error, 'response', None), 'status_code', None)
+    return status_code in TRANSIENT_STATUS_CODES
+
+class MistralOCRBackend:
+    def __init__(self, api_key: Optional[str] = None, model: str = MISTRAL_OCR_MODEL, max_tokens: int = 2000):
+        """Mistral AI OCR backend'i - client ilk kullanımda oluşturulur"""
+        self.api_key = api_key or BOT_CONFIG.get('MISTRAL_API_KEY') or os.getenv('MISTRAL_API_KEY')
+        self.model = model
+        self.max_tokens = max_tokens
+        self._client = None
+        self._client_lock = threading.Lock()
+    
+    def _get_client(self):
+        """Paylaşılan Mistral client'ını oluştur (mistralai sadece OCR gerektiğinde yüklenir)"""
+        if self._client is None:
+            with self._client_lock:
+                if self._client is None:
+                    from mistralai import Mistral
+                    self._client = Mistral(api_key=self.api_key)
+        return self._client
+    
+    def complete(self, prompt: str, image_png: bytes) -> str:
+        """PNG görüntüsünü prompt ile modele gönder ve metni döndür"""
+        if not self.api_key:
+            print("    ❌ Mistral AI API key bulunamadı!")
+            print("    Lütfen bot_config.py dosyasında MISTRAL_API_KEY'i ayarlayın")
+            return ""
+        
+        # Görüntüyü base64'e dönüştür
+        img_base64 = base64.b64encode(image_png).decode()
+        
+        # Mistral AI'ye gönder
+        response = self._get_client().chat.complete(
+            model=self.model,
+            messages=[
+                {
+                    "role": "user",
+                    "content": [
+                        {"type": "text", "text": prompt},
+                        {
+                            "type": "image_url",
+                            "image_url": {
+                                "url": f"data:image/png;base64,{img_base64}"
+                            }
+                        }
+                    ]
+                }
+            ],
+            max_tokens=self.max_tokens
+        )
+        
+        text = response.choices[0].message.content
+        return text.strip()
+
+class LocalOCRBackend:
+    def __init__(self, responses: Union[Dict[str, str], Callable[[bytes], str], None] = None, default: str = "", model: str = "local",
+                 delay: float = 0.0, transient_failures: int = 0):
+        """Ağ erişimi olmadan çalışan yerel OCR backend'i (testler ve çevrimdışı çalışma için)
+        
+        responses: görüntü SHA-256 hash'i -> metin sözlüğü veya görüntü baytlarını alan fonksiyon
+        delay: her çağrıda beklenecek süre (ağ gecikmesi benzetimi)
+        transient_failures: her görüntü için ilk bu kadar çağrı TransientOCRError verir (tekrar deneme testi)
+        """
+        self.responses = responses or {}
+        self.default = default
+        self.model = model
+        self.delay = delay
+        self.transient_failures = transient_failures
+        self.calls = 0
+        self.max_in_flight = 0
+        self._in_flight = 0
+        self._failures = {}
+        self._lock = threading.Lock()
+    
+    def complete(self, prompt: str, image_png: bytes) -> str:
+        """Kayıtlı yanıtı döndür"""
+        digest = hashlib.sha256(image_png).hexdigest()
+        with self._lock:
+            self.calls += 1
+            self._in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self._in_flight)
+            failures = self._failures.get(digest, 0)
+            if failures < self.transient_failures:
+                self._failures[digest] = failures + 1
+        
+        try:
+            if self.delay:
+                time.sleep(self.delay)
+            if failures < self.transient_failures:
+                raise TransientOCRError(f"Geçici hata ({failures + 1}/{self.transient_failures})")
+            if callable(self.responses):
+                return self.responses(image_png)
+            return self.responses.get(digest, self.default)
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+
+class TokenBucket:
+    def __init__(self, rate: float, capacity: float = 1.0, clock: Callable[[], float] = time.monotonic, sleep: Callable[[float], None] = time.sleep):
+        """Saniyede rate jeton üreten, en fazla capacity jeton biriktiren hız sınırlayıcı (thread güvenli)"""
+        self.rate = rate
+        self.capacity = max(1.0, capacity)
+        self.tokens = self.capacity
+        self.clock = clock
+        self.sleep = sleep
+        self._updated = clock()
+        self._lock = threading.Lock()
+    
+    def acquire(self):
+        """Bir jeton al - jeton yoksa üretilene kadar bekle"""
+        if not self.rate:
+            return
+        
+        while True:
+            with self._lock:
+                now = self.clock()
+                self.tokens = min(self.capacity, self.tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            self.sleep(wait)
+
+class ConcurrentOCR:
+    def __init__(self, backend, max_workers: int = 4, rate_per_second: float = 1.0, burst: float = 1.0,
+                 max_retries: int = 3, backoff_base: float = 1.0, backoff_max: float = 30.0,
+                 clock: Callable[[], float] = time.monotonic, sleep: Callable[[float], None] = time.sleep):
+        """Sayfaları tek bir paylaşılan backend üzerinden birlikte OCR'a gönderen çalıştırıcı
+        
+        max_workers: aynı anda en fazla istek sayısı
+        rate_per_second/burst: jeton kovası hız sınırı (0: sınırsız)
+        max_retries: geçici hatalarda en fazla tekrar (üstel bekleme + rastgele sapma)
+        clock/sleep: hız sınırı ve beklemeler için saat (testlerde sahte saat verilebilir)
+        """
+        self.backend = backend
+        self.model = backend.model
+        self.max_workers = max(1, max_workers)
+        self.bucket = TokenBucket(rate_per_second, burst, clock=clock, sleep=sleep)
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.sleep = sleep
+    
+    def backoff(self, attempt: int) -> float:
+        """attempt. tekrar öncesi bekleme süresi (tam sapmalı üstel bekleme)"""
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * (2 ** attempt)))
+    
+    def complete(self, prompt: str, image_png: bytes) -> str:
+        """Tek görüntüyü hız sınırına uyarak OCR'a gönder - geçici hatalarda tekrar dener"""
+        attempt = 0
+        while True:
+            self.bucket.acquire()
+            try:
+                return self.backend.complete(prompt, image_png)
+            except Exception as e:
+                if attempt >= self.max_retries or not is_transient_error(e):
+                    raise
+                delay = self.backoff(attempt)
+                attempt += 1
+                print(f"    OCR geçici hata, {delay:.1f} sn sonra tekrar deneniyor ({attempt}/{self.max_retries}): {e}")
+                self.sleep(delay)
+    
+    def complete_many(self, prompt: str, images: List[bytes]) -> List[str]:
+        """Görüntüleri birlikte gönderir; sonuçlar girdi sırasıyla döner (hata veren görüntü için "")"""
+        if not images:
+            return []
+        
+        def run(image_png):
+            try:
+                return self.complete(prompt, image_png)
+            except Exception as e:
+                print(f"    OCR hatası: {e}")
+                return ""
+        
+        if self.max_workers == 1 or len(images) == 1:
+            return [run(image_png) for image_png in images]
+        
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(images))) as executor:
+            # map girdi sırasını korur
+            return list(executor.map(run, images))
+
+def default_ocr_runner(backend=None) -> ConcurrentOCR:
+    """Konfigürasyondaki eşzamanlılık, hız sınırı ve tekrar ayarlarıyla çalıştırıcı oluştur"""
+    return ConcurrentOCR(
+        backend or MistralOCRBackend(),
+        max_workers=BOT_CONFIG.get('OCR_MAX_WORKERS', 4),
+        rate_per_second=BOT_CONFIG.get('OCR_RATE_PER_SECOND', 1.0),
+        burst=BOT_CONFIG.get('OCR_BURST', 1),
+        max_retries=BOT_CONFIG.get('OCR_MAX_RETRIES', 3)
+    )
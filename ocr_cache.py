@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+OCR sonuç önbelleği modülü
+Aynı sayfa görüntüsü için OCR'ın tekrar tekrar çalıştırılmasını önler
+"""
+
+import hashlib
+import json
+import os
+from collections import OrderedDict
+from typing import Optional
+
+class OCRCache:
+    def __init__(self, cache_dir: str, max_bytes: int = 100 * 1024 * 1024):
+        """Önbellek klasörünü ve boyut sınırını ayarla"""
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        # Dosya yolu -> boyut (en eski kullanılan başta) - ilk yazmada klasör bir kez taranır
+        self._entries: Optional[OrderedDict] = None
+        self.total_bytes = 0
+    
+    def _load_index(self):
+        """Mevcut önbellek dosyalarını son kullanım zamanına göre indeksle (bir kez)"""
+        if self._entries is not None:
+            return
+        
+        found = []
+        for root, dirs, files in os.walk(self.cache_dir):
+            for file in files:
+                if not file.endswith('.json'):
+                    continue
+                path = os.path.join(root, file)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                found.append((stat.st_mtime, path, stat.st_size))
+        
+        found.sort()
+        self._entries = OrderedDict((path, size) for _, path, size in found)
+        self.total_bytes = sum(self._entries.values())
+    
+    @staticmethod
+    def make_key(image_bytes: bytes, scale: float, model: str, prompt: str) -> str:
+        """Görüntü hash'i, render ölçeği, model ve prompt'tan önbellek anahtarı üretir"""
+        digest = hashlib.sha256()
+        digest.update(hashlib.sha256(image_bytes).digest())
+        digest.update(f"|{scale}|{model}|".encode('utf-8'))
+        digest.update(prompt.encode('utf-8'))
+        return digest.hexdigest()
+    
+    def _path(self, key: str) -> str:
+        """Anahtarın dosya yolunu döndür (ilk iki karakter alt klasör)"""
+        return os.path.join(self.cache_dir, key[:2], f"{key}.json")
+    
+    def get(self, key: str) -> Optional[str]:
+        """Önbellekteki OCR metnini döndür - yoksa None"""
+        path = self._path(key)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                text = json.load(f)['text']
+        except (OSError, ValueError, KeyError):
+            self.misses += 1
+            return None
+        
+        # LRU tahliyesi için son kullanım zamanını güncelle (sonraki çalıştırmalar için dosyada da)
+        try:
+            os.utime(path, None)
+        except OSError:
+            pass
+        if self._entries is not None and path in self._entries:
+            self._entries.move_to_end(path)
+        
+        self.hits += 1
+        return text
+    
+    def put(self, key: str, text: str, **meta):
+        """OCR metnini önbelleğe yaz ve gerekirse eski girdileri tahliye et"""
+        self._load_index()
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        
+        data = json.dumps({'text': text, **meta}, ensure_ascii=False).encode('utf-8')
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+        
+        # Toplam boyut klasör taranmadan güncellenir
+        self.total_bytes += len(data) - self._entries.pop(path, 0)
+        self._entries[path] = len(data)
+        
+        self.evict()
+    
+    def evict(self):
+        """Toplam boyut sınırı aşıldıysa en uzun süre kullanılmayan girdileri sil"""
+        self._load_index()
+        
+        # En eski kullanılandan başlayarak sil
+        while self.total_bytes > self.max_bytes and self._entries:
+            path, size = self._entries.popitem(last=False)
+            self.total_bytes -= size
+            try:
+                os.remove(path)
+            except OSError:
+                pass
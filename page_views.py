@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Sanal sayfa modülü
+Kaynak PDF'i kopyalamadan (sayfa, kesim alanı, taraf) görünümleri üzerinden çalışır.
+Tespit ve render doğrudan kaynak sayfada kesim ofsetleriyle yapılır; ara PDF yazılmaz.
+"""
+
+import os
+import fitz  # PyMuPDF
+from typing import List, Tuple
+
+def _shift_bbox(bbox, dx, dy):
+    """bbox'ı (dx, dy) kadar kaydırır"""
+    x0, y0, x1, y1 = bbox
+    return (x0 - dx, y0 - dy, x1 - dx, y1 - dy)
+
+class VirtualPage:
+    """Kaynak sayfanın bir kesim alanı - koordinatlar kesim alanının sol üst köşesine göredir"""
+    
+    def __init__(self, parent, number, source_page, clip, side):
+        self.parent = parent
+        self.number = number
+        self.source_page = source_page
+        self.clip = fitz.Rect(clip)
+        self.side = side
+        self.rect = fitz.Rect(0, 0, self.clip.width, self.clip.height)
+    
+    def get_text(self, option="text", **kwargs):
+        """Kesim alanındaki metni görünüm koordinatlarında döndürür"""
+        
+        kwargs['clip'] = self.clip
+        result = self.source_page.get_text(option, **kwargs)
+        dx, dy = self.clip.x0, self.clip.y0
+        
+        if option in ("dict", "rawdict"):
+            for block in result["blocks"]:
+                block["bbox"] = _shift_bbox(block["bbox"], dx, dy)
+                for line in block.get("lines", []):
+                    line["bbox"] = _shift_bbox(line["bbox"], dx, dy)
+                    for span in line["spans"]:
+                        span["bbox"] = _shift_bbox(span["bbox"], dx, dy)
+                        if "origin" in span:
+                            span["origin"] = (span["origin"][0] - dx, span["origin"][1] - dy)
+            result["width"] = self.rect.width
+            result["height"] = self.rect.height
+        elif option in ("words", "blocks"):
+            result = [_shift_bbox(item[:4], dx, dy) + tuple(item[4:]) for item in result]
+        
+        return result
+    
+    def get_pixmap(self, matrix=None, clip=None, **kwargs):
+        """Görünüm koordinatlarındaki alanı kaynak sayfadan render eder"""
+        
+        if clip is None:
+            source_clip = self.clip
+        else:
+            x0, y0, x1, y1 = fitz.Rect(clip)
+            dx, dy = self.clip.x0, self.clip.y0
+            source_clip = fitz.Rect(x0 + dx, y0 + dy, x1 + dx, y1 + dy) & self.clip
+        
+        if matrix is not None:
+            kwargs['matrix'] = matrix
+        return self.source_page.get_pixmap(clip=source_clip, **kwargs)
+
+class VirtualDocument:
+    """Kaynak belge üzerinde sıralı sayfa görünümleri - fitz.Document gibi sayfa yükler"""
+    
+    def __init__(self, source, views: List[Tuple[int, Tuple, str]]):
+        self.source = source
+        self.views = [(page_num, tuple(clip), side) for page_num, clip, side in views]
+    
+    def __len__(self):
+        return len(self.views)
+    
+    def load_page(self, number):
+        """Görünümü sanal sayfa olarak yükler"""
+        page_num, clip, side = self.views[number]
+        return VirtualPage(self, number, self.source.load_page(page_num), clip, side)
+    
+    def worker_source(self):
+        """Render süreçlerinin kaynağı açması için dosya yolu (yoksa belge baytları)"""
+        if self.source.name and os.path.exists(self.source.name):
+            return self.source.name
+        return self.source.tobytes()
+    
+    def to_pdf(self):
+        """Görünümlerden tek seviyeli yeni bir PDF oluşturur (sadece kaydetmek için)"""
+        
+        pdf = fitz.open()
+        for page_num, clip, side in self.views:
+            clip = fitz.Rect(clip)
+            new_page = pdf.new_page(width=clip.width, height=clip.height)
+            new_page.show_pdf_page(new_page.rect, self.source, page_num, clip=clip)
+        return pdf
+    
+    def save(self, path):
+        """Görünümleri PDF olarak kaydeder"""
+        pdf = self.to_pdf()
+        try:
+            pdf.save(path)
+        finally:
+            pdf.close()
+    
+    def close(self):
+        """Kaynak belge sahibine aittir - kapatılmaz"""
+        pass
+
+def open_document(source, views=None):
+    """Dosya yolu veya baytlardan belgeyi açar - görünüm listesi verilirse sanal belge döner"""
+    
+    doc = fitz.open(source) if isinstance(source, str) else fitz.open("pdf", source)
+    if views is not None:
+        return VirtualDocument(doc, views)
+    return doc
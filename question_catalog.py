@@ -0,0 +1,275 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Soru kataloğu modülü
+İşleme sonunda tüm soruları (kaynak, numara, sayfa, cevap, görsel yolu, boyut) tek bir
+catalog.json dosyasında toplar; bot bu dosyayı bir kez yükleyip id ile O(1) erişir.
+Katalog yeniden üretildiğinde soru id'leri korunur: kaybolan soruların id'leri boş (null) kalır,
+yeni sorular sona eklenir. Id'ler hiçbir zaman yeniden numaralanmaz - kullanıcı durumunda saklanan
+id'ler yeniden başlatmadan sonra da aynı soruyu gösterir.
+"""
+
+import json
+import os
+import re
+import struct
+from collections import namedtuple
+from typing import Dict, List, Optional, Tuple
+
+from answer_keys import load_answer_key_jsons
+
+CATALOG_FILENAME = "catalog.json"
+CATALOG_VERSION = 1
+CATALOG_COLUMNS = ['pdf_name', 'number', 'page', 'side', 'answer', 'image_path', 'width', 'height']
+
+# Cevap aranırken öncelikli matematik testi başlıkları
+MATH_TEST_TITLES = ['TEMEL MATEMATİK', 'MATEMATİK', 'MATEMAT K', 'MATEMATIK']
+
+# Çok testli anahtarlarda matematik testinin başlığı (ör. "TEMEL MATEMAT K TEST", "TEMEL MATEMETİK TESTİ")
+MATH_TITLE_RE = re.compile(r'MATEM[AE]T|MATH')
+
+UNKNOWN_ANSWER = "Bilinmiyor"
+
+# soru_23_sayfa_6_sag.png (veya .webp) -> Soru 23, Sayfa 6, Sağ
+QUESTION_FILENAME_RE = re.compile(r'^soru_(\d+)_sayfa_(\d+)(?:_([a-z]+))?\.(?:png|webp)$')
+
+CatalogEntry = namedtuple('CatalogEntry', ['id'] + CATALOG_COLUMNS)
+
+def resolve_answer(test_answers: Optional[Dict[str, Dict[str, str]]], question_number: int) -> str:
+    """Bir PDF'in cevap anahtarından soru cevabını bul - önce matematik testleri"""
+    if not test_answers:
+        return UNKNOWN_ANSWER
+    
+    # Önce Matematik testini dene
+    for math_test in MATH_TEST_TITLES:
+        if math_test in test_answers:
+            answer = test_answers[math_test].get(str(question_number))
+            if answer:
+                return answer
+    
+    # Başlığında matematik geçen testler (diğer testlerin aynı numaralı cevabı kullanılmaz)
+    math_tests = [test for test in test_answers if MATH_TITLE_RE.search(test.upper())]
+    if math_tests:
+        for test in math_tests:
+            answer = test_answers[test].get(str(question_number))
+            if answer:
+                return answer
+        return UNKNOWN_ANSWER
+    
+    # Matematik bulunamazsa, tüm testlerde ara
+    for test, answers in test_answers.items():
+        if str(question_number) in answers:
+            return answers[str(question_number)]
+    
+    return UNKNOWN_ANSWER
+
+def read_image_size(path: str) -> Tuple[int, int]:
+    """PNG veya WebP başlığından görsel boyutunu oku (tüm dosyayı açmadan)"""
+    try:
+        with open(path, 'rb') as f:
+            header = f.read(30)
+    except OSError:
+        return 0, 0
+    
+    if header[:8] == b'\x89PNG\r\n\x1a\n' and header[12:16] == b'IHDR':
+        return struct.unpack('>II', header[16:24])
+    
+    if header[:4] == b'RIFF' and header[8:12] == b'WEBP':
+        chunk = header[12:16]
+        if chunk == b'VP8X':
+            # 24 bit genişlik-1 ve yükseklik-1
+            width = int.from_bytes(header[24:27], 'little') + 1
+            height = int.from_bytes(header[27:30], 'little') + 1
+            return width, height
+        if chunk == b'VP8 ':
+            width, height = struct.unpack('<HH', header[26:30])
+            return width & 0x3FFF, height & 0x3FFF
+        if chunk == b'VP8L':
+            bits = int.from_bytes(header[21:25], 'little')
+            return (bits & 0x3FFF) + 1, ((bits >> 14) & 0x3FFF) + 1
+    
+    return 0, 0
+
+def build_folder_rows(output_dir: str, folder_name: str, test_answers=None) -> List[list]:
+    """Tek bir PDF klasöründeki sorular için katalog satırlarını üret"""
+    rows = []
+    folder_path = os.path.join(output_dir, folder_name)
+    
+    for root, dirs, files in os.walk(folder_path):
+        dirs.sort()
+        for file in files:
+            match = QUESTION_FILENAME_RE.match(file)
+            if not match:
+                continue
+            
+            number = int(match.group(1))
+            page = int(match.group(2))
+            side = match.group(3) or "bilinmiyor"
+            image_path = os.path.join(root, file)
+            width, height = read_image_size(image_path)
+            
+            rows.append([
+                folder_name,
+                number,
+                page,
+                side,
+                resolve_answer(test_answers, number),
+                image_path,
+                width,
+                height
+            ])
+    
+    # Klasör içinde soru numarasına göre sırala
+    rows.sort(key=lambda row: (row[1], row[2], row[5]))
+    return rows
+
+def list_question_folders(output_dir: str) -> List[str]:
+    """Output altındaki PDF klasörlerini listele"""
+    if not os.path.isdir(output_dir):
+        return []
+    return sorted(
+        item for item in os.listdir(output_dir)
+        if os.path.isdir(os.path.join(output_dir, item)) and item != "__pycache__" and not item.startswith('.')
+    )
+
+def merge_catalog_rows(previous: 'QuestionCatalog', rows: List[list], replaced_folders=None) -> List[Optional[list]]:
+    """Önceki katalogun id'lerini koruyarak yeni satır listesi (id = sıra, boş id = None)
+    
+    replaced_folders verilirse sadece bu klasörlerin satırları yenilenir, diğerleri aynen kalır
+    (None: tüm satırlar yeniden üretildi). Görsel yolu önceki katalogda bulunan soru aynı id'yi alır.
+    """
+    slots = [
+        None if row is None or replaced_folders is None or row[0] in replaced_folders else row
+        for row in previous.rows()
+    ]
+    
+    appended = []
+    for row in rows:
+        question_id = previous.id_by_path.get(row[5])
+        if question_id is not None and slots[question_id] is None:
+            slots[question_id] = row
+        else:
+            appended.append(row)
+    
+    return slots + appended
+
+def build_catalog(output_dir: str = "output", answers=None, previous: Optional['QuestionCatalog'] = None) -> Dict:
+    """Output klasöründen katalog verisini üret - previous verilirse id'leri korunur"""
+    if answers is None:
+        answers = load_answer_key_jsons(output_dir)
+    
+    rows = []
+    for folder_name in list_question_folders(output_dir):
+        rows.extend(build_folder_rows(output_dir, folder_name, answers.get(folder_name)))
+    
+    if previous is not None:
+        rows = merge_catalog_rows(previous, rows)
+    
+    return {
+        'version': CATALOG_VERSION,
+        'columns': CATALOG_COLUMNS,
+        'questions': rows
+    }
+
+def write_catalog(output_dir: str = "output", answers=None) -> str:
+    """Kataloğu üretip output/catalog.json olarak kaydet - mevcut kataloğun id'leri korunur"""
+    catalog_path = os.path.join(output_dir, CATALOG_FILENAME)
+    
+    previous = None
+    if os.path.exists(catalog_path):
+        try:
+            previous = QuestionCatalog.load(catalog_path)
+        except (OSError, ValueError) as e:
+            print(f"Mevcut katalog okunamadı, id'ler baştan verilecek: {e}")
+    
+    catalog_data = build_catalog(output_dir, answers, previous)
+    
+    tmp_path = f"{catalog_path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(catalog_data, f, ensure_ascii=False, separators=(',', ':'))
+    os.replace(tmp_path, catalog_path)
+    
+    question_count = sum(1 for row in catalog_data['questions'] if row is not None)
+    print(f"Soru kataloğu kaydedildi: {catalog_path} ({question_count} soru)")
+    return catalog_path
+
+class QuestionCatalog:
+    def __init__(self, rows: List[Optional[list]]):
+        """Katalog satırlarından dizi tabanlı indeks oluştur - id = satır sırası, None satır boş id"""
+        self.entries = [
+            CatalogEntry(question_id, *row) if row is not None else None
+            for question_id, row in enumerate(rows)
+        ]
+        
+        # Handler'ların kullandığı bilgi sözlükleri önceden hazırlanır
+        self.infos = [
+            None if entry is None else {
+                'id': entry.id,
+                'number': str(entry.number),
+                'page': str(entry.page),
+                'side': entry.side,
+                'filename': os.path.basename(entry.image_path),
+                'image_path': entry.image_path,
+                'pdf_name': entry.pdf_name,
+                'answer': entry.answer,
+                'dimensions': (entry.width, entry.height)
+            }
+            for entry in self.entries
+        ]
+        
+        self.live_ids = [entry.id for entry in self.entries if entry is not None]
+        self.id_by_path = {self.entries[question_id].image_path: question_id for question_id in self.live_ids}
+        self.folders = sorted({self.entries[question_id].pdf_name for question_id in self.live_ids})
+    
+    @classmethod
+    def from_data(cls, data: Dict) -> 'QuestionCatalog':
+        """catalog.json verisinden oluştur"""
+        if data.get('version') != CATALOG_VERSION or data.get('columns') != CATALOG_COLUMNS:
+            raise ValueError(f"Desteklenmeyen katalog sürümü: {data.get('version')}")
+        return cls(data['questions'])
+    
+    @classmethod
+    def load(cls, path: str) -> 'QuestionCatalog':
+        """catalog.json dosyasını yükle"""
+        with open(path, 'r', encoding='utf-8') as f:
+            return cls.from_data(json.load(f))
+    
+    def __len__(self) -> int:
+        """Soru sayısı (boş id'ler hariç)"""
+        return len(self.live_ids)
+    
+    @property
+    def size(self) -> int:
+        """Id aralığı [0, size) - boş id'ler dahil"""
+        return len(self.entries)
+    
+    def rows(self) -> List[Optional[list]]:
+        """Katalog satırları (catalog.json 'questions' biçiminde)"""
+        return [list(entry[1:]) if entry is not None else None for entry in self.entries]
+    
+    def get(self, question_id: int) -> Optional[CatalogEntry]:
+        """Id ile katalog girdisini döndür"""
+        if 0 <= question_id < len(self.entries):
+            return self.entries[question_id]
+        return None
+    
+    def info(self, question_id: int) -> Optional[Dict]:
+        """Id ile hazır soru bilgisini döndür"""
+        if 0 <= question_id < len(self.infos):
+            return self.infos[question_id]
+        return None
+    
+    def resolve(self, question_id: Optional[int], image_path: Optional[str]) -> Optional[Dict]:
+        """Saklanan (id, görsel yolu) çiftinin soru bilgisi - id başka soruyu gösteriyorsa yoldan bulunur
+        
+        Yol yoksa (eski kayıt) id'ye güvenilir; soru katalogdan çıkarıldıysa None.
+        """
+        info = self.info(question_id) if question_id is not None else None
+        if image_path is None or (info is not None and info['image_path'] == image_path):
+            return info
+        path_id = self.id_by_path.get(image_path)
+        return self.infos[path_id] if path_id is not None else None
+
+if __name__ == "__main__":
+    write_catalog()
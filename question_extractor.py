@@ -6,33 +6,348 @@ import os
 import io
 import pytesseract
 import re
+import heapq
+from bisect import bisect_left, bisect_right
 from typing import List, Dict, Tuple
+from ingestion_manifest import IngestionManifest, MANIFEST_FILENAME, file_sha256, settings_key
+from question_catalog import QUESTION_FILENAME_RE, QuestionCatalog, write_catalog
+from question_pack import write_pack_from_catalog
+from ingest_metrics import NULL_METRICS, IngestMetrics, format_stage_table, replay_snapshot, write_metrics_report
+from span_classifier import (
+    SPAN_QUESTION_NUMBER, SPAN_INSTRUCTION, SPAN_CHOICE, INSTRUCTION_BOX_KEYWORD_RE, NEXT_QUESTION_RE,
+    classify_span, is_choice_line,
+)
+import span_classifier
+from page_views import VirtualDocument, open_document
+from section_locator import MATH_SECTION, SectionIndex, write_section_pdf
+from image_sinks import DEFAULT_IMAGE_FORMAT, IMAGE_FORMATS, FileSystemSink, image_extension
+from render_profiles import (
+    DEFAULT_RENDER_PROFILE, RENDER_PROFILES, is_default_profile, optimize_pixmap, profile_zoom, resolve_render_profile,
+)
+
+class PageSpanIndex:
+    """Bir sayfanın span'larını tek seferde indeksler - tespit, alan bulma ve sonraki soru araması için"""
+    
+    def __init__(self, page):
+        # Sayfa metnini dict formatında sadece bir kez al
+        text_dict = page.get_text("dict")
+        
+        self.spans = []  # Y pozisyonuna göre sıralı, boş olmayan span'lar
+        self.number_spans = {}  # "X." metni -> ilk span bbox'ı (blok sırasına göre)
+        
+        for block in text_dict["blocks"]:
+            if "lines" in block:
+                for line in block["lines"]:
+                    for span in line["spans"]:
+                        text = span["text"].strip()
+                        if not text:
+                            continue
+                        
+                        # Sadece "X." formatındaki numaraları kaydet
+                        if text.endswith('.') and text[:-1].isdigit() and text not in self.number_spans:
+                            self.number_spans[text] = span["bbox"]
+                        
+                        span_info = {
+                            'flags': span.get("flags", 0),
+                            'font': span.get("font", ""),
+                            'size': span.get("size", 0)
+                        }
+                        
+                        # Span'ı tek seferde sınıflandır (soru numarası / talimat / şık / içerik)
+                        kind, number = classify_span(text, span_info)
+                        
+                        self.spans.append({
+                            'text': text,
+                            'bbox': span["bbox"],
+                            'y': span["bbox"][1],  # Y pozisyonu
+                            'span_info': span_info,
+                            'kind': kind,
+                            'number': number
+                        })
+        
+        # Y pozisyonuna göre sırala (stabil sıralama - blok sırası korunur)
+        self.spans.sort(key=lambda x: x['y'])
+        self.ys = [span['y'] for span in self.spans]
+        
+        # Soru numarası -> talimat olmayan ilk span'ın Y pozisyonu
+        self.number_y = {}
+        for span in self.spans:
+            if span['number'] is not None and span['kind'] != SPAN_INSTRUCTION:
+                self.number_y.setdefault(span['number'], span['y'])
+    
+    def find_number_bbox(self, question_number):
+        """X. formatındaki soru numarası span'ının bbox'ını döndürür"""
+        return self.number_spans.get(f"{question_number}.")
+    
+    def find_question_y(self, question_number):
+        """Verilen soru numarasının sayfadaki Y pozisyonunu döndürür"""
+        return self.number_y.get(question_number)
+    
+    def spans_between(self, y0, y1):
+        """Y aralığındaki span'ları döndürür"""
+        return self.spans[bisect_left(self.ys, y0):bisect_right(self.ys, y1)]
+
+# Soru kırpma render ayarları
+RENDER_ZOOM = RENDER_PROFILES[DEFAULT_RENDER_PROFILE]['zoom']  # 2x zoom
+RENDER_MARGIN_Y = 10  # Sadece üst-alt margin
+
+# Akış halinde çıkarmada sıralama için bekletilen en fazla soru sayısı
+QUESTION_LOOKAHEAD = 8
+
+# Manifesto anahtarlarına giren ayarlar - tespit veya render mantığı değiştiğinde 'version' artırılmalı
+DETECTION_SETTINGS = {
+    'version': 3,
+    'virtual_pages': True,
+    'question_range': [1, 50],
+    'instruction_margin': 5,
+    'question_number_margin': 15,
+    'next_question_margin': 20,
+    'min_question_height': 150,
+}
+RENDER_SETTINGS = {
+    'version': 1,
+    'zoom': RENDER_ZOOM,
+    'margin_y': RENDER_MARGIN_Y,
+    'format': 'png',
+}
+
+# Matematik testi ayrılmış kitapçıkların çıktı klasörü eki
+MATH_OUTPUT_SUFFIX = "_matematik"
+
+# Önceden ayrılmış matematik testi PDF'lerinin ad eki (bu PDF'lere klasör eki eklenmez)
+MATH_TEST_PDF_SUFFIX = "_matematik_testi"
+
+def crop_clip(question_rect, page_rect):
+    """Soru alanından tam genişlikte kesim dikdörtgenini hesaplar - sadece yatay kesim"""
+    
+    x0, y0, x1, y1 = question_rect
+    return (
+        0,  # Sol kenar = 0 (tam genişlik)
+        max(0, y0 - RENDER_MARGIN_Y),  # Üst margin
+        page_rect.width,  # Sağ kenar = sayfa genişliği (tam genişlik)
+        min(page_rect.height, y1 + RENDER_MARGIN_Y)  # Alt margin
+    )
+
+def render_settings(profile=None):
+    """Manifesto render anahtarına giren ayarlar - varsayılan profilde RENDER_SETTINGS ile aynı"""
+    
+    if is_default_profile(profile):
+        return dict(RENDER_SETTINGS)
+    return dict(RENDER_SETTINGS, profile={key: profile[key] for key in RENDER_PROFILES[DEFAULT_RENDER_PROFILE]})
+
+def render_question_image(page, clip, profile=None, metrics=NULL_METRICS):
+    """Kesim alanını render profiline göre render edip kodlanmış baytları ve boyutu döndürür"""
+    
+    if profile is None:
+        profile = RENDER_PROFILES[DEFAULT_RENDER_PROFILE]
+    
+    clip = fitz.Rect(clip)
+    
+    # Yüksek çözünürlük matrix (profilde hedef genişlik varsa kesim genişliğine göre)
+    zoom = profile_zoom(profile, clip.width)
+    mat = fitz.Matrix(zoom, zoom)
+    
+    # Soru alanını crop et
+    with metrics.time('render'):
+        pix = page.get_pixmap(matrix=mat, clip=clip)
+    
+    with metrics.time('encode'):
+        return optimize_pixmap(pix, profile)
+
+def render_question_crop(page, clip, filepath, profile=None, metrics=NULL_METRICS):
+    """Kesim alanını render edip dosyaya kaydeder - seri ve paralel yol aynı fonksiyonu kullanır"""
+    
+    data, dimensions = render_question_image(page, clip, profile, metrics)
+    with metrics.time('write'):
+        with open(filepath, 'wb') as f:
+            f.write(data)
+    metrics.count('bytes_written', len(data))
+    
+    return dimensions
+
+# Render süreçlerinin kendi belge tutamacı
+_render_worker_doc = None
+
+def _init_render_worker(source, views=None):
+    """Render sürecinde belgeyi (veya sanal görünümlerini) bir kez açar"""
+    global _render_worker_doc
+    _render_worker_doc = open_document(source, views)
+
+def _render_job(doc, page_num, clip, filepath, profile, metrics=NULL_METRICS):
+    """Tek bir kesimi işler - dosya yolu yoksa (baytlar, boyut) döner"""
+    page = doc.load_page(page_num)
+    if filepath is None:
+        return render_question_image(page, clip, profile, metrics)
+    return render_question_crop(page, clip, filepath, profile, metrics)
+
+def _render_worker_job(page_num, clip, filepath, profile):
+    """Render sürecinde tek bir kesimi işler - sonuçla birlikte işin ölçümlerini döndürür"""
+    metrics = IngestMetrics()
+    result = _render_job(_render_worker_doc, page_num, clip, filepath, profile, metrics)
+    return result, metrics.snapshot()
+
+def render_crops(doc, jobs, workers=1, profile=None, metrics=NULL_METRICS):
+    """(sayfa, kesim, dosya) işlerini render eder - sonuçlar iş sırasıyla döner
+    
+    Dosya yolu verilen işler için boyut, dosya yolu None olanlar için (baytlar, boyut), hatada istisna döner.
+    Render süreçlerinin ölçümleri metrics'e eklenir.
+    """
+    
+    results = []
+    
+    if workers > 1 and len(jobs) > 1:
+        from concurrent.futures import ProcessPoolExecutor
+        
+        # Her süreç belgenin kendi kopyasını açar - sanal belgede kaynak dosya ve görünümler aktarılır
+        if isinstance(doc, VirtualDocument):
+            initargs = (doc.worker_source(), doc.views)
+        else:
+            initargs = (doc.tobytes(),)
+        workers = min(workers, len(jobs))
+        
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_render_worker, initargs=initargs) as executor:
+            futures = [executor.submit(_render_worker_job, *job, profile) for job in jobs]
+            for future in futures:
+                try:
+                    result, snapshot = future.result()
+                    metrics.merge(snapshot)
+                    results.append(result)
+                except Exception as e:
+                    results.append(e)
+    else:
+        for page_num, clip, filepath in jobs:
+            try:
+                results.append(_render_job(doc, page_num, clip, filepath, profile, metrics))
+            except Exception as e:
+                results.append(e)
+    
+    return results
+
+def question_statistics(questions):
+    """Soru listesinden istatistik üretir"""
+    
+    stats = {
+        'total_questions': len(questions),
+        'questions_by_page': {},
+        'questions_by_side': {'sol': 0, 'sag': 0},
+        'question_numbers': []
+    }
+    
+    for q in questions:
+        # Sayfa bazında
+        page_key = f"sayfa_{q['original_page']}_{q['side']}"
+        if page_key not in stats['questions_by_page']:
+            stats['questions_by_page'][page_key] = 0
+        stats['questions_by_page'][page_key] += 1
+        
+        # Taraf bazında
+        stats['questions_by_side'][q['side']] += 1
+        
+        # Soru numaraları
+        stats['question_numbers'].append(q['number'])
+    
+    stats['question_numbers'].sort()
+    return stats
+
+def write_question_list(questions, output_file="question_list.txt"):
+    """Soru listesini text dosyasına kaydeder"""
+    
+    with open(output_file, 'w', encoding='utf-8') as f:
+        f.write("=== ÇIKARILAN SORULAR ===\n\n")
+        
+        for q in sorted(questions, key=lambda x: x['number']):
+            f.write(f"Soru {q['number']}:\n")
+            f.write(f"  Dosya: {q['filename']}\n")
+            f.write(f"  Sayfa: {q['original_page']} ({q['side']})\n")
+            f.write(f"  Boyut: {q['dimensions'][0]}x{q['dimensions'][1]}\n")
+            f.write(f"  Metin: {q['text_preview']}\n")
+            f.write("-" * 50 + "\n")
+    
+    print(f"Soru listesi kaydedildi: {output_file}")
 
 class QuestionExtractor:
-    def __init__(self, pdf_path):
+    def __init__(self, pdf_path, page_range=None, render_profile=None, metrics=None):
+        """page_range verilirse (başlangıç, bitiş hariç) sadece o sayfalar işlenir - örn. matematik testi bölümü
+        
+        render_profile soru görsellerinin çözünürlüğünü ve kodlamasını belirler (bkz. render_profiles).
+        metrics verilirse aşama süreleri ve sayaçlar buna kaydedilir (bkz. ingest_metrics).
+        """
         self.pdf_path = pdf_path
-        self.doc = fitz.open(pdf_path)
+        self.render_profile = render_profile or resolve_render_profile()
+        self.metrics = metrics if metrics is not None else NULL_METRICS
+        with self.metrics.time('open'):
+            self.doc = fitz.open(pdf_path)
+        self.page_range = range(*page_range) if page_range else range(len(self.doc))
+        self.metrics.count('pages', len(self.page_range))
         self.questions = []
         self.processed_doc = None  # İşlenmiş PDF için
+        self._page_indexes = {}  # Sayfa span indeksleri (sayfa başına bir kez oluşturulur)
     
-    def preprocess_pdf(self):
-        """PDF'i ön işleme tabi tutar: çizgi bulma, üst kısım silme, sayfa bölme"""
+    def get_page_index(self, page):
+        """Sayfanın span indeksini döndürür - yoksa oluşturur"""
+        
+        key = (id(page.parent), page.number)
+        index = self._page_indexes.get(key)
+        if index is None:
+            index = PageSpanIndex(page)
+            self._page_indexes[key] = index
+        return index
+    
+    def preprocess_pdf(self, virtual=True):
+        """PDF'i ön işleme tabi tutar: çizgi bulma, üst kısım silme, sayfa bölme
+        
+        virtual True ise yeni PDF oluşturulmaz; kaynak sayfalar üzerinde (sayfa, kesim, taraf)
+        görünümleri kullanılır. False ise eski yöntemle ara PDF'ler oluşturulur.
+        """
         
         print("PDF ön işleme başlıyor...")
         
-        # 1. İlk sayfada dikey çizgiyi bul ve üst kısmı sil
-        self.remove_top_section_from_first_page()
+        if virtual:
+            self.processed_doc = VirtualDocument(self.doc, self.build_page_views())
+            self._page_indexes = {}
+            print(f"Toplam {len(self.processed_doc)} sanal sayfa oluşturuldu (orijinal: {len(self.page_range)})")
+        else:
+            # 1. İlk sayfada dikey çizgiyi bul ve üst kısmı sil
+            with self.metrics.time('top_cut'):
+                self.remove_top_section_from_first_page()
+            
+            # 2. Tüm sayfaları ortadan ikiye böl
+            with self.metrics.time('split'):
+                self.split_all_pages_in_half()
         
-        # 2. Tüm sayfaları ortadan ikiye böl
-        self.split_all_pages_in_half()
+        self.metrics.count('virtual_pages', len(self.processed_doc))
         
         print("PDF ön işleme tamamlandı.")
         return self.processed_doc
     
+    def build_page_views(self):
+        """Talimat kutusu kesilmiş ve ortadan bölünmüş sayfa görünümlerini hesaplar - (sayfa, kesim, taraf)"""
+        
+        # İlk sayfada talimat kutusunun alt sınırı
+        with self.metrics.time('top_cut'):
+            instruction_bottom_y = self.find_instruction_box_bottom()
+        if instruction_bottom_y is None:
+            print("Talimat kutusu bulunamadı, üst kısım silinmiyor.")
+        else:
+            print(f"Talimat kutusu alt sınırı bulundu: y={instruction_bottom_y}")
+        
+        views = []
+        with self.metrics.time('split'):
+            for page_num in self.page_range:
+                page_rect = self.doc.load_page(page_num).rect
+                top = instruction_bottom_y if (page_num == self.page_range[0] and instruction_bottom_y is not None) else 0
+                half_width = page_rect.width / 2
+                
+                # Sol ve sağ yarı - görünüm sırası eski bölünmüş PDF'in sayfa sırasıyla aynı
+                views.append((page_num, (0, top, half_width, page_rect.height), "sol"))
+                views.append((page_num, (half_width, top, page_rect.width, page_rect.height), "sag"))
+        
+        return views
+    
     def find_instruction_box_bottom(self):
         """Talimat kutusunun alt sınırını bulur - 1. ve 3. soruların hizasından"""
         
-        first_page = self.doc.load_page(0)
+        first_page = self.doc.load_page(self.page_range[0])
         
         # Sayfa metnini al ve talimat satırlarını bul
         page_text = first_page.get_text()
@@ -42,7 +357,7 @@ class QuestionExtractor:
         instruction_lines = []
         for i, line in enumerate(lines):
             line = line.strip()
-            if any(keyword in line for keyword in ['Bu testte', 'Cevaplarınızı', 'Temel Matemati', 'Test süresi', 'Talimatlar']):
+            if INSTRUCTION_BOX_KEYWORD_RE.search(line):
                 instruction_lines.append((i, line))
         
         if not instruction_lines:
@@ -125,7 +440,7 @@ class QuestionExtractor:
         print(f"Talimat kutusundan itibaren sayfa enine kesiliyor...")
         
         # İlk sayfayı al
-        first_page = self.doc.load_page(0)
+        first_page = self.doc.load_page(self.page_range[0])
         page_rect = first_page.rect
         
         # Talimat kutusundan itibaren kes (dikdörtgen oluştur)
@@ -136,10 +451,10 @@ class QuestionExtractor:
         
         # İlk sayfa - talimat kutusu kesilmiş
         new_page = self.processed_doc.new_page(width=page_rect.width, height=page_rect.height - pdf_y_cut)
-        new_page.show_pdf_page(new_page.rect, self.doc, 0, clip=crop_rect)
+        new_page.show_pdf_page(new_page.rect, self.doc, self.page_range[0], clip=crop_rect)
         
         # Diğer sayfaları ekle (kesilmeden)
-        for page_num in range(1, len(self.doc)):
+        for page_num in self.page_range[1:]:
             original_page = self.doc.load_page(page_num)
             new_page = self.processed_doc.new_page(width=original_page.rect.width, height=original_page.rect.height)
             new_page.show_pdf_page(new_page.rect, self.doc, page_num)
@@ -157,8 +472,9 @@ class QuestionExtractor:
         
         # İşlenmiş PDF'den sayfaları al (eğer varsa)
         source_doc = self.processed_doc if self.processed_doc else self.doc
+        page_numbers = range(len(source_doc)) if self.processed_doc else self.page_range
         
-        for page_num in range(len(source_doc)):
+        for page_num in page_numbers:
             page = source_doc.load_page(page_num)
             page_rect = page.rect
             
@@ -181,17 +497,44 @@ class QuestionExtractor:
         if self.processed_doc:
             self.processed_doc.close()
         self.processed_doc = split_doc
+        self._page_indexes = {}
         
-        print(f"Toplam {len(self.processed_doc)} sayfa oluşturuldu (orijinal: {len(self.doc)})")
+        print(f"Toplam {len(self.processed_doc)} sayfa oluşturuldu (orijinal: {len(self.page_range)})")
         
-    def extract_all_questions(self, output_dir="individual_questions"):
-        """Bölünmüş PDF'deki tüm soruları ayrı ayrı çıkarır"""
+    def extract_all_questions(self, output_dir="individual_questions", render_workers=1, sink=None):
+        """Bölünmüş PDF'deki tüm soruları ayrı ayrı çıkarır
+        
+        render_workers > 1 ise soru görselleri ayrı süreçlerde render edilir.
+        sink verilirse görseller dosya yerine bu hedefe yazılır (bkz. image_sinks).
+        """
         
-        if not os.path.exists(output_dir):
-            os.makedirs(output_dir)
-            
         print("Soru algılama ve çıkarma başlıyor...")
         
+        # self.questions listesini temizle
+        self.questions = []
+        
+        if render_workers > 1:
+            # Önce tüm kesim alanlarını planla, sonra paralel render et
+            plans = list(self.iter_question_plans(output_dir))
+            doc_to_use = self.processed_doc if self.processed_doc else self.doc
+            self.render_plans_parallel(doc_to_use, plans, render_workers, sink)
+        else:
+            for question_info in self.iter_questions(output_dir, sink=sink):
+                self.questions.append(question_info)
+        
+        print(f"Toplam {len(self.questions)} soru çıkarıldı.")
+        return self.questions
+    
+    def iter_question_plans(self, output_dir="individual_questions", lookahead=QUESTION_LOOKAHEAD):
+        """Sayfaları sırayla tarar ve soru kesim planlarını hazır oldukça üretir
+        
+        Her soru numarasının sayfa sırasındaki ilk geçişi kullanılır. Planlar en fazla
+        lookahead soru bekletilerek soru numarası sırasıyla döner.
+        """
+        
+        if output_dir and not os.path.exists(output_dir):
+            os.makedirs(output_dir)
+        
         # Önce PDF'i ön işleme tabi tut
         if self.processed_doc is None:
             self.preprocess_pdf()
@@ -199,116 +542,98 @@ class QuestionExtractor:
         # İşlenmiş PDF'i kullan
         doc_to_use = self.processed_doc if self.processed_doc else self.doc
         
-        # Tüm soruları topla
-        all_questions = []
-        for page_num in range(len(doc_to_use)):
-            page = doc_to_use.load_page(page_num)
-            page_text = page.get_text()
-            questions_on_page = self.detect_questions_on_page(page, page_text, page_num)
-            all_questions.extend(questions_on_page)
+        seen = set()
+        pending = []  # (soru numarası, sıra, plan) yığını
+        order = 0
         
-        # Benzersiz soru numaralarını filtrele
-        unique_questions = {}
-        for question in all_questions:
-            q_num = question['number']
-            if q_num not in unique_questions:
-                unique_questions[q_num] = question
+        for page_num in range(len(doc_to_use)):
+            with self.metrics.time('detect'):
+                page = doc_to_use.load_page(page_num)
+                page_questions = self.detect_questions_on_page(page, page_num)
+            self.metrics.count('questions_detected', len(page_questions))
+            
+            for question in page_questions:
+                # Benzersiz soru numaralarını filtrele
+                if question['number'] in seen:
+                    continue
+                seen.add(question['number'])
+                
+                plan = self.plan_question_crop(page, question, page_num, output_dir)
+                if plan is None:
+                    continue
+                
+                heapq.heappush(pending, (question['number'], order, plan))
+                order += 1
+                
+                if len(pending) > lookahead:
+                    yield heapq.heappop(pending)[2]
+            
+            # Sayfa planlandı - span indeksine artık gerek yok
+            self._page_indexes.pop((id(page.parent), page.number), None)
         
-        # Benzersiz soruları sırala ve çıkar
-        sorted_questions = sorted(unique_questions.values(), key=lambda x: x['number'])
+        while pending:
+            yield heapq.heappop(pending)[2]
+    
+    def iter_questions(self, output_dir="individual_questions", lookahead=QUESTION_LOOKAHEAD, with_bytes=False, sink=None):
+        """Soruları hazır oldukça render edip soru bilgisiyle birlikte üretir
         
-        # self.questions listesini temizle
-        self.questions = []
+        Görseller sink'e yazılır (verilmezse output_dir altına dosya olarak) ve 'filepath'
+        sink'in döndürdüğü yer olur. output_dir ve sink yoksa hiçbir şey yazılmaz; kodlanmış
+        baytlar 'image_bytes' olarak döner. with_bytes True ise baytlar her durumda eklenir.
+        """
         
-        for question in sorted_questions:
-            page_num = question['page']
-            page = doc_to_use.load_page(page_num)
-            self.extract_question_as_image(page, question, page_num, 0, output_dir)
+        if sink is None and output_dir:
+            sink = FileSystemSink(output_dir)
         
-        print(f"Toplam {len(self.questions)} soru çıkarıldı.")
-        return self.questions
+        doc_to_use = None
+        for plan in self.iter_question_plans(output_dir, lookahead):
+            if doc_to_use is None:
+                doc_to_use = self.processed_doc if self.processed_doc else self.doc
+            
+            question = plan['question']
+            try:
+                page = doc_to_use.load_page(plan['page_num'])
+                data, dimensions = render_question_image(page, plan['clip'], self.render_profile, self.metrics)
+                location = None
+                if sink is not None:
+                    with self.metrics.time('write'):
+                        location = sink.put(plan['filename'], data)
+                    self.metrics.count('bytes_written', len(data))
+            except Exception as e:
+                print(f"Sayfa {plan['page_num']+1}, Soru {question['number']} hatası: {e}")
+                self.metrics.count('render_errors')
+                continue
+            
+            self.metrics.count('questions_rendered')
+            
+            question_info = self._question_info(plan, dimensions)
+            question_info['filepath'] = location
+            if sink is None or with_bytes:
+                question_info['image_bytes'] = data
+            
+            print(f"Çıkarıldı: {plan['filename']} - Soru {question['number']}")
+            yield question_info
     
-    def detect_questions_on_page(self, page, page_text, page_num):
+    def detect_questions_on_page(self, page, page_num):
         """Sayfadaki soruları tespit eder - şıklar dahil"""
         
         questions = []
         
-        # Sayfa metnini dict formatında al (pozisyon bilgisi için)
-        text_dict = page.get_text("dict")
-        
-        # Tüm metin bloklarını topla ve sırala
-        text_blocks = []
-        for block in text_dict["blocks"]:
-            if "lines" in block:
-                for line in block["lines"]:
-                    for span in line["spans"]:
-                        text = span["text"].strip()
-                        if text:
-                            text_blocks.append({
-                                'text': text,
-                                'bbox': span["bbox"],
-                                'y': span["bbox"][1],  # Y pozisyonu
-                                'span_info': {
-                                    'flags': span.get("flags", 0),
-                                    'font': span.get("font", ""),
-                                    'size': span.get("size", 0)
-                                }
-                            })
-        
-        # Y pozisyonuna göre sırala
-        text_blocks.sort(key=lambda x: x['y'])
-        
-        # Soru numarası pattern'leri
-        question_patterns = [
-            r'^(\d+)\.\s*',  # "1. " gibi
-            r'^Soru\s*(\d+)',  # "Soru 1" gibi
-            r'^(\d+)\s*-\s*',  # "1 - " gibi
-        ]
+        # Sayfa span indeksini al (sayfa başına tek layout ayrıştırması)
+        text_blocks = self.get_page_index(page).spans
         
-        # Önce tüm soru numaralarını ve pozisyonlarını bul
+        # Önce tüm soru numaralarını ve pozisyonlarını bul (span'lar indekslenirken sınıflandırıldı)
         question_starts = []
         for i, block in enumerate(text_blocks):
-            text = block['text']
-            
-            # Soru numarası var mı kontrol et - SADECE satır başında
-            question_number = None
-            for pattern in question_patterns:
-                match = re.search(pattern, text)
-                if match:
-                    question_number = int(match.group(1))
-                    # Geçerli soru numarası mı? (1-50 arası)
-                    if 1 <= question_number <= 50:
-                        break
-                    else:
-                        question_number = None
-            
-            if question_number:
-                # Talimat mı kontrol et
-                if self.is_instruction(text):
-                    continue
-                
-                # Span bilgilerini al (font kalınlığı için)
-                span_info = block.get('span_info', {})
-                
-                # Gerçek soru başlangıcı mı kontrol et
-                if not self.is_question_start(text, question_number, span_info):
-                    continue
-                
-                # Ek güvenlik kontrolü: Eğer metin çok uzunsa veya içinde soru içeriği varsa atla
-                if len(text.strip()) > 20:  # Çok uzun metinler soru içeriği içerir
-                    continue
-                
-                # İçinde soru içeriği olan kelimeler var mı kontrol et
-                content_words = ['saat', 'dakika', 'gün', 'Mart', 'matematik', 'geometri', 'öğretmen', 'ders', 'vermiştir', 'toplam']
-                if any(word in text for word in content_words):
-                    continue
-                
-                question_starts.append({
-                    'number': question_number,
-                    'start_index': i,
-                    'start_bbox': block['bbox'],
-                    'start_text': text
-                })
+            if block['kind'] != SPAN_QUESTION_NUMBER:
+                continue
+            
+            question_starts.append({
+                'number': block['number'],
+                'start_index': i,
+                'start_bbox': block['bbox'],
+                'start_text': block['text']
+            })
         
         # Her soru için içeriği topla
         for i, q_start in enumerate(question_starts):
@@ -321,11 +646,10 @@ class QuestionExtractor:
             
             for j in range(start_idx, end_idx):
                 block = text_blocks[j]
-                text = block['text']
-                question_text_parts.append(text)
+                question_text_parts.append(block['text'])
                 
                 # Şık pattern'i kontrol et
-                if re.search(r'^[A-E]\)\s*', text):
+                if block['kind'] == SPAN_CHOICE:
                     has_choices = True
             
             # Soru bilgilerini oluştur
@@ -344,130 +668,31 @@ class QuestionExtractor:
     
     def is_question_start(self, text, question_number, span_info=None):
         """Bir metnin gerçekten soru başlangıcı olup olmadığını kontrol eder"""
-        
-        # Soru başlangıcı karakteristikleri:
-        # 1. Satır başında olmalı
-        # 2. Sadece sayı ve nokta içermeli (veya "Soru" kelimesi)
-        # 3. Ardından boşluk ve büyük harf gelmeli
-        # 4. İçinde "saat", "dakika", "gün" gibi kelimeler olmamalı
-        # 5. Soru içeriği olmamalı (sadece numara olmalı)
-        # 6. Font kalınlığı kontrolü (eğer span_info varsa)
-        
-        text = text.strip()
-        
-        # Satır başında sayı kontrolü - sadece "X." formatında olmalı
-        if not re.match(r'^\d+\.\s*$|^Soru\s*\d+\s*$', text):
-            return False
-        
-        # İçinde soru içeriği olmamalı (sadece numara olmalı)
-        if len(text) > 15:  # Çok uzun ise soru içeriği var demektir
-            return False
-        
-        # Soru numarası 1-50 arasında olmalı
-        if not (1 <= question_number <= 50):
-            return False
-        
-        # Ek kontrol: Eğer metin sadece sayı ve nokta ise, soru içeriği yok demektir
-        # Ama eğer içinde "saat", "dakika", "gün", "Mart" gibi kelimeler varsa soru içeriği var demektir
-        content_indicators = ['saat', 'dakika', 'gün', 'Mart', 'matematik', 'geometri', 'öğretmen', 'ders']
-        if any(indicator in text for indicator in content_indicators):
-            return False
-        
-        # Font kalınlığı kontrolü (eğer span_info varsa)
-        if span_info and 'flags' in span_info:
-            # Font flags kontrolü - bold olup olmadığını kontrol et
-            # PyMuPDF'de bold font genellikle flags & 2^16 (65536) ile kontrol edilir
-            is_bold = bool(span_info['flags'] & 16)  # Bold flag
-            if not is_bold:
-                # Eğer font kalın değilse, bu muhtemelen soru içeriği değil
-                # Ama sadece sayı ve nokta ise yine de kabul et
-                if not re.match(r'^\d+\.\s*$', text):
-                    return False
-        
-        return True
+        return span_classifier.is_question_start(text, question_number, span_info)
     
     def has_math_content(self, line):
         """Satırda matematik içeriği var mı kontrol eder - talimatları hariç tutar"""
-        
-        # Önce basit talimat kontrolü (recursion'ı önlemek için)
-        instruction_keywords = [
-            'Bu testte', 'Cevaplarınızı', 'Test süresi', 'Sınav başlamadan',
-            'Talimatlar', 'Yönergeler', 'işaretleyiniz'
-        ]
-        
-        if any(keyword in line for keyword in instruction_keywords):
-            return False
-        
-        # Matematik içeriği kontrolü
-        math_indicators = [
-            r'[+\-*/]',  # Matematik operatörleri
-            r'kaçtır\?', r'bulunuz', r'hesaplayınız',  # Soru kelimeleri
-            r'olduğuna göre', r'eşittir', r'çarpım', r'toplam',  # Matematik terimleri
-            r'[A-E]\)',  # Şık işaretleri
-            r'şekilde', r'grafik', r'diyagram',  # Görsel terimler
-            r'cm', r'kg', r'm', r'°', r'%'  # Birimler
-        ]
-        
-        # Sayılar + matematik terimleri birlikte olmalı
-        has_numbers = bool(re.search(r'[0-9]', line))
-        has_math_terms = any(re.search(pattern, line) for pattern in math_indicators)
-        
-        return has_numbers and has_math_terms
+        return span_classifier.has_math_content(line)
     
     def is_instruction(self, line):
         """Satırın talimat mı soru mu olduğunu kontrol eder"""
-        
-        # Çok spesifik talimat pattern'leri - sadece gerçek talimatlar
-        instruction_patterns = [
-            r'^\d+\.\s*Bu testte \d+ soru vardır',
-            r'^\d+\.\s*Cevaplarınızı, cevap kâğıdının Temel Matematik Testi için ayrılan kısmına işaretleyiniz\.',
-            r'^\d+\.\s*Test süresi',
-            r'^\d+\.\s*Sınav başlamadan önce',
-            r'^\d+\.\s*Talimatlar',
-            r'^\d+\.\s*Yönergeler',
-            r'^\d+\.\s*Bu testte',
-            r'^\d+\.\s*Cevaplarınızı.*işaretleyiniz'
-        ]
-        
-        # Sadece tam eşleşme kontrol et
-        is_instruction_text = any(re.search(pattern, line) for pattern in instruction_patterns)
-        
-        # Ek kontrol: Eğer talimat pattern'i varsa ama matematik içeriği de varsa, bu bir soru olabilir
-        if is_instruction_text:
-            # Basit matematik kontrolü (recursion'ı önlemek için)
-            has_numbers = bool(re.search(r'[0-9]', line))
-            has_math_operators = bool(re.search(r'[+\-*/=]', line))
-            has_question_words = bool(re.search(r'(kaçtır|bulunuz|hesaplayınız|olduğuna göre)', line))
-            
-            if has_numbers and (has_math_operators or has_question_words):
-                return False  # Matematik içeriği varsa soru olarak kabul et
-        
-        return is_instruction_text
+        return span_classifier.is_instruction(line)
     
     def is_end_of_question(self, line, lines, line_num):
         """Soru bitti mi kontrol eder - şıklar dahil"""
         
-        # Şık pattern'leri kontrol et
-        choice_patterns = [
-            r'^[A-E]\)\s*',  # A) B) C) D) E)
-            r'^[A-E]\.\s*',  # A. B. C. D. E.
-            r'^[A-E]\s*\)',  # A ) B ) C ) D ) E )
-        ]
-        
         # Bu satır bir şık mı?
-        is_choice = any(re.search(pattern, line) for pattern in choice_patterns)
-        
-        if is_choice:
+        if is_choice_line(line):
             # Şık bulundu, sonraki satırları kontrol et
             for i in range(line_num + 1, min(line_num + 5, len(lines))):
                 next_line = lines[i].strip()
                 
                 # Sonraki şık var mı?
-                if any(re.search(pattern, next_line) for pattern in choice_patterns):
+                if is_choice_line(next_line):
                     continue
                 
                 # Yeni soru numarası var mı?
-                if re.search(r'(\d+)\.\s*|Soru\s*(\d+)|(\d+)\s*-\s*', next_line):
+                if NEXT_QUESTION_RE.search(next_line):
                     return True
                 
                 # Boş satır veya sayfa sonu
@@ -479,7 +704,7 @@ class QuestionExtractor:
         # Şık değilse, sonraki satırlarda yeni soru numarası var mı?
         for i in range(line_num + 1, min(line_num + 3, len(lines))):
             next_line = lines[i].strip()
-            if re.search(r'(\d+)\.\s*|Soru\s*(\d+)|(\d+)\s*-\s*', next_line):
+            if NEXT_QUESTION_RE.search(next_line):
                 return True
         
         # Sayfa sonuna yakın mı?
@@ -491,83 +716,108 @@ class QuestionExtractor:
     def extract_question_as_image(self, page, question, page_num, question_index, output_dir):
         """Tek bir soruyu görsel olarak çıkarır - sadece yatay kesim"""
         
+        try:
+            plan = self.plan_question_crop(page, question, page_num, output_dir)
+            if plan is None:
+                return
+            
+            dimensions = render_question_crop(page, plan['clip'], plan['filepath'], self.render_profile, self.metrics)
+            self.metrics.count('questions_rendered')
+            self._record_question(plan, dimensions)
+            
+        except Exception as e:
+            print(f"Sayfa {page_num+1}, Soru {question['number']} hatası: {e}")
+    
+    def plan_question_crop(self, page, question, page_num, output_dir):
+        """Sorunun kesim alanını ve dosya adını planlar - render etmez"""
+        
         try:
             # Soru metninin pozisyonunu bul
             question_rect = self.find_question_rect(page, question)
             
             if question_rect is None:
                 print(f"Sayfa {page_num+1}, Soru {question['number']}: Pozisyon bulunamadı")
-                return
+                return None
             
             # SADECE YATAY KESİM - Sayfa genişliğini kullan, sadece yükseklik ayarla
-            margin_y = 10  # Sadece üst-alt margin
-            expanded_rect = fitz.Rect(
-                0,  # Sol kenar = 0 (tam genişlik)
-                max(0, question_rect.y0 - margin_y),  # Üst margin
-                page.rect.width,  # Sağ kenar = sayfa genişliği (tam genişlik)
-                min(page.rect.height, question_rect.y1 + margin_y)  # Alt margin
-            )
-            
-            # Yüksek çözünürlük matrix
-            mat = fitz.Matrix(2.0, 2.0)  # 2x zoom
-            
-            # Soru alanını crop et
-            pix = page.get_pixmap(matrix=mat, clip=expanded_rect)
+            clip = crop_clip(question_rect, page.rect)
             
             # Dosya adı oluştur
             side = "sol" if (page_num % 2 == 0) else "sag"
             original_page_num = (page_num // 2) + 1
-            filename = f"soru_{question['number']}_sayfa_{original_page_num}_{side}.png"
-            
-            filepath = os.path.join(output_dir, filename)
+            filename = f"soru_{question['number']}_sayfa_{original_page_num}_{side}{image_extension(self.render_profile['image_format'])}"
             
-            # PNG olarak kaydet
-            pix.save(filepath)
-            
-            # Soru bilgisini kaydet
-            question_info = {
-                'number': question['number'],
-                'page': page_num + 1,
-                'original_page': original_page_num,
+            return {
+                'question': question,
+                'page_num': page_num,
+                'question_rect': tuple(question_rect),
+                'clip': clip,
                 'side': side,
+                'original_page': original_page_num,
                 'filename': filename,
-                'filepath': filepath,
-                'dimensions': (pix.width, pix.height),
-                'text_preview': question['full_text'][:100] + '...' if len(question['full_text']) > 100 else question['full_text']
+                'filepath': os.path.join(output_dir, filename) if output_dir else None
             }
             
-            self.questions.append(question_info)
-            print(f"Çıkarıldı: {filename} - Soru {question['number']}")
-            
-            pix = None  # Memory cleanup
-            
         except Exception as e:
             print(f"Sayfa {page_num+1}, Soru {question['number']} hatası: {e}")
+            return None
+    
+    def render_plans_parallel(self, doc, plans, workers, sink=None):
+        """Planlanmış kesimleri süreç havuzunda render eder - her süreç kendi belge kopyasını açar
+        
+        sink verilirse süreçler kodlanmış baytları döndürür ve görseller sink'e yazılır.
+        """
+        
+        jobs = [(plan['page_num'], plan['clip'], None if sink is not None else plan['filepath']) for plan in plans]
+        
+        # Sonuçları plan sırasıyla kaydet
+        for plan, result in zip(plans, render_crops(doc, jobs, workers, self.render_profile, self.metrics)):
+            if isinstance(result, Exception):
+                print(f"Sayfa {plan['page_num']+1}, Soru {plan['question']['number']} hatası: {result}")
+                self.metrics.count('render_errors')
+                continue
+            
+            if sink is not None:
+                data, result = result
+                with self.metrics.time('write'):
+                    plan = dict(plan, filepath=sink.put(plan['filename'], data))
+                self.metrics.count('bytes_written', len(data))
+            self.metrics.count('questions_rendered')
+            self._record_question(plan, result)
+    
+    def _record_question(self, plan, dimensions):
+        """Render edilen sorunun bilgisini kaydeder"""
+        
+        self.questions.append(self._question_info(plan, dimensions))
+        print(f"Çıkarıldı: {plan['filename']} - Soru {plan['question']['number']}")
+    
+    def _question_info(self, plan, dimensions):
+        """Plan ve render boyutundan soru bilgisini oluşturur"""
+        
+        question = plan['question']
+        return {
+            'number': question['number'],
+            'page': plan['page_num'] + 1,
+            'original_page': plan['original_page'],
+            'side': plan['side'],
+            'filename': plan['filename'],
+            'filepath': plan['filepath'],
+            'dimensions': dimensions,
+            'question_rect': plan['question_rect'],
+            'text_preview': question['full_text'][:100] + '...' if len(question['full_text']) > 100 else question['full_text']
+        }
     
     def find_question_rect(self, page, question):
         """Soru metninin sayfadaki pozisyonunu bulur"""
         
         try:
-            # Sayfa metnini dict formatında al
-            text_dict = page.get_text("dict")
-            
-            # Soru numarasını ara
-            question_number = str(question['number'])
-            
-            for block in text_dict["blocks"]:
-                if "lines" in block:
-                    for line in block["lines"]:
-                        for span in line["spans"]:
-                            text = span["text"]
-                            
-                            # Soru numarasını içeren span'ı bul - sadece "X." formatında
-                            if text.strip() == f"{question_number}.":
-                                # Bu span'ın pozisyonunu al
-                                bbox = span["bbox"]
-                                
-                                # Soru alanını genişlet (tüm soru metni için)
-                                question_rect = self.expand_question_area(page, bbox, question)
-                                return question_rect
+            # Soru numarasını içeren span'ı indeksten bul - sadece "X." formatında
+            bbox = self.get_page_index(page).find_number_bbox(question['number'])
+            
+            if bbox is not None:
+                # Soru alanını genişlet (tüm soru metni için)
+                question_rect = self.expand_question_area(page, bbox, question)
+                return question_rect
             
             return None
             
@@ -623,48 +873,8 @@ class QuestionExtractor:
         """Bir sonraki sorunun başlangıç pozisyonunu bulur"""
         
         try:
-            # Sayfa metnini dict formatında al
-            text_dict = page.get_text("dict")
-            
-            # Sonraki soru numarası
-            next_question_num = current_question_num + 1
-            
-            # Tüm metin bloklarını topla ve sırala
-            text_blocks = []
-            for block in text_dict["blocks"]:
-                if "lines" in block:
-                    for line in block["lines"]:
-                        for span in line["spans"]:
-                            text = span["text"].strip()
-                            if text:
-                                text_blocks.append({
-                                    'text': text,
-                                    'bbox': span["bbox"],
-                                    'y': span["bbox"][1]
-                                })
-            
-            # Y pozisyonuna göre sırala
-            text_blocks.sort(key=lambda x: x['y'])
-            
-            # Sonraki soru numarasını ara
-            for block in text_blocks:
-                text = block['text']
-                
-                # Soru numarası pattern'leri
-                question_patterns = [
-                    r'^(\d+)\.\s*',  # "1. " gibi
-                    r'^Soru\s*(\d+)',  # "Soru 1" gibi
-                    r'^(\d+)\s*-\s*',  # "1 - " gibi
-                ]
-                
-                for pattern in question_patterns:
-                    match = re.search(pattern, text)
-                    if match:
-                        question_number = int(match.group(1))
-                        if question_number == next_question_num and not self.is_instruction(text):
-                            return block['y']
-            
-            return None
+            # Sonraki soru numarasını indeksten bul
+            return self.get_page_index(page).find_question_y(current_question_num + 1)
             
         except Exception as e:
             print(f"Sonraki soru bulma hatası: {e}")
@@ -672,57 +882,18 @@ class QuestionExtractor:
     
     def get_question_statistics(self):
         """Soru istatistiklerini döndürür"""
-        
-        if not self.questions:
-            return {
-                'total_questions': 0,
-                'questions_by_page': {},
-                'questions_by_side': {'sol': 0, 'sag': 0},
-                'question_numbers': []
-            }
-        
-        stats = {
-            'total_questions': len(self.questions),
-            'questions_by_page': {},
-            'questions_by_side': {'sol': 0, 'sag': 0},
-            'question_numbers': []
-        }
-        
-        for q in self.questions:
-            # Sayfa bazında
-            page_key = f"sayfa_{q['original_page']}_{q['side']}"
-            if page_key not in stats['questions_by_page']:
-                stats['questions_by_page'][page_key] = 0
-            stats['questions_by_page'][page_key] += 1
-            
-            # Taraf bazında
-            stats['questions_by_side'][q['side']] += 1
-            
-            # Soru numaraları
-            stats['question_numbers'].append(q['number'])
-        
-        stats['question_numbers'].sort()
-        return stats
+        return question_statistics(self.questions)
     
     def save_question_list(self, output_file="question_list.txt"):
         """Soru listesini text dosyasına kaydeder"""
-        
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write("=== ÇIKARILAN SORULAR ===\n\n")
-            
-            for q in sorted(self.questions, key=lambda x: x['number']):
-                f.write(f"Soru {q['number']}:\n")
-                f.write(f"  Dosya: {q['filename']}\n")
-                f.write(f"  Sayfa: {q['original_page']} ({q['side']})\n")
-                f.write(f"  Boyut: {q['dimensions'][0]}x{q['dimensions'][1]}\n")
-                f.write(f"  Metin: {q['text_preview']}\n")
-                f.write("-" * 50 + "\n")
-        
-        print(f"Soru listesi kaydedildi: {output_file}")
+        write_question_list(self.questions, output_file)
 
 # Matematik testi çıkarma fonksiyonu
 def extract_math_test_from_pdf(pdf_path: str, output_path: str = None) -> bool:
-    """PDF'den matematik testini çıkarır"""
+    """PDF'den matematik testini ayrı bir PDF olarak çıkarır
+    
+    Toplu işlem bu fonksiyonu kullanmaz; matematik testi sayfa aralığı olarak doğrudan işlenir.
+    """
     
     if not os.path.exists(pdf_path):
         print(f"❌ PDF dosyası bulunamadı: {pdf_path}")
@@ -731,84 +902,303 @@ def extract_math_test_from_pdf(pdf_path: str, output_path: str = None) -> bool:
     # Çıktı dosya adını oluştur
     if output_path is None:
         base_name = os.path.splitext(os.path.basename(pdf_path))[0]
-        output_path = f"{base_name}_matematik_testi.pdf"
+        output_path = f"{base_name}{MATH_TEST_PDF_SUFFIX}.pdf"
     
     try:
-        # PDF dosyasını yükle
         doc = fitz.open(pdf_path)
+        try:
+            math_section = SectionIndex.from_document(doc).get_split(MATH_SECTION)
+            if math_section is None:
+                print("❌ Matematik testi sınırları bulunamadı!")
+                return False
+            
+            write_section_pdf(doc, math_section, output_path)
+        finally:
+            doc.close()
+        
+        print(f"✅ Matematik testi çıkarıldı: {output_path}")
+        print(f"📄 Sayfa sayısı: {math_section.end_page - math_section.start_page}")
+        return True
+        
+    except Exception as e:
+        print(f"❌ Matematik testi çıkarılırken hata: {e}")
+        return False
+
+# Manifesto girdisinden rapor satırı oluşturma
+def _result_from_manifest_entry(entry, cached=False):
+    """Manifesto girdisini toplu işlem rapor satırına dönüştürür"""
+    
+    stats = question_statistics(entry['questions'])
+    return {
+        'pdf_name': entry['pdf_name'],
+        'processed_pdf': entry['processed_source'],
+        'output_dir': entry['output_dir'],
+        'total_questions': stats['total_questions'],
+        'questions_by_side': stats['questions_by_side'],
+        'question_numbers': stats['question_numbers'],
+        'math_test_extracted': entry['math_test_extracted'],
+        'render_profile': entry.get('render_profile', DEFAULT_RENDER_PROFILE),
+        'image_bytes': entry.get('image_bytes'),
+        'baseline_image_bytes': entry.get('baseline_image_bytes'),
+        'cached': cached,
+        'status': 'success'
+    }
+
+# Varsayılan render'a göre görsel boyutu karşılaştırması
+def measure_baseline_bytes(doc, questions):
+    """Soruları varsayılan profille (dosya yazmadan) render edip toplam bayt sayısını döndürür"""
+    
+    total = 0
+    for q in questions:
+        page = doc.load_page(q['page'] - 1)
+        data, _ = render_question_image(page, crop_clip(q['question_rect'], page.rect))
+        total += len(data)
+    return total
+
+def format_bytes_saved(image_bytes, baseline_bytes):
+    """Bayt kazancını rapor satırı olarak biçimlendirir"""
+    
+    if not baseline_bytes:
+        return "ölçülmedi"
+    saved = baseline_bytes - image_bytes
+    return f"{saved / 1024:.1f} KB (%{100 * saved / baseline_bytes:.1f}, varsayılan: {baseline_bytes / 1024:.1f} KB)"
+
+# Değişmemiş PDF için önceki çıktıyı yeniden kullanma
+def _reuse_manifest_entry(entry, render_key, render_workers=1, render_profile=None, metrics=NULL_METRICS):
+    """Tespit sonuçları geçerliyse sadece eksik veya eskimiş görselleri yeniden render eder
+    
+    Önceki çıktı kullanılamıyorsa None döner (tam işleme gerekir).
+    """
+    
+    questions = entry['questions']
+    
+    # Format değiştiyse dosya adları da değişir - tam işleme gerekir
+    image_format = render_profile['image_format'] if render_profile else DEFAULT_IMAGE_FORMAT
+    if entry.get('image_format', DEFAULT_IMAGE_FORMAT) != image_format:
+        return None
+    
+    # Render ayarları aynıysa sadece silinmiş görseller yeniden üretilir
+    if entry['render_key'] == render_key:
+        stale = [q for q in questions if not os.path.exists(q['filepath'])]
+    else:
+        stale = list(questions)
+    
+    if not stale:
+        print(f"⏭️  Değişiklik yok, atlanıyor: {entry['pdf_name']}")
+        return _result_from_manifest_entry(entry, cached=True)
+    
+    # Kesim planları işlenmiş sayfalara göre kayıtlı - sanal görünümler kaynak PDF'ten yeniden kurulur
+    with metrics.time('open'):
+        if entry.get('views') and os.path.exists(entry['source_path']):
+            doc = open_document(entry['source_path'], entry['views'])
+        elif entry.get('processed_pdf') and os.path.exists(entry['processed_pdf']):
+            doc = fitz.open(entry['processed_pdf'])
+        else:
+            return None
+    
+    print(f"♻️  Tespit sonuçları geçerli, {len(stale)} soru yeniden render ediliyor...")
+    
+    try:
+        jobs = [
+            (q['page'] - 1, crop_clip(q['question_rect'], doc.load_page(q['page'] - 1).rect), q['filepath'])
+            for q in stale
+        ]
+        results = render_crops(doc, jobs, render_workers, render_profile, metrics)
+    finally:
+        doc.close()
+        if isinstance(doc, VirtualDocument):
+            doc.source.close()
+    
+    for q, result in zip(stale, results):
+        if isinstance(result, Exception):
+            print(f"Soru {q['number']} yeniden render edilemedi: {result}")
+            metrics.count('render_errors')
+            return None
+        q['dimensions'] = result
+        metrics.count('questions_rendered')
+    
+    write_question_list(questions, os.path.join(entry['output_dir'], "question_list.txt"))
+    
+    entry['render_key'] = render_key
+    entry['render_profile'] = render_profile['name'] if render_profile else DEFAULT_RENDER_PROFILE
+    entry['image_bytes'] = sum(os.path.getsize(q['filepath']) for q in questions)
+    result = _result_from_manifest_entry(entry, cached=True)
+    result['rerendered'] = len(stale)
+    result['manifest_entry'] = entry
+    return result
+
+# Klasörde bu çalıştırmada üretilmeyen soru görsellerini silme
+def remove_stale_question_images(output_dir, keep_filenames):
+    """Önceki çalıştırmalardan kalan (örn. başka formatta) soru görsellerini siler - katalog çift kayıt içermesin"""
+    
+    keep_filenames = set(keep_filenames)
+    for filename in os.listdir(output_dir):
+        if QUESTION_FILENAME_RE.match(filename) and filename not in keep_filenames:
+            os.remove(os.path.join(output_dir, filename))
+
+def resolve_math_output(pdf_name, sections):
+    """Matematik testinin sayfa aralığı ve çıktı klasör adı - (None, pdf_name): tüm belge işlenir
+    
+    Matematik bölümü sadece ardından başka bir bölüm geliyorsa ayrılır; sadece matematik testi içeren
+    kitapçıklar cevap anahtarlarının bulunduğu output/<pdf adı> klasörüne yazılmaya devam eder.
+    """
+    math_section = sections.get_split(MATH_SECTION)
+    if math_section is None:
+        return None, pdf_name
+    
+    page_range = (math_section.start_page, math_section.end_page)
+    if pdf_name.endswith(MATH_TEST_PDF_SUFFIX):
+        return page_range, pdf_name
+    return page_range, f"{pdf_name}{MATH_OUTPUT_SUFFIX}"
+
+# Tek PDF işleme işi (toplu işlemde her PDF için ayrı çalışır)
+def process_pdf_job(pdf_path, output_base_dir="output", render_workers=1, previous_entry=None, save_processed_pdf=False,
+                    render_profile=None, report_savings=False, hooks=None):
+    """Tek bir PDF'i baştan sona işler ve rapor satırını döndürür - kendi fitz belgesini açar
+    
+    previous_entry verilirse ve PDF içeriği ile tespit ayarları değişmemişse önceki çıktı
+    yeniden kullanılır. Güncel manifesto girdisi sonuçta 'manifest_entry' olarak döner.
+    save_processed_pdf True ise bölünmüş sayfalar processed_*.pdf olarak da kaydedilir.
+    render_profile soru görsellerinin render profilidir (bkz. render_profiles; None: varsayılan).
+    report_savings True ise varsayılan render'a göre kazanılan bayt da ölçülür (ek render geçişi).
+    Aşama ölçümleri sonuçta 'metrics' anlık görüntüsü olarak döner; hooks verilirse olaylar anında bildirilir.
+    """
+    
+    if render_profile is None:
+        render_profile = resolve_render_profile()
+    
+    metrics = IngestMetrics(os.path.basename(pdf_path), hooks)
+    
+    try:
+        # PDF içeriği ve ayarlardan manifesto anahtarlarını hesapla
+        with metrics.time('hash'):
+            pdf_hash = file_sha256(pdf_path)
+        detect_key = settings_key(DETECTION_SETTINGS)
+        render_key = settings_key(render_settings(render_profile))
+        
+        if previous_entry and previous_entry.get('sha256') == pdf_hash and previous_entry.get('detect_key') == detect_key:
+            result = _reuse_manifest_entry(previous_entry, render_key, render_workers, render_profile, metrics)
+            if result is not None:
+                result['metrics'] = metrics.snapshot()
+                return result
+        
+        # PDF adından çıktı klasörü oluştur
+        pdf_name = os.path.splitext(os.path.basename(pdf_path))[0]
+        output_dir = os.path.join(output_base_dir, pdf_name)
+        
+        # Tüm test bölümlerini tek geçişte bul (ara PDF yazılmaz)
+        with metrics.time('section_detect'):
+            sections = SectionIndex.from_pdf(pdf_path)
+        for section in sections:
+            print(f"📑 {section.name} testi: Sayfa {section.start_page + 1} - {section.end_page}")
+        page_range, output_name = resolve_math_output(pdf_name, sections)
+        math_extracted = page_range is not None
+        output_dir = os.path.join(output_base_dir, output_name)
+        
+        # Hangi sayfaları işleyeceğimizi belirle
+        if math_extracted:
+            print(f"📚 Matematik testi bulundu, sadece matematik sayfaları işleniyor...")
+        else:
+            print(f"📄 Matematik testi bulunamadı, orijinal PDF işleniyor...")
+            page_range = None
         
-        print(f"Matematik testi sınırları aranıyor: {pdf_path}")
+        # Question extractor oluştur
+        extractor = QuestionExtractor(pdf_path, page_range=page_range, render_profile=render_profile, metrics=metrics)
         
-        start_page = None
-        end_page = None
+        # PDF'i ön işleme tabi tut
+        print("PDF ön işleme başlıyor...")
+        processed_doc = extractor.preprocess_pdf()
         
-        # Matematik testi başlangıç metni
-        math_start_text = "2. Cevaplarınızı, cevap kâğıdının Temel Matematik Testi için ayrılan kısmına işaretleyiniz."
+        # İşlenmiş PDF'i kaydet (isteğe bağlı - soru çıkarma sanal sayfalarla yapılır)
+        os.makedirs(output_dir, exist_ok=True)
+        processed_pdf_path = None
+        if save_processed_pdf:
+            processed_pdf_path = os.path.join(output_dir, f"processed_{pdf_name}.pdf")
+            processed_doc.save(processed_pdf_path)
+            print(f"İşlenmiş PDF kaydedildi: {processed_pdf_path}")
         
-        # Fen bilimleri testi başlangıç metni (matematik testi bitişi)
-        fen_start_text = "2. Cevaplarınızı, cevap kâğıdının Fen Bilimleri Testi için ayrılan kısmına işaretleyiniz."
+        # Tüm soruları çıkar
+        print("Soru çıkarma başlıyor...")
+        questions = extractor.extract_all_questions(output_dir, render_workers=render_workers)
+        remove_stale_question_images(output_dir, [q['filename'] for q in questions])
+        
+        # Görsel boyutları (ve istenirse varsayılan render'a göre kazanç)
+        image_bytes = sum(os.path.getsize(q['filepath']) for q in questions)
+        baseline_bytes = None
+        if report_savings:
+            baseline_bytes = measure_baseline_bytes(extractor.processed_doc, questions)
+        
+        # Soru listesini kaydet
+        question_list_path = os.path.join(output_dir, "question_list.txt")
+        extractor.save_question_list(question_list_path)
+        
+        extractor.doc.close()
+        extractor.processed_doc.close()
+        
+        print(f"✅ Başarıyla tamamlandı: {len(questions)} soru çıkarıldı")
+        
+        # Manifesto girdisi
+        entry = {
+            'pdf_name': os.path.basename(pdf_path),
+            'sha256': pdf_hash,
+            'detect_key': detect_key,
+            'render_key': render_key,
+            'image_format': render_profile['image_format'],
+            'render_profile': render_profile['name'],
+            'image_bytes': image_bytes,
+            'baseline_image_bytes': baseline_bytes,
+            'processed_source': os.path.basename(pdf_path),
+            'source_path': pdf_path,
+            'sections': [list(section) for section in sections],
+            'views': [list(view) for view in processed_doc.views],
+            'processed_pdf': processed_pdf_path,
+            'output_dir': output_dir,
+            'math_test_extracted': math_extracted,
+            'questions': questions
+        }
         
-        # Tüm sayfaları tara
-        for page_num in range(len(doc)):
-            page = doc[page_num]
-            page_text = page.get_text()
-            
-            # Matematik testi başlangıcını bul
-            if math_start_text in page_text and start_page is None:
-                start_page = page_num
-                print(f"✅ Matematik testi başlangıcı bulundu: Sayfa {page_num + 1}")
-            
-            # Fen bilimleri testi başlangıcını bul (matematik testi bitişi)
-            if fen_start_text in page_text and end_page is None:
-                end_page = page_num
-                print(f"✅ Matematik testi bitişi bulundu: Sayfa {page_num + 1}")
-                break  # İlk fen bilimleri testi bulunduğunda dur
+        # Rapor satırı
+        result = _result_from_manifest_entry(entry)
+        result['manifest_entry'] = entry
+        result['metrics'] = metrics.snapshot()
+        return result
         
-        if start_page is not None and end_page is not None:
-            print(f"📊 Matematik testi: Sayfa {start_page + 1} - {end_page} (toplam {end_page - start_page} sayfa)")
-            
-            # Yeni PDF oluştur
-            math_doc = fitz.open()
-            
-            # Matematik testi sayfalarını kopyala (ilk sayfa dahil, son sayfa hariç)
-            for page_num in range(start_page, end_page):
-                page = doc[page_num]
-                new_page = math_doc.new_page(width=page.rect.width, height=page.rect.height)
-                new_page.show_pdf_page(new_page.rect, doc, page_num)
-                print(f"   Sayfa {page_num + 1} kopyalandı")
-            
-            # Matematik testi PDF'ini kaydet
-            math_doc.save(output_path)
-            math_doc.close()
-            doc.close()
-            
-            print(f"✅ Matematik testi çıkarıldı: {output_path}")
-            print(f"📄 Sayfa sayısı: {end_page - start_page}")
-            
-            return True
-        else:
-            print("❌ Matematik testi sınırları bulunamadı!")
-            if start_page is None:
-                print("   - Matematik testi başlangıcı bulunamadı")
-            if end_page is None:
-                print("   - Fen bilimleri testi başlangıcı bulunamadı")
-            doc.close()
-            return False
-            
     except Exception as e:
-        print(f"❌ Matematik testi çıkarılırken hata: {e}")
-        return False
+        print(f"❌ Hata oluştu: {str(e)}")
+        return {
+            'pdf_name': os.path.basename(pdf_path),
+            'error': str(e),
+            'status': 'failed',
+            'metrics': metrics.snapshot()
+        }
 
 # Çoklu PDF işleme fonksiyonu
-def process_multiple_pdfs(pdf_directory=".", output_base_dir="output"):
-    """Birden fazla PDF dosyasını toplu olarak işler"""
+def process_multiple_pdfs(pdf_directory=".", output_base_dir="output", workers=1, render_workers=1, use_manifest=True, save_processed_pdf=False,
+                          render_profile=DEFAULT_RENDER_PROFILE, image_format=None, compress_level=None, write_pack=False,
+                          report_savings=False, hooks=None):
+    """Birden fazla PDF dosyasını toplu olarak işler
+    
+    workers > 1 ise her PDF ayrı bir süreçte işlenir (None/0: CPU sayısı kadar).
+    render_workers > 1 ise her PDF'in soru görselleri paralel render edilir.
+    use_manifest True ise içeriği ve ayarları değişmemiş PDF'ler atlanır.
+    save_processed_pdf True ise her PDF için processed_*.pdf de kaydedilir.
+    render_profile görsel render profilinin adıdır; image_format/compress_level verilirse profilin
+    kodlama ayarlarının yerine geçer. report_savings True ise PDF başına kazanılan bayt raporlanır.
+    write_pack True ise katalogdaki tüm görseller output/questions.pack paketine de yazılır (ek çıktı;
+    katalog ve bot'un katalog izleyicisi dosyalara dayandığı için soru görseli dosyaları yine yazılır).
+    Aşama süreleri ve sayaçlar output/ingest_metrics.json dosyasına yazılır. hooks (MetricsHook listesi)
+    seri işlemde her olayı anında alır; paralel işlemde her PDF'in olayları PDF bittiğinde ana süreçte
+    tekrar oynatılır. Her iki durumda da son olarak on_pdf_done çağrılır.
+    Sonuçlar her durumda PDF adı sırasına göre rapora eklenir.
+    """
     
     import glob
     import os
     from datetime import datetime
+    from concurrent.futures import ProcessPoolExecutor
     
-    # PDF dosyalarını bul
-    pdf_files = glob.glob(os.path.join(pdf_directory, "*.pdf"))
+    # PDF dosyalarını bul (deterministik sıra için sırala)
+    pdf_files = sorted(glob.glob(os.path.join(pdf_directory, "*.pdf")))
     
     # processed_sorular.pdf'yi hariç tut
     pdf_files = [f for f in pdf_files if not f.endswith("processed_sorular.pdf")]
@@ -831,89 +1221,105 @@ def process_multiple_pdfs(pdf_directory=".", output_base_dir="output"):
         'total_files': len(pdf_files),
         'processed_files': 0,
         'failed_files': 0,
+        'skipped_files': 0,
+        'rerendered_files': 0,
         'total_questions': 0,
+        'workers': 1,
         'results': []
     }
     
+    # Render profilini bir kez çöz (süreçlere sözlük olarak aktarılır)
+    profile = resolve_render_profile(render_profile, image_format=image_format, compress_level=compress_level)
+    batch_report['render_profile'] = profile['name']
+    
+    # Çalışan sayısını belirle
+    if not workers:
+        workers = os.cpu_count() or 1
+    workers = max(1, min(workers, len(pdf_files)))
+    batch_report['workers'] = workers
+    
+    # Önceki çalıştırmaların manifestosunu yükle
+    manifest = IngestionManifest(os.path.join(output_base_dir, MANIFEST_FILENAME)) if use_manifest else None
+    previous_entries = [
+        manifest.get(os.path.basename(pdf_path)) if manifest else None
+        for pdf_path in pdf_files
+    ]
+    
     # Her PDF'i işle
-    for i, pdf_path in enumerate(pdf_files, 1):
-        print(f"\n{'='*60}")
-        print(f"PDF {i}/{len(pdf_files)}: {os.path.basename(pdf_path)}")
-        print(f"{'='*60}")
-        
-        try:
-            # PDF adından çıktı klasörü oluştur
-            pdf_name = os.path.splitext(os.path.basename(pdf_path))[0]
-            output_dir = os.path.join(output_base_dir, pdf_name)
-            
-            # Önce matematik testi çıkarmayı dene
-            math_test_path = f"{pdf_name}_matematik_testi.pdf"
-            math_extracted = extract_math_test_from_pdf(pdf_path, math_test_path)
-            
-            # Hangi PDF'i kullanacağımızı belirle
-            if math_extracted:
-                print(f"📚 Matematik testi çıkarıldı, matematik testi işleniyor...")
-                pdf_to_process = math_test_path
-                output_dir = os.path.join(output_base_dir, f"{pdf_name}_matematik")
-            else:
-                print(f"📄 Matematik testi çıkarılamadı, orijinal PDF işleniyor...")
-                pdf_to_process = pdf_path
-            
-            # Question extractor oluştur
-            extractor = QuestionExtractor(pdf_to_process)
-            
-            # PDF'i ön işleme tabi tut
-            print("PDF ön işleme başlıyor...")
-            processed_doc = extractor.preprocess_pdf()
-            
-            # İşlenmiş PDF'i kaydet
-            processed_pdf_path = os.path.join(output_dir, f"processed_{pdf_name}.pdf")
-            os.makedirs(output_dir, exist_ok=True)
-            processed_doc.save(processed_pdf_path)
-            print(f"İşlenmiş PDF kaydedildi: {processed_pdf_path}")
-            
-            # Tüm soruları çıkar
-            print("Soru çıkarma başlıyor...")
-            questions = extractor.extract_all_questions(output_dir)
-            
-            # İstatistikleri al
-            stats = extractor.get_question_statistics()
-            
-            # Soru listesini kaydet
-            question_list_path = os.path.join(output_dir, "question_list.txt")
-            extractor.save_question_list(question_list_path)
-            
-            # Sonuçları rapora ekle
-            result = {
-                'pdf_name': os.path.basename(pdf_path),
-                'processed_pdf': os.path.basename(pdf_to_process),
-                'output_dir': output_dir,
-                'total_questions': stats['total_questions'],
-                'questions_by_side': stats['questions_by_side'],
-                'question_numbers': stats['question_numbers'],
-                'math_test_extracted': math_extracted,
-                'status': 'success'
-            }
-            batch_report['results'].append(result)
+    if workers == 1:
+        results = []
+        for i, pdf_path in enumerate(pdf_files, 1):
+            print(f"\n{'='*60}")
+            print(f"PDF {i}/{len(pdf_files)}: {os.path.basename(pdf_path)}")
+            print(f"{'='*60}")
+            results.append(process_pdf_job(
+                pdf_path, output_base_dir, render_workers, previous_entries[i - 1], save_processed_pdf,
+                profile, report_savings, hooks
+            ))
+    else:
+        print(f"\n{workers} paralel süreç ile işleniyor...")
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            # map girdi sırasını korur - rapor sırası deterministik kalır
+            results = list(executor.map(
+                process_pdf_job,
+                pdf_files,
+                [output_base_dir] * len(pdf_files),
+                [render_workers] * len(pdf_files),
+                previous_entries,
+                [save_processed_pdf] * len(pdf_files),
+                [profile] * len(pdf_files),
+                [report_savings] * len(pdf_files)
+            ))
+    
+    # Sonuçları rapora ekle
+    aggregate_metrics = IngestMetrics()
+    pdf_metrics = {}
+    for result in results:
+        entry = result.pop('manifest_entry', None)
+        if manifest is not None and entry is not None:
+            manifest.set(result['pdf_name'], entry)
+        
+        # Süreçlerden gelen ölçümleri birleştir
+        snapshot = result.pop('metrics', None)
+        if snapshot is not None:
+            pdf_metrics[result['pdf_name']] = snapshot
+            aggregate_metrics.merge(snapshot)
+            # Seri işlemde olaylar ölçülürken bildirildi; süreçlerdekiler burada tekrar oynatılır
+            if workers > 1:
+                replay_snapshot(snapshot, hooks)
+            for hook in hooks or []:
+                hook.on_pdf_done(result['pdf_name'], snapshot)
+        
+        batch_report['results'].append(result)
+        if result['status'] == 'success':
             batch_report['processed_files'] += 1
-            batch_report['total_questions'] += stats['total_questions']
-            
-            print(f"✅ Başarıyla tamamlandı: {stats['total_questions']} soru çıkarıldı")
-            
-        except Exception as e:
-            print(f"❌ Hata oluştu: {str(e)}")
-            result = {
-                'pdf_name': os.path.basename(pdf_path),
-                'error': str(e),
-                'status': 'failed'
-            }
-            batch_report['results'].append(result)
+            batch_report['total_questions'] += result['total_questions']
+            if result.get('rerendered'):
+                batch_report['rerendered_files'] += 1
+            elif result.get('cached'):
+                batch_report['skipped_files'] += 1
+        else:
             batch_report['failed_files'] += 1
     
+    # Manifestoyu kaydet
+    if manifest is not None:
+        manifest.save()
+    
+    # Bot'un yükleyeceği soru kataloğunu güncelle
+    catalog_path = write_catalog(output_base_dir)
+    
+    # İsteğe bağlı: tüm görselleri bot'un mmap ile okuyacağı tek pakete yaz
+    if write_pack:
+        write_pack_from_catalog(output_base_dir, QuestionCatalog.load(catalog_path))
+    
     # Toplu işlem raporunu kaydet
     batch_report['end_time'] = datetime.now()
     batch_report['duration'] = (batch_report['end_time'] - batch_report['start_time']).total_seconds()
     
+    # Aşama ölçümlerini kaydet
+    batch_report['metrics'] = aggregate_metrics.summary()
+    metrics_path = write_metrics_report(output_base_dir, pdf_metrics, aggregate_metrics)
+    
     # Raporu kaydet
     report_path = os.path.join(output_base_dir, "batch_report.txt")
     with open(report_path, 'w', encoding='utf-8') as f:
@@ -922,10 +1328,19 @@ def process_multiple_pdfs(pdf_directory=".", output_base_dir="output"):
         f.write(f"Bitiş Zamanı: {batch_report['end_time']}\n")
         f.write(f"Toplam Süre: {batch_report['duration']:.2f} saniye\n")
         f.write(f"Toplam PDF: {batch_report['total_files']}\n")
+        f.write(f"Paralel Süreç: {batch_report['workers']}\n")
+        f.write(f"Render Profili: {batch_report['render_profile']}\n")
         f.write(f"Başarılı: {batch_report['processed_files']}\n")
         f.write(f"Başarısız: {batch_report['failed_files']}\n")
+        f.write(f"Değişmeyen (yeniden kullanılan): {batch_report['skipped_files']}\n")
+        f.write(f"Sadece Görselleri Yeniden Üretilen: {batch_report['rerendered_files']}\n")
         f.write(f"Toplam Soru: {batch_report['total_questions']}\n\n")
         
+        f.write("=== AŞAMA SÜRELERİ (tüm PDF'ler) ===\n")
+        for line in format_stage_table(batch_report['metrics']):
+            f.write(line + "\n")
+        f.write(f"Ayrıntılı ölçümler: {metrics_path}\n\n")
+        
         f.write("=== DETAYLI SONUÇLAR ===\n")
         for result in batch_report['results']:
             f.write(f"\nPDF: {result['pdf_name']}\n")
@@ -934,9 +1349,15 @@ def process_multiple_pdfs(pdf_directory=".", output_base_dir="output"):
                 f.write(f"Çıktı Klasörü: {result['output_dir']}\n")
                 f.write(f"İşlenen PDF: {result['processed_pdf']}\n")
                 f.write(f"Matematik Testi Çıkarıldı: {'Evet' if result.get('math_test_extracted', False) else 'Hayır'}\n")
+                f.write(f"Önceki Çıktı Kullanıldı: {'Evet' if result.get('cached', False) else 'Hayır'}\n")
+                if result.get('rerendered'):
+                    f.write(f"Yeniden Render Edilen Görsel: {result['rerendered']}\n")
                 f.write(f"Soru Sayısı: {result['total_questions']}\n")
                 f.write(f"Sol Taraf: {result['questions_by_side']['sol']}\n")
                 f.write(f"Sağ Taraf: {result['questions_by_side']['sag']}\n")
+                if result.get('image_bytes') is not None:
+                    f.write(f"Görsel Boyutu: {result['image_bytes'] / 1024:.1f} KB ({result['render_profile']})\n")
+                    f.write(f"Kazanılan Bayt: {format_bytes_saved(result['image_bytes'], result.get('baseline_image_bytes'))}\n")
             else:
                 f.write(f"Hata: {result['error']}\n")
             f.write("-" * 50 + "\n")
@@ -947,9 +1368,14 @@ def process_multiple_pdfs(pdf_directory=".", output_base_dir="output"):
     print(f"Toplam PDF: {batch_report['total_files']}")
     print(f"Başarılı: {batch_report['processed_files']}")
     print(f"Başarısız: {batch_report['failed_files']}")
+    print(f"Değişmeyen: {batch_report['skipped_files']}")
+    print(f"Sadece görselleri yeniden üretilen: {batch_report['rerendered_files']}")
     print(f"Toplam Soru: {batch_report['total_questions']}")
     print(f"Süre: {batch_report['duration']:.2f} saniye")
+    for line in format_stage_table(batch_report['metrics']):
+        print(f"  {line}")
     print(f"Rapor: {report_path}")
+    print(f"Ölçümler: {metrics_path}")
     
     return batch_report
 
@@ -1002,7 +1428,36 @@ def process_single_pdf():
 # Ana fonksiyon
 def main():
     """Ana fonksiyon - çoklu PDF işleme"""
-    return process_multiple_pdfs()
+    
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="PDF'lerden soruları toplu olarak çıkarır")
+    parser.add_argument('--pdf-dir', default=".", help="PDF dosyalarının bulunduğu klasör")
+    parser.add_argument('--output-dir', default="output", help="Çıktı klasörü")
+    parser.add_argument('--workers', type=int, default=1, help="Paralel süreç sayısı (0: CPU sayısı kadar)")
+    parser.add_argument('--render-workers', type=int, default=1, help="PDF başına paralel render süreci sayısı")
+    parser.add_argument('--force', action='store_true', help="Manifestoyu yok say, tüm PDF'leri yeniden işle")
+    parser.add_argument('--save-processed-pdf', action='store_true', help="Bölünmüş sayfaları processed_*.pdf olarak da kaydet")
+    parser.add_argument('--render-profile', choices=sorted(RENDER_PROFILES), default=DEFAULT_RENDER_PROFILE, help="Soru görseli render profili")
+    parser.add_argument('--image-format', choices=sorted(IMAGE_FORMATS), default=None, help="Soru görseli formatı (profildekinin yerine)")
+    parser.add_argument('--pack', action='store_true', help="Görselleri tek paket dosyasına da yaz (output/questions.pack) - görsel dosyaları yine yazılır")
+    parser.add_argument('--compress-level', type=int, default=None, help="PNG için zlib seviyesi (0-9), WebP için kalite (0-100)")
+    parser.add_argument('--report-savings', action='store_true', help="PDF başına varsayılan render'a göre kazanılan baytı raporla")
+    args = parser.parse_args()
+    
+    return process_multiple_pdfs(
+        args.pdf_dir,
+        args.output_dir,
+        workers=args.workers,
+        render_workers=args.render_workers,
+        use_manifest=not args.force,
+        save_processed_pdf=args.save_processed_pdf,
+        render_profile=args.render_profile,
+        image_format=args.image_format,
+        compress_level=args.compress_level,
+        write_pack=args.pack,
+        report_savings=args.report_savings
+    )
 
 if __name__ == "__main__":
     result = main()
@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Soru görseli paket modülü
+Tüm soru görsellerini tek bir paket dosyasına ekler; bot paketi mmap ile açar ve her görseli
+kopyalamadan (memoryview dilimi olarak) okur. Dağıtım catalog.json + tek paket dosyası kopyasıdır.
+
+Dosya düzeni (little-endian):
+    başlık   : MAGIC (8 bayt) + sürüm (uint32)
+    veriler  : görsel baytları art arda
+    indeks   : her görsel için sabit genişlikte (offset uint64, uzunluk uint32)
+    isimler  : görsel adlarının JSON listesi (UTF-8)
+    son ek   : indeks offset'i (uint64), görsel sayısı (uint32), isim offset'i (uint64),
+               isim uzunluğu (uint32), MAGIC (8 bayt)
+"""
+
+import json
+import mmap
+import os
+import struct
+from typing import Dict, List, Optional
+
+from image_sinks import ImageSink
+
+PACK_FILENAME = "questions.pack"
+PACK_MAGIC = b'SORUPAK\x00'
+PACK_VERSION = 1
+
+HEADER = struct.Struct('<8sI')
+INDEX_ENTRY = struct.Struct('<QI')
+FOOTER = struct.Struct('<QIQI8s')
+
+class PackWriter:
+    def __init__(self, path: str):
+        """Paketi geçici dosyaya yazmaya başla - close() ile atomik olarak yerine taşınır"""
+        self.path = path
+        self.tmp_path = f"{path}.tmp"
+        self.index = []  # (offset, uzunluk)
+        self.names = []
+        
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        
+        self._file = open(self.tmp_path, 'wb')
+        self._file.write(HEADER.pack(PACK_MAGIC, PACK_VERSION))
+        self._offset = HEADER.size
+    
+    def add(self, name: str, data: bytes) -> int:
+        """Görseli pakete ekle ve paket içindeki sırasını döndür"""
+        self._file.write(data)
+        self.index.append((self._offset, len(data)))
+        self.names.append(name)
+        self._offset += len(data)
+        return len(self.index) - 1
+    
+    def close(self):
+        """İndeks ve son eki yaz, paketi yerine taşı"""
+        if self._file is None:
+            return
+        
+        index_offset = self._offset
+        for offset, length in self.index:
+            self._file.write(INDEX_ENTRY.pack(offset, length))
+        
+        names_offset = index_offset + INDEX_ENTRY.size * len(self.index)
+        names_data = json.dumps(self.names, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+        self._file.write(names_data)
+        
+        self._file.write(FOOTER.pack(index_offset, len(self.index), names_offset, len(names_data), PACK_MAGIC))
+        self._file.close()
+        self._file = None
+        os.replace(self.tmp_path, self.path)
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        elif self._file is not None:
+            # Hata durumunda yarım paketi bırakma
+            self._file.close()
+            self._file = None
+            os.remove(self.tmp_path)
+
+class PackSink(ImageSink):
+    """Soru görsellerini küçük dosyalar yerine pakete yazan hedef
+    
+    Toplu işlem paketi katalogdan üretir (write_pack_from_catalog); bu hedef tek bir PDF'in
+    görsellerini doğrudan pakete yazmak için iter_questions(sink=...) ile kullanılabilir.
+    """
+    
+    def __init__(self, writer: PackWriter, prefix: str = ""):
+        self.writer = writer
+        self.prefix = prefix
+    
+    def put(self, filename: str, data: bytes) -> str:
+        name = os.path.join(self.prefix, filename) if self.prefix else filename
+        self.writer.add(name, data)
+        return name
+
+class QuestionPack:
+    def __init__(self, path: str):
+        """Paketi salt okunur mmap ile aç ve indeksini doğrula"""
+        self.path = path
+        with open(path, 'rb') as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self._view = memoryview(self._mmap)
+        
+        try:
+            magic, version = HEADER.unpack_from(self._mmap, 0)
+            index_offset, count, names_offset, names_length, footer_magic = FOOTER.unpack_from(
+                self._mmap, len(self._mmap) - FOOTER.size
+            )
+            if magic != PACK_MAGIC or footer_magic != PACK_MAGIC or version != PACK_VERSION:
+                raise ValueError(f"Geçersiz paket dosyası: {path}")
+        except Exception:
+            self.close()
+            raise
+        
+        self.index_offset = index_offset
+        self.count = count
+        self.names: List[str] = json.loads(bytes(self._view[names_offset:names_offset + names_length]).decode('utf-8'))
+        self.id_by_name: Dict[str, int] = {name: i for i, name in enumerate(self.names)}
+    
+    def __len__(self):
+        return self.count
+    
+    def get(self, item_id: int) -> memoryview:
+        """Görseli kopyalamadan memoryview dilimi olarak döndür"""
+        if not 0 <= item_id < self.count:
+            raise IndexError(item_id)
+        offset, length = INDEX_ENTRY.unpack_from(self._mmap, self.index_offset + item_id * INDEX_ENTRY.size)
+        return self._view[offset:offset + length]
+    
+    def get_by_name(self, name: str) -> Optional[memoryview]:
+        """Görseli adıyla döndür (pakette yoksa None)"""
+        item_id = self.id_by_name.get(name)
+        if item_id is None:
+            return None
+        return self.get(item_id)
+    
+    def close(self):
+        """mmap'i kapat - dışarıda tutulan dilimler varsa kapatma GC'ye kalır"""
+        try:
+            self._view.release()
+            self._mmap.close()
+        except BufferError:
+            pass
+
+def write_pack_from_catalog(output_dir: str, catalog) -> str:
+    """Katalogdaki görselleri id sırasıyla tek pakete yazar (bot görselleri yol adıyla arar)
+    
+    Paket ek bir çıktıdır: görseller klasörlerdeki dosyalardan okunur ve dosyalar silinmez.
+    Katalog, manifesto ve bot'un katalog izleyicisi soru görseli dosyalarına dayanır.
+    """
+    pack_path = os.path.join(output_dir, PACK_FILENAME)
+    
+    with PackWriter(pack_path) as writer:
+        sink = PackSink(writer)
+        for entry in catalog.entries:
+            if entry is None:
+                continue
+            with open(entry.image_path, 'rb') as f:
+                sink.put(entry.image_path, f.read())
+    
+    print(f"Soru paketi kaydedildi: {pack_path} ({len(catalog)} görsel)")
+    return pack_path
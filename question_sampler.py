@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Soru örnekleme modülü
+Her kullanıcıya soru bankasının rastgele bir permütasyonunu tekrarsız olarak sunar. Permütasyon
+saklanmaz; Feistel ağı ile (tohum, sıra) çiftinden O(1) hesaplanır. Kullanıcı başına durum
+(tohum, imleç, tur boyutu) üçlüsüdür; banka büyüdüğünde süren tur bozulmaz.
+"""
+
+import random
+from typing import Optional, Tuple
+
+MASK64 = (1 << 64) - 1
+
+# Tohum bit sayısı - SQLite INTEGER (işaretli 64 bit) sütununa sığar
+SEED_BITS = 63
+GOLDEN_GAMMA = 0x9E3779B97F4A7C15
+
+# Feistel tur sayısı - 4 tur rastgele görünen bir permütasyon için yeterli
+FEISTEL_ROUNDS = 4
+
+def mix64(value: int) -> int:
+    """splitmix64 karıştırma fonksiyonu"""
+    value = (value + GOLDEN_GAMMA) & MASK64
+    value = ((value ^ (value >> 30)) * 0xBF58476D1CE4E5B9) & MASK64
+    value = ((value ^ (value >> 27)) * 0x94D049BB133111EB) & MASK64
+    return value ^ (value >> 31)
+
+def permute(index: int, size: int, seed: int) -> int:
+    """[0, size) üzerinde tohuma bağlı permütasyonun index. elemanı
+    
+    Dengeli Feistel ağı 2^(2k) >= size alanında bir eşleme kurar; aralık dışına düşen
+    değerler aralığa girene kadar yeniden şifrelenir (cycle walking, ortalama < 4 adım).
+    """
+    if not 0 <= index < size:
+        raise IndexError(index)
+    if size == 1:
+        return 0
+    
+    half_bits = max(1, ((size - 1).bit_length() + 1) // 2)
+    half_mask = (1 << half_bits) - 1
+    keys = [mix64(seed ^ ((round_no * GOLDEN_GAMMA) & MASK64)) for round_no in range(FEISTEL_ROUNDS)]
+    
+    value = index
+    while True:
+        left = value >> half_bits
+        right = value & half_mask
+        for key in keys:
+            left, right = right, left ^ (mix64(right ^ key) & half_mask)
+        value = (left << half_bits) | right
+        if value < size:
+            return value
+
+# Kullanıcı durumu: (tohum, imleç, tur boyutu)
+SamplerState = Tuple[int, int, int]
+
+class QuestionSampler:
+    def __init__(self, rng: Optional[random.Random] = None):
+        """Tekrarsız soru örnekleyici - durum dışarıda (kullanıcı durumunda) saklanır"""
+        self.rng = rng or random.Random()
+    
+    def _new_seed(self, size: int, avoid: Optional[int] = None) -> int:
+        """Yeni tohum - yeni turun ilk sorusu önceki turun son sorusu olmasın"""
+        seed = self.rng.getrandbits(SEED_BITS)
+        while avoid is not None and size > 1 and permute(0, size, seed) == avoid:
+            seed = self.rng.getrandbits(SEED_BITS)
+        return seed
+    
+    def advance(self, state: Optional[SamplerState], size: int) -> Tuple[Optional[int], Optional[SamplerState]]:
+        """Verilen durumdan sıradaki soru id'si ve yeni durum
+        
+        Banka büyüdüyse (yeni kitapçık) süren tur eski boyutla tamamlanır, yeni id'ler sonraki
+        turdan itibaren gelir. Banka küçüldüyse (id'ler artık yok) yeni tur başlar.
+        """
+        if size <= 0:
+            return None, state
+        
+        if state is None or state[2] > size:
+            seed, cursor, round_size = self._new_seed(size), 0, size
+        else:
+            seed, cursor, round_size = state
+        
+        question_id = permute(cursor, round_size, seed)
+        cursor += 1
+        
+        # Tur bitti - yeni tur bankanın güncel boyutuyla başlar
+        if cursor >= round_size:
+            seed, cursor, round_size = self._new_seed(size, avoid=question_id), 0, size
+        
+        return question_id, (seed, cursor, round_size)
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Render profili modülü
+Soru kesimlerinin çözünürlüğünü ve görsel optimizasyonunu belirler: hedef piksel genişliği,
+sadece metin içeren kesimler için gri ton / palet, beyaz kenar kırpma ve WebP.
+'default' profili eski davranışla (2x zoom, kayıpsız RGB PNG) birebir aynıdır.
+"""
+
+from typing import Dict, Optional, Tuple
+
+from image_sinks import encode_image, encode_pixmap, image_extension
+
+DEFAULT_RENDER_PROFILE = 'default'
+
+RENDER_PROFILES = {
+    'default': {
+        'zoom': 2.0,  # Sabit zoom (target_width yoksa)
+        'target_width': None,  # Kesim bu piksel genişliğine ölçeklenir
+        'trim': False,  # Beyaz kenarları kırp
+        'grayscale': False,  # True: her zaman, 'auto': renk içermeyen kesimlerde
+        'palette_colors': None,  # Gri/renkli görseli bu kadar renge indir (PNG)
+        'image_format': 'png',
+        'compress_level': None,
+    },
+    'compact': {
+        'zoom': None,
+        'target_width': 640,
+        'trim': True,
+        'grayscale': 'auto',
+        'palette_colors': 16,
+        'image_format': 'png',
+        'compress_level': 9,
+    },
+    'webp': {
+        'zoom': None,
+        'target_width': 800,
+        'trim': True,
+        'grayscale': 'auto',
+        'palette_colors': None,
+        'image_format': 'webp',
+        'compress_level': 80,
+    },
+}
+
+# Beyaz kenar kırpma ayarları
+TRIM_THRESHOLD = 245  # Bu değerden koyu pikseller içerik sayılır
+TRIM_MARGIN_PX = 8  # İçeriğin etrafında bırakılan boşluk
+
+# Kanallar arası bu farktan küçükse kesim renksiz (sadece metin) sayılır
+GRAYSCALE_TOLERANCE = 12
+
+def resolve_render_profile(name: str = DEFAULT_RENDER_PROFILE, **overrides) -> Dict:
+    """Profili adıyla al ve verilen (None olmayan) alanları üzerine yaz"""
+    if name not in RENDER_PROFILES:
+        raise ValueError(f"Bilinmeyen render profili: {name}")
+    
+    profile = dict(RENDER_PROFILES[name], name=name)
+    for key, value in overrides.items():
+        if value is not None:
+            profile[key] = value
+    
+    image_extension(profile['image_format'])
+    return profile
+
+def is_default_profile(profile: Optional[Dict]) -> bool:
+    """Profil eski varsayılan render ile aynı çıktıyı mı üretiyor"""
+    if profile is None:
+        return True
+    return all(profile.get(key) == value for key, value in RENDER_PROFILES[DEFAULT_RENDER_PROFILE].items())
+
+def profile_zoom(profile: Dict, clip_width: float) -> float:
+    """Kesim genişliğine göre zoom faktörü"""
+    if profile.get('target_width') and clip_width > 0:
+        return profile['target_width'] / clip_width
+    return profile['zoom']
+
+def trim_whitespace(image, threshold: int = TRIM_THRESHOLD, margin: int = TRIM_MARGIN_PX):
+    """Görselin etrafındaki beyaz alanı kırpar"""
+    mask = image.convert('L').point(lambda v: 255 if v < threshold else 0)
+    bbox = mask.getbbox()
+    if bbox is None:
+        return image
+    
+    x0, y0, x1, y1 = bbox
+    return image.crop((
+        max(0, x0 - margin),
+        max(0, y0 - margin),
+        min(image.width, x1 + margin),
+        min(image.height, y1 + margin)
+    ))
+
+def is_grayscale(image, tolerance: int = GRAYSCALE_TOLERANCE) -> bool:
+    """Görsel renk içermiyor mu (sadece metin/siyah-beyaz çizim)"""
+    from PIL import ImageChops
+    
+    if image.mode == 'L':
+        return True
+    
+    r, g, b = image.convert('RGB').split()
+    return (
+        ImageChops.difference(r, g).getextrema()[1] <= tolerance
+        and ImageChops.difference(g, b).getextrema()[1] <= tolerance
+    )
+
+def optimize_pixmap(pix, profile: Dict) -> Tuple[bytes, Tuple[int, int]]:
+    """Pixmap'i profile göre optimize edip kodlar - (baytlar, (genişlik, yükseklik)) döndürür"""
+    
+    # Optimizasyon yoksa doğrudan kodla (varsayılan yol)
+    if not profile.get('trim') and not profile.get('grayscale') and not profile.get('palette_colors'):
+        return encode_pixmap(pix, profile['image_format'], profile['compress_level']), (pix.width, pix.height)
+    
+    from PIL import Image
+    
+    image = Image.frombytes("RGBA" if pix.alpha else "RGB", (pix.width, pix.height), pix.samples)
+    
+    if profile.get('trim'):
+        image = trim_whitespace(image)
+    
+    # Sadece metin içeren kesimler gri tona veya küçük bir palete indirilir
+    gray = profile.get('grayscale') is True or (profile.get('grayscale') == 'auto' and is_grayscale(image))
+    if gray:
+        if profile.get('palette_colors') and profile['image_format'] == 'png':
+            # 16 renk -> PNG'de 4 bit piksel
+            image = image.convert('RGB').quantize(colors=profile['palette_colors'])
+        else:
+            image = image.convert('L')
+    
+    return encode_image(image, profile['image_format'], profile['compress_level']), image.size
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Test bölümü bulma modülü
+Kitapçıktaki tüm test başlangıç işaretlerini tek geçişte indeksler ve sayfa aralıklarını verir.
+Ara PDF yazılmaz; aralıklar doğrudan kaynak belge üzerinde kullanılır.
+"""
+
+import re
+from collections import namedtuple
+from typing import Dict, List, Optional
+
+import fitz  # PyMuPDF
+
+# Matematik testinin bölüm adı
+MATH_SECTION = "Temel Matematik"
+
+# "2. Cevaplarınızı, cevap kâğıdının <Ad> Testi için ayrılan kısmına işaretleyiniz."
+SECTION_MARKER_RE = re.compile(
+    r'2\.\s*Cevaplarınızı,\s*cevap kâğıdının\s+(.+?)\s+Testi\s+için\s+ayrılan\s+kısmına\s+işaretleyiniz\.'
+)
+
+# Bölüm başlangıcı: ad, sayfa ve işaret metninin bbox'ı
+SectionMarker = namedtuple('SectionMarker', ['name', 'page', 'bbox'])
+
+# Bölüm sayfa aralığı: [start_page, end_page) - bitiş hariç
+Section = namedtuple('Section', ['name', 'start_page', 'end_page'])
+
+def find_markers_on_page(page) -> List[SectionMarker]:
+    """Sayfadaki bölüm başlangıç işaretlerini metin bloklarından bulur"""
+    
+    markers = []
+    for block in page.get_text("blocks"):
+        x0, y0, x1, y1, text = block[:5]
+        # İşaret içermeyen bloklarda regex çalıştırma
+        if 'Cevaplarınızı' not in text:
+            continue
+        
+        # Blok içindeki satır sonlarını boşluğa çevir
+        text = ' '.join(text.split())
+        for match in SECTION_MARKER_RE.finditer(text):
+            markers.append(SectionMarker(match.group(1), page.number, (x0, y0, x1, y1)))
+    
+    # Sayfa içinde yukarıdan aşağıya sırala
+    markers.sort(key=lambda marker: marker.bbox[1])
+    return markers
+
+class SectionIndex:
+    """Kitapçıktaki bölüm başlangıçlarının indeksi - her bölüm bir sonraki bölüme (veya belge sonuna) kadar sürer"""
+    
+    def __init__(self, markers: List[SectionMarker], page_count: int):
+        self.page_count = page_count
+        self.markers = []
+        self._closed = set()  # Ardından başka bir bölüm gelen (sonu işaretle belli) bölümler
+        
+        # Aynı bölüm adı birden fazla geçerse ilki kullanılır
+        seen = set()
+        for marker in markers:
+            if marker.name not in seen:
+                seen.add(marker.name)
+                self.markers.append(marker)
+        
+        self.sections = []
+        for i, marker in enumerate(self.markers):
+            end_page = self.markers[i + 1].page if i + 1 < len(self.markers) else page_count
+            if end_page > marker.page:
+                self.sections.append(Section(marker.name, marker.page, end_page))
+                if i + 1 < len(self.markers):
+                    self._closed.add(marker.name)
+        self._by_name = {section.name: section for section in self.sections}
+    
+    @classmethod
+    def from_document(cls, doc) -> 'SectionIndex':
+        """Belgeyi tek geçişte tarayarak indeksi oluşturur"""
+        
+        markers = []
+        for page_num in range(len(doc)):
+            markers.extend(find_markers_on_page(doc.load_page(page_num)))
+        return cls(markers, len(doc))
+    
+    @classmethod
+    def from_pdf(cls, pdf_path: str) -> 'SectionIndex':
+        """PDF dosyasını açıp indeksi oluşturur"""
+        
+        doc = fitz.open(pdf_path)
+        try:
+            return cls.from_document(doc)
+        finally:
+            doc.close()
+    
+    def __len__(self):
+        return len(self.sections)
+    
+    def __iter__(self):
+        return iter(self.sections)
+    
+    def get(self, name: str) -> Optional[Section]:
+        """Bölüm adına göre sayfa aralığını döndürür"""
+        return self._by_name.get(name)
+    
+    def get_split(self, name: str) -> Optional[Section]:
+        """Bölüm ayrı test olarak çıkarılabiliyorsa aralığını döndürür
+        
+        Bölümün ardından başka bir bölüm gelmelidir; son bölüm belge sonuna kadar sürdüğü için
+        (ör. sadece matematik testi içeren kitapçıklar) bölünmüş sayılmaz.
+        """
+        if name not in self._closed:
+            return None
+        return self._by_name.get(name)
+    
+    def page_ranges(self) -> Dict[str, range]:
+        """Bölüm adı -> sayfa aralığı"""
+        return {section.name: range(section.start_page, section.end_page) for section in self.sections}
+
+def write_section_pdf(doc, section: Section, output_path: str):
+    """Bölümün sayfalarını ayrı bir PDF olarak kaydeder (sadece açıkça istendiğinde)"""
+    
+    section_doc = fitz.open()
+    try:
+        section_doc.insert_pdf(doc, from_page=section.start_page, to_page=section.end_page - 1)
+        section_doc.save(output_path)
+    finally:
+        section_doc.close()
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Span sınıflandırma modülü
+Soru numarası, talimat, şık ve içerik tespiti için önceden derlenmiş, birleştirilmiş pattern'ler.
+Her span tek seferde sınıflandırılır; QuestionExtractor'daki kontroller bu fonksiyonları kullanır.
+"""
+
+import re
+from typing import Optional, Tuple
+
+# Geçerli soru numarası aralığı
+QUESTION_NUMBER_MIN = 1
+QUESTION_NUMBER_MAX = 50
+
+# Span türleri
+SPAN_QUESTION_NUMBER = 'question_number'
+SPAN_INSTRUCTION = 'instruction'
+SPAN_CHOICE = 'choice'
+SPAN_CONTENT = 'content'
+
+def _keywords(words) -> 're.Pattern':
+    """Anahtar kelime listesinden tek bir alternation pattern'i derle"""
+    return re.compile('|'.join(re.escape(word) for word in words))
+
+# "1. " / "Soru 1" / "1 - " - satır başında en fazla bir alternatif eşleşebilir
+QUESTION_NUMBER_RE = re.compile(r'^(?:(\d+)\.\s*|Soru\s*(\d+)|(\d+)\s*-\s*)')
+
+# Sadece numaradan oluşan soru başlangıcı ("X." veya "Soru X")
+QUESTION_START_RE = re.compile(r'^\d+\.\s*$|^Soru\s*\d+\s*$')
+BARE_NUMBER_RE = re.compile(r'^\d+\.\s*$')
+
+# Satırın herhangi bir yerinde soru numarası (soru sonu kontrolü için)
+NEXT_QUESTION_RE = re.compile(r'(\d+)\.\s*|Soru\s*(\d+)|(\d+)\s*-\s*')
+
+# Çok spesifik talimat pattern'leri - sadece gerçek talimatlar
+INSTRUCTION_RE = re.compile(
+    r'^\d+\.\s*(?:Bu testte|Test süresi|Sınav başlamadan önce|Talimatlar|Yönergeler|Cevaplarınızı.*işaretleyiniz)'
+)
+
+# Talimat içinde matematik içeriği kontrolü
+DIGIT_RE = re.compile(r'[0-9]')
+INSTRUCTION_MATH_OPERATOR_RE = re.compile(r'[+\-*/=]')
+QUESTION_WORD_RE = re.compile(r'kaçtır|bulunuz|hesaplayınız|olduğuna göre')
+
+# Matematik içeriği kontrolü
+INSTRUCTION_KEYWORD_RE = _keywords([
+    'Bu testte', 'Cevaplarınızı', 'Test süresi', 'Sınav başlamadan',
+    'Talimatlar', 'Yönergeler', 'işaretleyiniz'
+])
+MATH_INDICATOR_RE = re.compile(
+    r'[+\-*/]'  # Matematik operatörleri
+    r'|kaçtır\?|bulunuz|hesaplayınız'  # Soru kelimeleri
+    r'|olduğuna göre|eşittir|çarpım|toplam'  # Matematik terimleri
+    r'|[A-E]\)'  # Şık işaretleri
+    r'|şekilde|grafik|diyagram'  # Görsel terimler
+    r'|cm|kg|m|°|%'  # Birimler
+)
+
+# İlk sayfadaki talimat kutusu satırları
+INSTRUCTION_BOX_KEYWORD_RE = _keywords(['Bu testte', 'Cevaplarınızı', 'Temel Matemati', 'Test süresi', 'Talimatlar'])
+
+# Soru numarası span'ında olmaması gereken içerik kelimeleri
+QUESTION_CONTENT_INDICATOR_RE = _keywords(['saat', 'dakika', 'gün', 'Mart', 'matematik', 'geometri', 'öğretmen', 'ders'])
+QUESTION_CONTENT_WORD_RE = _keywords([
+    'saat', 'dakika', 'gün', 'Mart', 'matematik', 'geometri', 'öğretmen', 'ders', 'vermiştir', 'toplam'
+])
+
+# Şık pattern'leri
+CHOICE_START_RE = re.compile(r'^[A-E]\)')  # A) B) C) D) E)
+CHOICE_LINE_RE = re.compile(r'^[A-E](?:\.|\s*\))')  # A) / A. / A )
+
+def match_question_number(text: str) -> Optional[int]:
+    """Satır başındaki soru numarasını döndürür (aralık kontrolü yapılmaz)"""
+    match = QUESTION_NUMBER_RE.match(text)
+    if not match:
+        return None
+    return int(match.group(1) or match.group(2) or match.group(3))
+
+def is_valid_question_number(number: Optional[int]) -> bool:
+    """Soru numarası geçerli aralıkta mı"""
+    return number is not None and QUESTION_NUMBER_MIN <= number <= QUESTION_NUMBER_MAX
+
+def is_instruction(line: str) -> bool:
+    """Satırın talimat mı soru mu olduğunu kontrol eder"""
+    if not INSTRUCTION_RE.match(line):
+        return False
+    
+    # Talimat pattern'i varsa ama matematik içeriği de varsa, bu bir soru olabilir
+    if DIGIT_RE.search(line) and (INSTRUCTION_MATH_OPERATOR_RE.search(line) or QUESTION_WORD_RE.search(line)):
+        return False
+    
+    return True
+
+def has_math_content(line: str) -> bool:
+    """Satırda matematik içeriği var mı kontrol eder - talimatları hariç tutar"""
+    if INSTRUCTION_KEYWORD_RE.search(line):
+        return False
+    
+    # Sayılar + matematik terimleri birlikte olmalı
+    return bool(DIGIT_RE.search(line)) and bool(MATH_INDICATOR_RE.search(line))
+
+def is_question_start(text: str, question_number: int, span_info=None) -> bool:
+    """Bir metnin gerçekten soru başlangıcı olup olmadığını kontrol eder"""
+    text = text.strip()
+    
+    # Satır başında sayı kontrolü - sadece "X." formatında olmalı
+    if not QUESTION_START_RE.match(text):
+        return False
+    
+    # İçinde soru içeriği olmamalı (sadece numara olmalı)
+    if len(text) > 15:
+        return False
+    
+    if not is_valid_question_number(question_number):
+        return False
+    
+    if QUESTION_CONTENT_INDICATOR_RE.search(text):
+        return False
+    
+    # Font kalınlığı kontrolü - kalın değilse sadece "X." kabul edilir
+    if span_info and 'flags' in span_info:
+        is_bold = bool(span_info['flags'] & 16)  # Bold flag
+        if not is_bold and not BARE_NUMBER_RE.match(text):
+            return False
+    
+    return True
+
+def is_choice_line(line: str) -> bool:
+    """Satır bir şık mı (A) / A. / A ))"""
+    return bool(CHOICE_LINE_RE.match(line))
+
+def classify_span(text: str, span_info=None) -> Tuple[str, Optional[int]]:
+    """Span'ı tek seferde sınıflandırır - (tür, satır başındaki soru numarası) döndürür"""
+    number = match_question_number(text)
+    
+    if is_instruction(text):
+        return SPAN_INSTRUCTION, number
+    
+    if (
+        is_valid_question_number(number)
+        and is_question_start(text, number, span_info)
+        and len(text.strip()) <= 20  # Çok uzun metinler soru içeriği içerir
+        and not QUESTION_CONTENT_WORD_RE.search(text)
+    ):
+        return SPAN_QUESTION_NUMBER, number
+    
+    if CHOICE_START_RE.match(text):
+        return SPAN_CHOICE, number
+    
+    return SPAN_CONTENT, number
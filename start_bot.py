@@ -23,16 +23,24 @@ def check_requirements():
         print("Lütfen önce PDF işleme yapın: python question_extractor.py")
         return False
     
-    # Soru dosyaları kontrolü
-    import glob
-    question_files = glob.glob(os.path.join(BOT_CONFIG['OUTPUT_DIR'], "**", "soru_*.png"), recursive=True)
+    # Soru dosyaları kontrolü (katalog varsa ondan, yoksa klasörden)
+    from question_catalog import CATALOG_FILENAME, QuestionCatalog
+    catalog_path = os.path.join(BOT_CONFIG['OUTPUT_DIR'], CATALOG_FILENAME)
+    if os.path.exists(catalog_path):
+        question_count = len(QuestionCatalog.load(catalog_path))
+    else:
+        import glob
+        question_count = sum(
+            len(glob.glob(os.path.join(BOT_CONFIG['OUTPUT_DIR'], "**", pattern), recursive=True))
+            for pattern in ("soru_*.png", "soru_*.webp")
+        )
     
-    if not question_files:
+    if not question_count:
         print("❌ Hiç soru dosyası bulunamadı!")
         print("Lütfen önce PDF işleme yapın: python question_extractor.py")
         return False
     
-    print(f"✅ {len(question_files)} soru dosyası bulundu")
+    print(f"✅ {question_count} soru dosyası bulundu")
     return True
 
 def main():
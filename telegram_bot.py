@@ -1,11 +1,21 @@
 import os
 import random
-import glob
-import json
+import asyncio
 from telegram import Update, InlineKeyboardButton, InlineKeyboardMarkup
+from telegram.error import BadRequest
 from telegram.ext import Application, CommandHandler, MessageHandler, CallbackQueryHandler, filters, ContextTypes
 import logging
-from answer_key_extractor import process_answer_key_pdfs
+from answer_keys import find_stale_answer_keys, load_answer_key_jsons
+from bot_config import BOT_CONFIG
+from bot_metrics import METRICS, MetricsServer, cache_samples
+from catalog_watcher import CatalogWatcher
+from file_id_cache import FileIdCache
+from image_cache import ImageBytesCache
+from update_processor import PerChatUpdateProcessor
+from question_catalog import CATALOG_FILENAME, UNKNOWN_ANSWER, QuestionCatalog, list_question_folders, resolve_answer, write_catalog
+from question_pack import PACK_FILENAME, QuestionPack
+from question_sampler import QuestionSampler
+from user_state import UserStateStore, is_quota_exempt
 
 # Logging ayarları
 logging.basicConfig(
@@ -18,124 +28,270 @@ class QuestionBot:
     def __init__(self, token, output_dir="output"):
         self.token = token
         self.output_dir = output_dir
-        self.question_files = []
+        self.catalog = QuestionCatalog([])  # Soru kataloğu (id -> soru bilgisi)
+        self.pack = None  # Soru görseli paketi (mmap) - yoksa görseller dosyalardan okunur
+        self.pack_hits = 0
+        self.pack_misses = 0
+        self.stale_pack_paths = set()  # Paket açıldıktan sonra değişen görseller (dosyadan okunur)
         self.answers = {}  # Cevap anahtarları
-        self.load_questions()
+        # Telegram'a yüklenen görsellerin file_id'leri (bot token'ının id kısmına özel) - arka planda yazılır
+        self.file_ids = FileIdCache(
+            BOT_CONFIG.get('FILE_ID_CACHE_PATH', os.path.join('.cache', 'telegram_file_ids.json')),
+            bot_id=str(token).split(':')[0],
+            flush_interval=BOT_CONFIG.get('FILE_ID_FLUSH_SECONDS', 5.0)
+        )
+        # Soru görsellerinin bayt önbelleği (handler'lar diske event loop üzerinde erişmez)
+        self.image_cache = ImageBytesCache(BOT_CONFIG.get('IMAGE_CACHE_MAX_MB', 64) * 1024 * 1024)
+        self.sampler = QuestionSampler()  # Kullanıcı başına tekrarsız soru sırası
+        # Kullanıcı durumu (son soru, soru sırası, günlük kota) - SQLite'a arka planda toplu yazılır
+        self.users = UserStateStore(
+            BOT_CONFIG.get('USER_STATE_DB_PATH', os.path.join('.cache', 'user_state.sqlite3')),
+            ttl_seconds=BOT_CONFIG.get('USER_STATE_TTL_SECONDS', 3600),
+            max_cached=BOT_CONFIG.get('USER_STATE_MAX_CACHED', 10000),
+            flush_interval=BOT_CONFIG.get('USER_STATE_FLUSH_SECONDS', 2.0)
+        )
+        self.pdf_folders = []  # Output altındaki PDF klasörleri (arka planda yenilenir)
+        self._background_tasks = []
+        self.metrics_server = None  # Yerel metrik uç noktası (METRICS_PORT)
+        METRICS.add_collector(self.cache_metrics)
         self.load_answer_keys()
+        self.load_questions()
+        self.refresh_folder_stats()
+        # Output klasöründeki değişiklikleri izler ve yeni katalog nesli üretir
+        self.catalog_watcher = CatalogWatcher(self.output_dir, self.catalog, self.answers)
+    
+    def refresh_folder_stats(self):
+        """Output klasöründeki PDF klasörlerini say - disk erişimi yapar, event loop dışında çağrılmalı"""
+        try:
+            self.pdf_folders = list_question_folders(self.output_dir)
+        except Exception as e:
+            logger.error(f"Klasör istatistikleri alınırken hata: {e}")
+    
+    async def folder_stats_refresher(self, interval: float):
+        """Klasör istatistiklerini arka planda periyodik olarak yeniler"""
+        while True:
+            await asyncio.sleep(interval)
+            await asyncio.to_thread(self.refresh_folder_stats)
+    
+    async def catalog_reloader(self, interval: float):
+        """Output klasörünü periyodik tarar; değişiklik varsa yeni katalog neslini devreye alır"""
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                update = await asyncio.to_thread(self.catalog_watcher.poll)
+                if update is not None:
+                    await self.apply_catalog_update(update)
+            except Exception as e:
+                logger.error(f"Katalog yenilenirken hata: {e}")
+    
+    async def apply_catalog_update(self, update):
+        """Yeni katalog neslini tek adımda devreye al - devam eden istekler eski nesilden aldıkları bilgiyle biter"""
+        new_pack = await asyncio.to_thread(self.open_pack) if update.pack_changed else None
+        
+        # Event loop üzerinde await olmadan: handler'lar ya eski ya yeni nesli görür
+        old_catalog = self.catalog
+        self.catalog = update.generation.catalog
+        self.answers = update.generation.answers
+        old_pack = None
+        if update.pack_changed:
+            old_pack, self.pack = self.pack, new_pack
+            self.stale_pack_paths = set()
+        
+        # İçeriği değişen görsellerin önbellekteki baytları ve file_id'leri geçersiz
+        for path in update.changed_paths:
+            self.image_cache.discard(path)
+            if not update.pack_changed:
+                self.stale_pack_paths.add(path)
+            entry = old_catalog.get(old_catalog.id_by_path.get(path, -1))
+            if entry is not None:
+                self.file_ids.discard(FileIdCache.make_key(path, entry.width, entry.height))
+        
+        # Handler'lar paket baytlarını eşzamanlı kopyaladığı için eski paket hemen kapatılabilir
+        if old_pack is not None:
+            old_pack.close()
+        
+        METRICS.inc('bot_catalog_reloads_total')
+        logger.info(
+            f"Katalog yenilendi (nesil {update.generation.number}): {len(self.catalog)} soru"
+            + (f", klasörler: {', '.join(update.folders)}" if update.folders else "")
+            + (", soru paketi yeniden açıldı" if update.pack_changed else "")
+        )
+    
+    def start_background_tasks(self):
+        """Arka plan görevlerini başlat (event loop çalışırken çağrılmalı)"""
+        interval = BOT_CONFIG.get('STATS_REFRESH_SECONDS', 300)
+        self._background_tasks.append(asyncio.create_task(self.folder_stats_refresher(interval)))
+        reload_interval = BOT_CONFIG.get('CATALOG_RELOAD_SECONDS')
+        if reload_interval:
+            self._background_tasks.append(asyncio.create_task(self.catalog_reloader(reload_interval)))
+        self.users.start()
+        self.file_ids.start()
+    
+    async def stop_background_tasks(self):
+        """Arka plan görevlerini durdur"""
+        for task in self._background_tasks:
+            task.cancel()
+        await asyncio.gather(*self._background_tasks, return_exceptions=True)
+        self._background_tasks = []
+    
+    async def start_metrics_server(self):
+        """Prometheus metin formatındaki metrik uç noktasını başlat (METRICS_PORT None ise kapalı)"""
+        port = BOT_CONFIG.get('METRICS_PORT')
+        if port is None:
+            return
+        
+        host = BOT_CONFIG.get('METRICS_LISTEN', '127.0.0.1')
+        try:
+            self.metrics_server = MetricsServer(METRICS, host, port)
+            await self.metrics_server.start()
+            logger.info(f"Metrik uç noktası: http://{host}:{port}/metrics")
+        except OSError as e:
+            logger.error(f"Metrik uç noktası başlatılamadı: {e}")
+            self.metrics_server = None
+    
+    async def stop_metrics_server(self):
+        """Metrik uç noktasını kapat"""
+        if self.metrics_server is not None:
+            await self.metrics_server.stop()
+            self.metrics_server = None
+    
+    def cache_metrics(self):
+        """Görsel, file_id ve paket önbelleklerinin isabet sayaçları"""
+        samples = cache_samples('image', self.image_cache.hits, self.image_cache.misses)
+        samples += cache_samples('file_id', self.file_ids.hits, self.file_ids.misses)
+        if self.pack is not None:
+            samples += cache_samples('pack', self.pack_hits, self.pack_misses)
+        samples.append(('gauge', 'bot_user_state_cached', {}, len(self.users)))
+        return samples
     
     def load_questions(self):
-        """Output klasöründeki tüm soru dosyalarını yükle"""
+        """Soru kataloğunu yükle - yoksa output klasöründen oluşturup kaydet (id'lerin tek kaynağı catalog.json)"""
         try:
-            # Tüm PNG dosyalarını bul
-            pattern = os.path.join(self.output_dir, "**", "soru_*.png")
-            self.question_files = glob.glob(pattern, recursive=True)
+            catalog_path = os.path.join(self.output_dir, CATALOG_FILENAME)
+            if not os.path.exists(catalog_path) and os.path.isdir(self.output_dir):
+                logger.warning(f"{catalog_path} bulunamadı, katalog output klasöründen oluşturuluyor")
+                write_catalog(self.output_dir, self.answers)
+            self.catalog = QuestionCatalog.load(catalog_path) if os.path.exists(catalog_path) else QuestionCatalog([])
             
-            logger.info(f"Toplam {len(self.question_files)} soru dosyası yüklendi")
+            logger.info(f"Toplam {len(self.catalog)} soru dosyası yüklendi")
             
-            if not self.question_files:
+            self.load_pack()
+            
+            if not len(self.catalog):
                 logger.warning("Hiç soru dosyası bulunamadı!")
-                
+        
         except Exception as e:
             logger.error(f"Soru dosyaları yüklenirken hata: {e}")
-            self.question_files = []
+            self.catalog = QuestionCatalog([])
+    
+    def load_pack(self):
+        """Soru görseli paketini mmap ile aç (varsa)"""
+        if self.pack is not None:
+            self.pack.close()
+            self.pack = None
+        self.pack = self.open_pack()
+    
+    def open_pack(self):
+        """Soru görseli paketini aç - yoksa, kapalıysa veya açılamazsa None"""
+        pack_path = os.path.join(self.output_dir, PACK_FILENAME)
+        if not BOT_CONFIG.get('USE_QUESTION_PACK', True) or not os.path.exists(pack_path):
+            return None
+        
+        try:
+            pack = QuestionPack(pack_path)
+            logger.info(f"Soru paketi yüklendi: {pack_path} ({len(pack)} görsel)")
+            return pack
+        except Exception as e:
+            logger.error(f"Soru paketi açılamadı, görseller dosyalardan okunacak: {e}")
+            return None
+    
+    def get_pack_image(self, image_path):
+        """Görseli paketten döndür (pakette yoksa None)"""
+        if self.pack is None:
+            return None
+        if image_path in self.stale_pack_paths:
+            self.pack_misses += 1
+            return None
+        view = self.pack.get_by_name(image_path)
+        if view is None:
+            self.pack_misses += 1
+            return None
+        self.pack_hits += 1
+        # Paket dilimi kopyasızdır; Telegram yüklemesi bayt beklediği için sadece burada kopyalanır
+        return bytes(view)
     
     def load_answer_keys(self):
-        """Cevap anahtarlarını yükle"""
+        """Önceden üretilmiş cevap anahtarı JSON'larını yükle (PDF işlemez)"""
         try:
-            # Önce cevap anahtarı PDF'lerini işle
-            answer_key_files = process_answer_key_pdfs(self.output_dir)
+            # İsteğe bağlı: başlangıçta sadece değişen cevap anahtarlarını yeniden işle
+            if BOT_CONFIG.get('REFRESH_ANSWER_KEYS_ON_START', False):
+                from answer_key_extractor import process_answer_key_pdfs
+                process_answer_key_pdfs(self.output_dir)
+            else:
+                stale = find_stale_answer_keys(self.output_dir)
+                if stale:
+                    logger.warning(
+                        f"{len(stale)} cevap anahtarı güncel değil, "
+                        f"'python answer_key_extractor.py' ile yeniden üretin: {', '.join(stale)}"
+                    )
             
-            # JSON dosyalarını yükle
-            for test_name, json_path in answer_key_files.items():
-                if os.path.exists(json_path):
-                    with open(json_path, 'r', encoding='utf-8') as f:
-                        self.answers[test_name] = json.load(f)
-                    logger.info(f"Cevap anahtarı yüklendi: {test_name}")
+            self.answers = load_answer_key_jsons(self.output_dir)
+            for test_name in self.answers:
+                logger.info(f"Cevap anahtarı yüklendi: {test_name}")
             
             logger.info(f"Toplam {len(self.answers)} cevap anahtarı yüklendi")
-            
+        
         except Exception as e:
             logger.error(f"Cevap anahtarları yüklenirken hata: {e}")
             self.answers = {}
     
     def get_answer(self, question_number: int, test_name: str = None) -> str:
         """Belirli bir soru için cevabı döndür"""
-        if not self.answers:
-            return "Bilinmiyor"
-        
-        # Test adı belirtilmişse, o testin cevap anahtarını kullan
-        if test_name and test_name in self.answers:
-            test_answers = self.answers[test_name]
-            
-            # Önce Matematik testini dene
-            math_tests = ['TEMEL MATEMATİK', 'MATEMATİK', 'MATEMAT K', 'MATEMATIK']
-            for math_test in math_tests:
-                if math_test in test_answers:
-                    answer = test_answers[math_test].get(str(question_number))
-                    if answer:
-                        return answer
-            
-            # Matematik bulunamazsa, tüm testlerde ara
-            for test, answers in test_answers.items():
-                if str(question_number) in answers:
-                    return answers[str(question_number)]
-        
         # Test adı belirtilmemişse veya bu PDF için cevap anahtarı yoksa, cevap bulunamadı
-        return "Bilinmiyor"
+        if not test_name:
+            return UNKNOWN_ANSWER
+        return resolve_answer(self.answers.get(test_name), question_number)
     
-    def get_random_question(self):
-        """Rastgele bir soru dosyası seç"""
-        if not self.question_files:
+    def get_random_question(self, user_id=None):
+        """Rastgele bir soru id'si seç - kullanıcı verilirse banka bitene kadar aynı soru tekrar gelmez"""
+        if not len(self.catalog):
             return None
         
-        return random.choice(self.question_files)
+        if user_id is None:
+            return random.choice(self.catalog.live_ids)
+        
+        # Sıra id aralığı üzerindedir; silinmiş soruların boş id'leri atlanır
+        size = self.catalog.size
+        state = self.users.sampler_state(user_id)
+        for _ in range(2 * size):
+            question_id, state = self.sampler.advance(state, size)
+            if self.catalog.info(question_id) is not None:
+                break
+        self.users.set_sampler_state(user_id, state)
+        return question_id
     
-    def get_question_info(self, file_path):
-        """Soru dosyasından bilgi çıkar"""
-        try:
-            # Dosya adından bilgi çıkar
-            filename = os.path.basename(file_path)
-            # soru_23_sayfa_6_sag.png -> Soru 23, Sayfa 6, Sağ
-            parts = filename.replace('.png', '').split('_')
-            
-            # PDF adını bul (dosya yolundan)
-            pdf_name = "Bilinmiyor"
-            try:
-                # output/2015-YGS/soru_23_sayfa_6_sag.png -> 2015-YGS
-                path_parts = file_path.replace(os.sep, '/').split('/')
-                for i, part in enumerate(path_parts):
-                    if part == 'output' and i + 1 < len(path_parts):
-                        pdf_name = path_parts[i + 1]
-                        break
-            except:
-                pass
-            
-            if len(parts) >= 4:
-                question_num = parts[1]
-                page_num = parts[3]
-                side = parts[4] if len(parts) > 4 else "bilinmiyor"
-                
-                # Cevabı al
-                answer = self.get_answer(int(question_num), pdf_name)
-                
-                return {
-                    'number': question_num,
-                    'page': page_num,
-                    'side': side,
-                    'filename': filename,
-                    'pdf_name': pdf_name,
-                    'answer': answer
-                }
-        except Exception as e:
-            logger.error(f"Soru bilgisi çıkarılırken hata: {e}")
+    def quota_remaining(self, user_id):
+        """Kullanıcının kalan günlük soru hakkı (sınırsızsa veya admin ise None)"""
+        if user_id is None or is_quota_exempt(user_id, BOT_CONFIG.get('ADMIN_USER_IDS')):
+            return None
+        return self.users.quota_remaining(user_id, BOT_CONFIG.get('MAX_QUESTIONS_PER_DAY'))
+    
+    def get_question_info(self, question_id):
+        """Katalogdan hazır soru bilgisini döndür"""
+        info = self.catalog.info(question_id)
+        if info is not None:
+            return info
         
         return {
+            'id': question_id,
             'number': '?',
             'page': '?',
             'side': '?',
-            'filename': os.path.basename(file_path),
+            'filename': '?',
+            'image_path': None,
             'pdf_name': 'Bilinmiyor',
-            'answer': 'Bilinmiyor'
+            'answer': UNKNOWN_ANSWER,
+            'dimensions': (0, 0)
         }
 
 # Bot instance
@@ -169,6 +325,7 @@ def create_question_keyboard():
     ]
     return InlineKeyboardMarkup(keyboard)
 
+@METRICS.track('show_answer')
 async def show_answer(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Cevabı göster"""
     query = update.callback_query
@@ -179,13 +336,18 @@ async def show_answer(update: Update, context: ContextTypes.DEFAULT_TYPE):
         await query.message.reply_text("❌ Bot henüz hazır değil.")
         return
     
-    # Son gönderilen soru dosyasını context'ten al
-    if 'last_question_file' not in context.user_data:
+    # Son gönderilen soruyu kullanıcı durumundan al (id görsel yoluyla doğrulanır)
+    question_id, image_path = (
+        bot_instance.users.last_question(update.effective_user.id) if update.effective_user else (None, None)
+    )
+    if question_id is None:
         await query.message.reply_text("❌ Henüz soru gönderilmemiş.")
         return
     
-    question_file = context.user_data['last_question_file']
-    question_info = bot_instance.get_question_info(question_file)
+    question_info = bot_instance.catalog.resolve(question_id, image_path)
+    if question_info is None:
+        await query.message.reply_text("❌ Bu soru artık soru bankasında yok. Yeni bir soru isteyin.")
+        return
     
     # Cevabı göster
     if question_info['answer'] != 'Bilinmiyor':
@@ -202,7 +364,9 @@ async def show_answer(update: Update, context: ContextTypes.DEFAULT_TYPE):
         answer_message,
         parse_mode='Markdown'
     )
+    METRICS.inc('bot_answers_shown_total')
 
+@METRICS.track('start')
 async def start(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Bot başlatma komutu"""
     welcome_message = """
@@ -218,6 +382,7 @@ Aşağıdaki butonları kullanarak kolayca navigasyon yapabilirsiniz! 🚀
         reply_markup=create_main_keyboard()
     )
 
+@METRICS.track('send_question')
 async def send_question(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Rastgele soru gönder"""
     global bot_instance
@@ -230,10 +395,23 @@ async def send_question(update: Update, context: ContextTypes.DEFAULT_TYPE):
             await update.callback_query.edit_message_text("❌ Bot henüz hazır değil. Lütfen daha sonra tekrar deneyin.")
         return
     
+    user = update.effective_user
+    user_id = user.id if user else None
+    
+    # Günlük kota (son 24 saat)
+    if bot_instance.quota_remaining(user_id) == 0:
+        limit_text = f"⏳ Günlük soru sınırına ({BOT_CONFIG.get('MAX_QUESTIONS_PER_DAY')}) ulaştınız. Lütfen daha sonra tekrar deneyin."
+        if update.message:
+            await update.message.reply_text(limit_text)
+        elif update.callback_query:
+            await update.callback_query.message.reply_text(limit_text)
+        METRICS.inc('bot_quota_rejections_total')
+        return
+    
     # Rastgele soru seç
-    question_file = bot_instance.get_random_question()
+    question_id = bot_instance.get_random_question(user_id)
     
-    if not question_file:
+    if question_id is None:
         if update.message:
             await update.message.reply_text("❌ Hiç soru bulunamadı. Output klasörünü kontrol edin.")
         elif update.callback_query:
@@ -242,42 +420,74 @@ async def send_question(update: Update, context: ContextTypes.DEFAULT_TYPE):
     
     try:
         # Soru bilgisini al
-        question_info = bot_instance.get_question_info(question_file)
+        question_info = bot_instance.get_question_info(question_id)
         
-        # Son soru dosyasını context'e kaydet
-        context.user_data['last_question_file'] = question_file
+        caption = f"📚 **Soru {question_info['number']}**\n"
+        caption += f"📄 Sayfa: {question_info['page']}\n"
+        caption += f"📁 Kaynak: {question_info['pdf_name']}\n"
+        caption += "\nBaşarılar! 🍀"
         
-        # Dosyayı gönder
-        with open(question_file, 'rb') as photo:
-            caption = f"📚 **Soru {question_info['number']}**\n"
-            caption += f"📄 Sayfa: {question_info['page']}\n"
-            caption += f"📁 Kaynak: {question_info['pdf_name']}\n"
-            caption += "\nBaşarılar! 🍀"
-            
-            if update.message:
-                await update.message.reply_photo(
-                    photo=photo,
-                    caption=caption,
-                    parse_mode='Markdown',
-                    reply_markup=create_question_keyboard()
-                )
-            elif update.callback_query:
-                await update.callback_query.message.reply_photo(
-                    photo=photo,
-                    caption=caption,
-                    parse_mode='Markdown',
-                    reply_markup=create_question_keyboard()
-                )
-            
-        logger.info(f"Soru gönderildi: {question_info['filename']}")
+        # Hem message hem de callback_query için çalışır
+        target_message = update.message if update.message else update.callback_query.message
+        await reply_question_photo(target_message, question_info, caption)
         
+        # Son soruyu kaydet ve kotadan düş (diske arka planda yazılır)
+        if user_id is not None:
+            bot_instance.users.record_question(user_id, question_id, question_info['image_path'])
+        
+        logger.info(f"Soru gönderildi: {question_info['filename']}")
+        METRICS.inc('bot_questions_sent_total')
+    
     except Exception as e:
         logger.error(f"Soru gönderilirken hata: {e}")
+        METRICS.inc('bot_handler_errors_total', handler='send_question')
         if update.message:
             await update.message.reply_text("❌ Soru gönderilirken bir hata oluştu.")
         elif update.callback_query:
             await update.callback_query.edit_message_text("❌ Soru gönderilirken bir hata oluştu.")
 
+async def reply_question_photo(message, question_info, caption):
+    """Soru görselini gönder - daha önce yüklendiyse file_id ile, değilse dosyayı yükleyerek"""
+    
+    file_ids = bot_instance.file_ids
+    file_key = FileIdCache.make_key(question_info['image_path'], *question_info['dimensions'])
+    
+    file_id = file_ids.get(file_key)
+    if file_id:
+        try:
+            sent_message = await message.reply_photo(
+                photo=file_id,
+                caption=caption,
+                parse_mode='Markdown',
+                reply_markup=create_question_keyboard()
+            )
+            METRICS.inc('bot_photo_sends_total', source='file_id')
+            return sent_message
+        except BadRequest as e:
+            # file_id artık geçerli değil, dosyayı yeniden yükle
+            logger.warning(f"file_id reddedildi, görsel yeniden yükleniyor: {e}")
+            METRICS.inc('bot_photo_sends_total', source='file_id_rejected')
+            file_ids.discard(file_key)
+    
+    # Görsel baytları paketten, yoksa önbellekten veya thread havuzunda diskten
+    photo = bot_instance.get_pack_image(question_info['image_path'])
+    if photo is None:
+        photo = await bot_instance.image_cache.get(question_info['image_path'])
+    sent_message = await message.reply_photo(
+        photo=photo,
+        caption=caption,
+        parse_mode='Markdown',
+        reply_markup=create_question_keyboard()
+    )
+    METRICS.inc('bot_photo_sends_total', source='upload')
+    
+    # Telegram'ın döndürdüğü file_id'yi kaydet (en büyük boyut)
+    if sent_message and sent_message.photo:
+        file_ids.set(file_key, sent_message.photo[-1].file_id)
+    
+    return sent_message
+
+@METRICS.track('show_stats')
 async def show_stats(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Bot istatistiklerini göster"""
     global bot_instance
@@ -289,15 +499,10 @@ async def show_stats(update: Update, context: ContextTypes.DEFAULT_TYPE):
             await update.callback_query.edit_message_text("❌ Bot henüz hazır değil.")
         return
     
-    total_questions = len(bot_instance.question_files)
+    total_questions = len(bot_instance.catalog)
     
-    # PDF klasörlerini say
-    pdf_folders = []
-    if os.path.exists(bot_instance.output_dir):
-        for item in os.listdir(bot_instance.output_dir):
-            item_path = os.path.join(bot_instance.output_dir, item)
-            if os.path.isdir(item_path) and item != "__pycache__":
-                pdf_folders.append(item)
+    # PDF klasörleri (arka planda güncellenen istatistikten - disk erişimi yok)
+    pdf_folders = bot_instance.pdf_folders
     
     stats_message = f"""
 📊 **Bot İstatistikleri**
@@ -314,6 +519,7 @@ Bot durumu: ✅ Aktif
     elif update.callback_query:
         await update.callback_query.edit_message_text(stats_message, parse_mode='Markdown', reply_markup=create_main_keyboard())
 
+@METRICS.track('help_command')
 async def help_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Yardım komutu"""
     help_message = """
@@ -335,6 +541,7 @@ Sorularınız için: @your_username
     """
     await update.message.reply_text(help_message, parse_mode='Markdown')
 
+@METRICS.track('button_callback')
 async def button_callback(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Buton tıklama işleyicisi"""
     query = update.callback_query
@@ -351,15 +558,10 @@ async def button_callback(update: Update, context: ContextTypes.DEFAULT_TYPE):
             await query.message.reply_text("❌ Bot henüz hazır değil.")
             return
         
-        total_questions = len(bot_instance.question_files)
+        total_questions = len(bot_instance.catalog)
         
-        # PDF klasörlerini say
-        pdf_folders = []
-        if os.path.exists(bot_instance.output_dir):
-            for item in os.listdir(bot_instance.output_dir):
-                item_path = os.path.join(bot_instance.output_dir, item)
-                if os.path.isdir(item_path) and item != "__pycache__":
-                    pdf_folders.append(item)
+        # PDF klasörleri (arka planda güncellenen istatistikten - disk erişimi yok)
+        pdf_folders = bot_instance.pdf_folders
         
         stats_message = f"""
 📊 **Bot İstatistikleri**
@@ -398,16 +600,11 @@ Bot durumu: ✅ Aktif
             return
         
         # Dinamik bilgileri al
-        total_questions = len(bot_instance.question_files)
+        total_questions = len(bot_instance.catalog)
         total_answer_keys = len(bot_instance.answers)
         
-        # PDF klasörlerini say
-        pdf_folders = []
-        if os.path.exists(bot_instance.output_dir):
-            for item in os.listdir(bot_instance.output_dir):
-                item_path = os.path.join(bot_instance.output_dir, item)
-                if os.path.isdir(item_path) and item != "__pycache__":
-                    pdf_folders.append(item)
+        # PDF klasörleri (arka planda güncellenen istatistikten - disk erişimi yok)
+        pdf_folders = bot_instance.pdf_folders
         
         pdf_count = len(pdf_folders)
         
@@ -449,6 +646,7 @@ Aşağıdaki butonları kullanarak kolayca navigasyon yapabilirsiniz! 🚀
             reply_markup=create_main_keyboard()
         )
 
+@METRICS.track('handle_message')
 async def handle_message(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Genel mesaj işleyici"""
     message_text = update.message.text.lower()
@@ -460,23 +658,41 @@ async def handle_message(update: Update, context: ContextTypes.DEFAULT_TYPE):
             "Merhaba! /soru komutu ile matematik sorusu alabilirsiniz. 🎓"
         )
 
-def main():
-    """Bot ana fonksiyonu"""
-    global bot_instance
-    
-    # Bot token'ını al
-    token = os.getenv('TELEGRAM_BOT_TOKEN')
-    if not token:
-        print("❌ TELEGRAM_BOT_TOKEN environment variable bulunamadı!")
-        print("Lütfen bot token'ınızı ayarlayın:")
-        print("export TELEGRAM_BOT_TOKEN='your_bot_token_here'")
-        return
+async def on_startup(application: Application):
+    """Event loop başladıktan sonra arka plan görevlerini başlat"""
+    if bot_instance:
+        bot_instance.start_background_tasks()
+        await bot_instance.start_metrics_server()
+
+async def on_shutdown(application: Application):
+    """Arka plan görevlerini durdur"""
+    if bot_instance:
+        await bot_instance.stop_background_tasks()
+        await bot_instance.stop_metrics_server()
+        if bot_instance.pack is not None:
+            bot_instance.pack.close()
+        # Bekleyen kullanıcı durumu ve file_id değişikliklerini yaz
+        await asyncio.to_thread(bot_instance.users.close)
+        await asyncio.to_thread(bot_instance.file_ids.close)
+
+def build_application(token):
+    """Handler'ları kayıtlı Application oluştur - TELEGRAM_API_BASE_URL ayarlıysa o uç noktayı kullanır"""
+    builder = (
+        Application.builder()
+        .token(token)
+        .post_init(on_startup)
+        .post_shutdown(on_shutdown)
+        # Farklı sohbetler paralel, aynı sohbet sıralı işlenir
+        .concurrent_updates(PerChatUpdateProcessor(BOT_CONFIG.get('MAX_CONCURRENT_UPDATES', 64)))
+    )
     
-    # Bot instance oluştur
-    bot_instance = QuestionBot(token)
+    # Yerel/sahte Telegram API uç noktası (test ortamı için)
+    if BOT_CONFIG.get('TELEGRAM_API_BASE_URL'):
+        builder = builder.base_url(BOT_CONFIG['TELEGRAM_API_BASE_URL'])
+    if BOT_CONFIG.get('TELEGRAM_API_BASE_FILE_URL'):
+        builder = builder.base_file_url(BOT_CONFIG['TELEGRAM_API_BASE_FILE_URL'])
     
-    # Application oluştur
-    application = Application.builder().token(token).build()
+    application = builder.build()
     
     # Command handlers
     application.add_handler(CommandHandler("start", start))
@@ -490,11 +706,42 @@ def main():
     # Message handler
     application.add_handler(MessageHandler(filters.TEXT & ~filters.COMMAND, handle_message))
     
+    return application
+
+def main():
+    """Bot ana fonksiyonu"""
+    global bot_instance
+    
+    # Bot token'ını al
+    token = os.getenv('TELEGRAM_BOT_TOKEN')
+    if not token:
+        print("❌ TELEGRAM_BOT_TOKEN environment variable bulunamadı!")
+        print("Lütfen bot token'ınızı ayarlayın:")
+        print("export TELEGRAM_BOT_TOKEN='your_bot_token_here'")
+        return
+    
+    # Bot instance oluştur
+    bot_instance = QuestionBot(token)
+    application = build_application(token)
+    
     # Bot'u başlat
     print("🤖 Telegram Bot başlatılıyor...")
-    print(f"📚 {len(bot_instance.question_files)} soru yüklendi")
+    print(f"📚 {len(bot_instance.catalog)} soru yüklendi")
     
-    application.run_polling()
+    webhook_url = BOT_CONFIG.get('WEBHOOK_URL')
+    if webhook_url:
+        # Webhook modu: güncellemeler yerel HTTP sunucusuna gelir
+        url_path = BOT_CONFIG.get('WEBHOOK_PATH', 'telegram')
+        print(f"🌐 Webhook modu: {webhook_url.rstrip('/')}/{url_path}")
+        application.run_webhook(
+            listen=BOT_CONFIG.get('WEBHOOK_LISTEN', '127.0.0.1'),
+            port=BOT_CONFIG.get('WEBHOOK_PORT', 8443),
+            url_path=url_path,
+            webhook_url=f"{webhook_url.rstrip('/')}/{url_path}",
+            secret_token=BOT_CONFIG.get('WEBHOOK_SECRET_TOKEN')
+        )
+    else:
+        application.run_polling()
 
 if __name__ == '__main__':
     main()
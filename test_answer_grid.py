@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Cevap tablosu ayrıştırıcı testleri
+Paketteki cevap anahtarı PDF'lerinin ayrıştırma sonucu kayıtlı *_answers.json dosyalarıyla karşılaştırılır.
+"""
+
+import glob
+import json
+import os
+
+import pytest
+
+from answer_grid import merge_answer_tables, parse_answer_text, parse_answer_words
+from answer_keys import is_answer_key_pdf
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+def _word(x0, y0, x1, text, height=10):
+    return (x0, y0, x1, y0 + height, text, 0, 0, 0)
+
+def test_right_aligned_letter_stays_with_number():
+    """Numaradan uzak (sağa yaslı) cevap harfi aynı cevaba aittir"""
+    words = [
+        _word(4, 0, 40, "TEMEL"), _word(44, 0, 117, "MATEMATİK"),
+        _word(45, 20, 52, "1."), _word(68, 20, 74, "A"),
+        _word(45, 40, 57, "10."), _word(60, 40, 66, "C"),
+    ]
+    table, _ = parse_answer_words(words)
+    
+    assert table == {'TEMEL MATEMATİK': {'1': 'A', '10': 'C'}}
+
+def test_side_by_side_tests_are_separated():
+    """Yan yana iki testin cevapları kendi başlıklarına atanır"""
+    words = [
+        _word(0, 0, 40, "TÜRKÇE"), _word(42, 0, 70, "TESTİ"),
+        _word(200, 0, 290, "MATEMATİK"), _word(292, 0, 320, "TESTİ"),
+        _word(0, 20, 10, "1."), _word(14, 20, 20, "B"),
+        _word(200, 20, 210, "1."), _word(214, 20, 220, "D"),
+    ]
+    table, band = parse_answer_words(words)
+    
+    assert table == {'TÜRKÇE TESTİ': {'1': 'B'}, 'MATEMATİK TESTİ': {'1': 'D'}}
+    
+    # Başlıksız sonraki sayfa önceki sayfanın sütunlarını kullanır
+    next_table, _ = parse_answer_words([_word(200, 20, 210, "2."), _word(214, 20, 220, "E")], band)
+    assert next_table == {'MATEMATİK TESTİ': {'2': 'E'}}
+
+def test_text_fallback_uses_previous_title():
+    """OCR metninde cevaplar kendinden önceki başlığa atanır"""
+    table, title = parse_answer_text("FEN BİLİMLERİ TESTİ\n1. A 2) C\n3-E")
+    
+    assert title == 'FEN BİLİMLERİ TESTİ'
+    assert table == {'FEN BİLİMLERİ TESTİ': {'1': 'A', '2': 'C', '3': 'E'}}
+
+def _bundled_answer_keys():
+    """(klasör, cevap anahtarı PDF'i, kayıtlı JSON) - paketteki tüm cevap anahtarları"""
+    cases = []
+    for json_path in sorted(glob.glob(os.path.join(ROOT, "output", "*", "*_answers.json"))):
+        folder = os.path.dirname(json_path)
+        pdfs = sorted(f for f in os.listdir(folder) if is_answer_key_pdf(f))
+        if pdfs:
+            cases.append(pytest.param(os.path.join(folder, pdfs[0]), json_path, id=os.path.basename(folder)))
+    return cases
+
+@pytest.mark.pdf
+@pytest.mark.parametrize("pdf_path, json_path", _bundled_answer_keys())
+def test_bundled_answer_keys_match_committed_json(pdf_path, json_path):
+    """Metin katmanı olan cevap anahtarları kayıtlı JSON ile birebir aynı ayrıştırılır"""
+    fitz = pytest.importorskip("fitz")
+    
+    table = {}
+    carry = None
+    with fitz.open(pdf_path) as doc:
+        for page in doc:
+            if len(page.get_text().strip()) < 10:
+                pytest.skip("Metin katmanı olmayan sayfa (OCR gerekir)")
+            page_table, carry = parse_answer_words(page.get_text("words"), carry)
+            merge_answer_tables(table, page_table)
+    
+    with open(json_path, 'r', encoding='utf-8') as f:
+        assert table == json.load(f)
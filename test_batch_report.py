@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Toplu işlem raporu testleri - manifesto ile yeniden kullanılan PDF'lerin sayımı
+"""
+
+import os
+import shutil
+
+import pytest
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+SAMPLE_PDF = "2016_ygs_fizik.pdf"
+
+@pytest.mark.pdf
+def test_render_only_changes_are_reported_separately(tmp_path):
+    """Sadece render profili değişen PDF 'Değişmeyen' değil, 'yeniden üretilen' sayılır"""
+    pytest.importorskip("fitz")
+    from question_extractor import process_multiple_pdfs
+    
+    source = os.path.join(ROOT, SAMPLE_PDF)
+    if not os.path.exists(source):
+        pytest.skip(f"{SAMPLE_PDF} bulunamadı")
+    pdf_dir = tmp_path / "pdf"
+    pdf_dir.mkdir()
+    shutil.copy(source, pdf_dir / SAMPLE_PDF)
+    output_dir = str(tmp_path / "output")
+    
+    def run(render_profile):
+        report = process_multiple_pdfs(str(pdf_dir), output_dir, render_profile=render_profile)
+        return report['skipped_files'], report['rerendered_files'], report['results'][0]
+    
+    skipped, rerendered, result = run('default')
+    assert (skipped, rerendered) == (0, 0)
+    assert result['total_questions'] > 0
+    
+    skipped, rerendered, result = run('compact')
+    assert (skipped, rerendered) == (0, 1)
+    assert result['rerendered'] == result['total_questions']
+    with open(os.path.join(output_dir, "batch_report.txt"), encoding='utf-8') as f:
+        report_text = f.read()
+    assert "Değişmeyen (yeniden kullanılan): 0" in report_text
+    assert "Sadece Görselleri Yeniden Üretilen: 1" in report_text
+    
+    skipped, rerendered, _ = run('compact')
+    assert (skipped, rerendered) == (1, 0)
@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Bot uçtan uca testi - yerel sahte Telegram Bot API sunucusu (TELEGRAM_API_BASE_URL) ile
+Application gerçek handler'larla polling yapar; sunucu gelen istekleri ve eşzamanlılığı kaydeder.
+"""
+
+import asyncio
+import base64
+import json
+import os
+import time
+
+import pytest
+
+pytest.importorskip("telegram")
+tornado_web = pytest.importorskip("tornado.web")
+from tornado.httpserver import HTTPServer
+from tornado.netutil import bind_sockets
+
+import telegram_bot
+from bot_config import BOT_CONFIG
+
+TOKEN = "123456:TEST"
+
+# 1x1 PNG
+PNG = base64.b64decode(
+    "iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAYAAAAfFcSJAAAADUlEQVR42mP8z8BQDwAEhQGAhKmMIQAAAABJRU5ErkJggg=="
+)
+
+# Yavaş yanıtlanan metotlar - aynı sohbetin sonraki isteği bu yanıttan önce gelmemeli
+SLOW_METHODS = {'sendPhoto': 0.15}
+
+class FakeBotApi:
+    """Bot API'nin bot'un kullandığı kısmını taklit eder ve istekleri kaydeder"""
+    
+    def __init__(self, updates):
+        self.updates = updates
+        self.requests = []  # (chat_id, metot, metin, geliş, bitiş)
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.message_id = 1000
+    
+    def message(self, chat_id, **fields):
+        self.message_id += 1
+        message = {
+            'message_id': self.message_id,
+            'date': int(time.time()),
+            'chat': {'id': chat_id, 'type': 'private'},
+        }
+        message.update(fields)
+        return message
+    
+    async def handle(self, method, args):
+        if method == 'getMe':
+            return {'id': 123456, 'is_bot': True, 'first_name': 'Soru Botu', 'username': 'soru_test_bot'}
+        if method == 'getUpdates':
+            if int(args.get('offset') or 0) == 0:
+                return self.updates
+            await asyncio.sleep(0.02)
+            return []
+        if method in ('deleteWebhook', 'answerCallbackQuery'):
+            return True
+        
+        chat_id = int(args['chat_id'])
+        entry = [chat_id, method, args.get('text') or args.get('caption') or '', time.monotonic(), None]
+        self.requests.append(entry)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(SLOW_METHODS.get(method, 0.01))
+        finally:
+            self.in_flight -= 1
+            entry[4] = time.monotonic()
+        
+        if method == 'sendPhoto':
+            photo = [{'file_id': f'foto-{self.message_id}', 'file_unique_id': f'u{self.message_id}', 'width': 1, 'height': 1}]
+            return self.message(chat_id, photo=photo, caption=entry[2])
+        return self.message(chat_id, text=entry[2])
+    
+    def app(self):
+        api = self
+        
+        class Handler(tornado_web.RequestHandler):
+            async def post(self, token, method):
+                args = {name: self.get_body_argument(name) for name in self.request.body_arguments}
+                if self.request.headers.get('Content-Type', '').startswith('application/json') and self.request.body:
+                    args.update(json.loads(self.request.body))
+                result = await api.handle(method, args)
+                self.set_header('Content-Type', 'application/json')
+                self.write(json.dumps({'ok': True, 'result': result}))
+        
+        return tornado_web.Application([(r"/bot([^/]+)/(\w+)", Handler)])
+
+def _text_update(update_id, chat_id, text):
+    message = {
+        'message_id': update_id,
+        'date': int(time.time()),
+        'chat': {'id': chat_id, 'type': 'private'},
+        'from': {'id': chat_id, 'is_bot': False, 'first_name': 'Öğrenci'},
+        'text': text,
+    }
+    if text.startswith('/'):
+        message['entities'] = [{'type': 'bot_command', 'offset': 0, 'length': len(text.split()[0])}]
+    return {'update_id': update_id, 'message': message}
+
+@pytest.fixture
+def bot_output(tmp_path):
+    """Tek sorulu output klasörü"""
+    folder = tmp_path / "output" / "kitapcik"
+    folder.mkdir(parents=True)
+    (folder / "soru_1_sayfa_1_sol.png").write_bytes(PNG)
+    return str(tmp_path / "output")
+
+def test_polling_against_fake_api_keeps_chat_order(tmp_path, bot_output, monkeypatch):
+    """Üç sohbetin iç içe gelen mesajları sohbet içinde sırayla, en fazla MAX_CONCURRENT_UPDATES paralel işlenir"""
+    chats = [101, 102, 103]
+    texts = ["/soru", "merhaba", "/yardim", "/soru"]
+    updates = [
+        _text_update(1 + i * len(chats) + j, chat_id, text)
+        for i, text in enumerate(texts)
+        for j, chat_id in enumerate(chats)
+    ]
+    api = FakeBotApi(updates)
+    
+    async def run():
+        sockets = bind_sockets(0, '127.0.0.1')
+        port = sockets[0].getsockname()[1]
+        server = HTTPServer(api.app())
+        server.add_sockets(sockets)
+        
+        monkeypatch.setitem(BOT_CONFIG, 'TELEGRAM_API_BASE_URL', f"http://127.0.0.1:{port}/bot")
+        monkeypatch.setitem(BOT_CONFIG, 'MAX_CONCURRENT_UPDATES', 2)
+        monkeypatch.setitem(BOT_CONFIG, 'MAX_QUESTIONS_PER_DAY', None)
+        monkeypatch.setitem(BOT_CONFIG, 'FILE_ID_CACHE_PATH', str(tmp_path / "file_ids.json"))
+        monkeypatch.setitem(BOT_CONFIG, 'USER_STATE_DB_PATH', str(tmp_path / "user_state.sqlite3"))
+        
+        bot = telegram_bot.QuestionBot(TOKEN, output_dir=bot_output)
+        monkeypatch.setattr(telegram_bot, 'bot_instance', bot)
+        application = telegram_bot.build_application(TOKEN)
+        try:
+            async with application:
+                await application.start()
+                await application.updater.start_polling(poll_interval=0, timeout=0)
+                for _ in range(500):
+                    if len(api.requests) == len(updates) and all(entry[4] for entry in api.requests):
+                        break
+                    await asyncio.sleep(0.01)
+                await application.updater.stop()
+                await application.stop()
+        finally:
+            bot.users.close()
+            bot.file_ids.close()
+            server.stop()
+    
+    asyncio.run(run())
+    
+    assert len(api.requests) == len(updates)
+    for chat_id in chats:
+        requests = [entry for entry in api.requests if entry[0] == chat_id]
+        assert [entry[1] for entry in requests] == ['sendPhoto', 'sendMessage', 'sendMessage', 'sendPhoto']
+        assert "/soru" in requests[1][2] and "Yardım" in requests[2][2]
+        # Sohbetin sonraki yanıtı önceki yanıt tamamlanmadan istenmez
+        assert all(later[3] >= earlier[4] for earlier, later in zip(requests, requests[1:]))
+    
+    assert api.max_in_flight == 2
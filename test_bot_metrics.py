@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Bot ölçümleri testleri - Prometheus metin çıktısı ve handler ölçümü
+"""
+
+import asyncio
+
+import pytest
+
+from bot_metrics import BotMetrics, cache_samples
+
+def test_render_prometheus_text():
+    """Sayaç, gösterge, toplayıcı ve histogram satırları Prometheus metin formatındadır"""
+    metrics = BotMetrics(buckets=[0.1, 1.0])
+    metrics.inc('bot_questions_sent_total')
+    metrics.inc('bot_questions_sent_total')
+    metrics.inc('bot_photo_sends_total', source='file_id')
+    metrics.add_gauge('bot_handler_in_flight', 1, handler='soru')
+    metrics.observe('bot_handler_duration_seconds', 0.05, handler='soru')
+    metrics.observe('bot_handler_duration_seconds', 0.5, handler='soru')
+    metrics.add_collector(lambda: cache_samples('image', 3, 1))
+    
+    lines = metrics.render().splitlines()
+    
+    assert "# HELP bot_questions_sent_total Gönderilen sorular" in lines
+    assert "# TYPE bot_questions_sent_total counter" in lines
+    assert "bot_questions_sent_total 2" in lines
+    assert 'bot_photo_sends_total{source="file_id"} 1' in lines
+    assert 'bot_handler_in_flight{handler="soru"} 1' in lines
+    assert 'bot_cache_hits_total{cache="image"} 3' in lines
+    assert 'bot_cache_hit_ratio{cache="image"} 0.75' in lines
+    assert "# TYPE bot_handler_duration_seconds histogram" in lines
+    assert 'bot_handler_duration_seconds_bucket{handler="soru",le="0.1"} 1' in lines
+    assert 'bot_handler_duration_seconds_bucket{handler="soru",le="1"} 2' in lines
+    assert 'bot_handler_duration_seconds_bucket{handler="soru",le="+Inf"} 2' in lines
+    assert 'bot_handler_duration_seconds_sum{handler="soru"} 0.55' in lines
+    assert 'bot_handler_duration_seconds_count{handler="soru"} 2' in lines
+
+def test_label_values_are_escaped():
+    metrics = BotMetrics()
+    metrics.inc('bot_handler_errors_total', handler='a"b\\c\nd')
+    
+    assert 'bot_handler_errors_total{handler="a\\"b\\\\c\\nd"} 1' in metrics.render().splitlines()
+
+def test_nested_tracked_handlers_are_counted_once():
+    """Ölçülen handler'ın çağırdığı ölçülen handler ayrıca sayılmaz"""
+    metrics = BotMetrics()
+    in_flight = []
+    
+    @metrics.track('send_question')
+    async def send_question():
+        in_flight.append(dict(metrics.gauges))
+    
+    @metrics.track('button_callback')
+    async def button_callback():
+        await send_question()
+    
+    async def run():
+        await button_callback()
+        await send_question()
+    
+    asyncio.run(run())
+    
+    durations = {key[1]: histogram.count for key, histogram in metrics.histograms.items()}
+    assert durations == {(('handler', 'button_callback'),): 1, (('handler', 'send_question'),): 1}
+    # Buton içinden çağrıda sadece dıştaki handler çalışıyor görünür
+    assert in_flight[0] == {('bot_handler_in_flight', (('handler', 'button_callback'),)): 1}
+    assert all(value == 0 for value in metrics.gauges.values())
+
+def test_errors_are_counted_and_reraised():
+    metrics = BotMetrics()
+    
+    @metrics.track('show_answer')
+    async def show_answer():
+        raise RuntimeError("hata")
+    
+    with pytest.raises(RuntimeError):
+        asyncio.run(show_answer())
+    
+    assert metrics.counters[('bot_handler_errors_total', (('handler', 'show_answer'),))] == 1
+    assert metrics.gauges[('bot_handler_in_flight', (('handler', 'show_answer'),))] == 0
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Katalog izleyici testleri - sıcak yenileme ile yeniden başlatma aynı id'leri görür
+"""
+
+import os
+
+from catalog_watcher import CatalogWatcher
+from question_catalog import CATALOG_FILENAME, QuestionCatalog, write_catalog
+
+def _add_question(output_dir, folder, number):
+    path = os.path.join(output_dir, folder, f"soru_{number}_sayfa_1_sol.png")
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'wb') as f:
+        f.write(b"gorsel")
+    return path
+
+def _load(output_dir):
+    return QuestionCatalog.load(os.path.join(output_dir, CATALOG_FILENAME))
+
+def _poll_stable(watcher):
+    """Değişiklik art arda iki taramada aynı görünmeli"""
+    watcher.poll()
+    return watcher.poll()
+
+def _ids(catalog):
+    return {question_id: catalog.get(question_id).image_path for question_id in catalog.live_ids}
+
+def test_hot_reload_matches_restart(tmp_path):
+    """Klasörler farklı sırada eklense de izleyicinin id'leri catalog.json ile aynıdır"""
+    output_dir = str(tmp_path)
+    _add_question(output_dir, "m", 1)
+    _add_question(output_dir, "m", 2)
+    write_catalog(output_dir, answers={})
+    watcher = CatalogWatcher(output_dir, _load(output_dir), {})
+    
+    # z önce, b sonra kararlı hale gelir; id'ler ancak katalog yazılınca verilir
+    z_paths = [_add_question(output_dir, "z", number) for number in (1, 2)]
+    update = _poll_stable(watcher)
+    assert update.folders == ["z"]
+    assert update.generation.catalog.size == 2
+    b_paths = [_add_question(output_dir, "b", number) for number in (1, 2)]
+    _poll_stable(watcher)
+    
+    write_catalog(output_dir, answers={})
+    update = _poll_stable(watcher)
+    assert update is not None
+    hot = update.generation.catalog
+    
+    # Yeniden başlatılan bot kataloğu dosyadan yükler
+    restarted = _load(output_dir)
+    assert _ids(hot) == _ids(restarted)
+    assert hot.get(hot.id_by_path[b_paths[0]]).image_path == b_paths[0]
+    assert sorted(hot.id_by_path[path] for path in z_paths + b_paths) == [2, 3, 4, 5]
+
+def test_deleted_image_leaves_hole_until_catalog_rewrite(tmp_path):
+    """Silinen görselin id'si hemen boşalır, katalog yeniden yazılınca da boş kalır"""
+    output_dir = str(tmp_path)
+    paths = [_add_question(output_dir, "m", number) for number in (1, 2)]
+    write_catalog(output_dir, answers={})
+    watcher = CatalogWatcher(output_dir, _load(output_dir), {})
+    
+    os.remove(paths[0])
+    update = _poll_stable(watcher)
+    assert paths[0] in update.changed_paths
+    assert update.generation.catalog.live_ids == [1]
+    
+    write_catalog(output_dir, answers={})
+    update = _poll_stable(watcher)
+    assert _ids(update.generation.catalog) == _ids(_load(output_dir)) == {1: paths[1]}
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Telegram file_id önbelleği testleri
+"""
+
+import json
+
+from file_id_cache import FileIdCache
+
+def test_key_includes_path_and_dimensions():
+    """Anahtar görsel yolu ve boyutundan oluşur - yeniden render edilen görsel yeni anahtar alır"""
+    key = FileIdCache.make_key("output/kitapcik/soru_1_sayfa_1_sol.png", 640, 320)
+    
+    assert key == "output/kitapcik/soru_1_sayfa_1_sol.png|640x320"
+    assert key != FileIdCache.make_key("output/kitapcik/soru_1_sayfa_1_sol.png", 800, 400)
+    assert FileIdCache.make_key("a.png") == "a.png|0x0"
+
+def test_entries_of_another_bot_are_ignored(tmp_path):
+    """file_id'ler bot'a özel - başka bot'un kayıtları yüklenmez"""
+    path = str(tmp_path / "file_ids.json")
+    cache = FileIdCache(path, bot_id="111")
+    cache.set("a.png|1x1", "file-a")
+    cache.flush()
+    
+    assert FileIdCache(path, bot_id="111").get("a.png|1x1") == "file-a"
+    assert FileIdCache(path, bot_id="222").get("a.png|1x1") is None
+
+def test_changes_are_written_only_on_flush(tmp_path):
+    """set/discard diske yazmaz; flush sadece değişiklik varsa tek seferde yazar"""
+    path = tmp_path / "file_ids.json"
+    cache = FileIdCache(str(path), bot_id="111")
+    for i in range(100):
+        cache.set(f"{i}.png|1x1", f"file-{i}")
+    
+    assert not path.exists()
+    assert cache.dirty
+    assert cache.flush() is True
+    assert cache.flush() is False
+    assert len(json.loads(path.read_text(encoding='utf-8'))['file_ids']) == 100
+
+def test_discard_removes_entry(tmp_path):
+    """Silinen file_id bellekten ve sonraki yazımdan çıkar; olmayan anahtar değişiklik sayılmaz"""
+    path = tmp_path / "file_ids.json"
+    cache = FileIdCache(str(path), bot_id="111")
+    cache.set("a.png|1x1", "file-a")
+    cache.set("b.png|1x1", "file-b")
+    cache.flush()
+    
+    cache.discard("yok.png|1x1")
+    assert not cache.dirty
+    cache.discard("a.png|1x1")
+    assert cache.get("a.png|1x1") is None
+    cache.flush()
+    
+    assert json.loads(path.read_text(encoding='utf-8'))['file_ids'] == {"b.png|1x1": "file-b"}
+
+def test_background_writer_flushes_latest_state_on_close(tmp_path):
+    """Arka plan yazıcısı kapatılırken son durum yazılır"""
+    path = str(tmp_path / "file_ids.json")
+    cache = FileIdCache(path, bot_id="111", flush_interval=0.01)
+    cache.start()
+    for i in range(50):
+        cache.set("a.png|1x1", f"file-{i}")
+    cache.close()
+    
+    assert FileIdCache(path, bot_id="111").get("a.png|1x1") == "file-49"
+
+def test_failed_write_is_retried(tmp_path):
+    """Yazılamayan değişiklikler kaybolmaz, sonraki flush'ta tekrar denenir"""
+    blocker = tmp_path / "dosya"
+    blocker.write_text("")
+    cache = FileIdCache(str(blocker / "file_ids.json"), bot_id="111")
+    cache.set("a.png|1x1", "file-a")
+    
+    assert cache.flush() is False
+    assert cache.dirty
+    
+    cache.path = str(tmp_path / "file_ids.json")
+    assert cache.flush() is True
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+İşleme ölçümleri ve abone (hook) olayları testleri
+"""
+
+import pytest
+
+from ingest_metrics import IngestMetrics, MetricsHook, replay_snapshot
+
+class RecordingHook(MetricsHook):
+    """Olayları kaydeder - sayaçlar PDF ve ad başına toplanır"""
+    
+    def __init__(self):
+        self.timings = []
+        self.counters = {}
+        self.done = []
+    
+    def on_timing(self, pdf_name, stage, seconds):
+        self.timings.append((pdf_name, stage, seconds))
+    
+    def on_count(self, pdf_name, name, value):
+        self.counters[(pdf_name, name)] = self.counters.get((pdf_name, name), 0) + value
+    
+    def on_pdf_done(self, pdf_name, snapshot):
+        self.done.append(pdf_name)
+
+def test_replayed_snapshot_matches_live_events():
+    """Anlık görüntünün tekrar oynatılması canlı olaylarla aynı süreleri ve sayaç toplamlarını verir"""
+    live = RecordingHook()
+    metrics = IngestMetrics("kitapcik.pdf", hooks=[live])
+    metrics.observe('render', 0.2)
+    metrics.observe('hash', 0.01)
+    metrics.count('questions_rendered', 2)
+    metrics.observe('render', 0.3)
+    metrics.count('questions_rendered')
+    
+    replayed = RecordingHook()
+    replay_snapshot(metrics.snapshot(), [replayed])
+    
+    assert sorted(replayed.timings) == sorted(live.timings)
+    assert [stage for _, stage, _ in replayed.timings] == ['hash', 'render', 'render']
+    assert replayed.counters == live.counters == {("kitapcik.pdf", 'questions_rendered'): 3}
+
+@pytest.mark.pdf
+def test_parallel_ingest_reports_stage_events(tmp_path):
+    """Paralel işlemde de abone her PDF'in aşama ve sayaç olaylarını seri işlemdeki gibi alır"""
+    fitz = pytest.importorskip("fitz")
+    from question_extractor import process_multiple_pdfs
+    
+    pdf_dir = tmp_path / "pdf"
+    pdf_dir.mkdir()
+    for k in range(2):
+        with fitz.open() as doc:
+            page = doc.new_page()
+            for i in range(1, 4):
+                page.insert_text((50, 100 * i), f"{i}. Soru metni {k}")
+            doc.save(str(pdf_dir / f"kitapcik{k}.pdf"))
+    
+    hooks = {}
+    for workers in (1, 2):
+        hooks[workers] = RecordingHook()
+        process_multiple_pdfs(str(pdf_dir), str(tmp_path / f"output{workers}"), workers=workers,
+                              use_manifest=False, hooks=[hooks[workers]])
+    
+    serial, parallel = hooks[1], hooks[2]
+    assert sorted((pdf, stage) for pdf, stage, _ in parallel.timings) == sorted((pdf, stage) for pdf, stage, _ in serial.timings)
+    assert {pdf for pdf, _, _ in parallel.timings} == {"kitapcik0.pdf", "kitapcik1.pdf"}
+    assert parallel.counters == serial.counters
+    assert parallel.done == serial.done == ["kitapcik0.pdf", "kitapcik1.pdf"]
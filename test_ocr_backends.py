@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Eşzamanlı OCR çalıştırıcı testleri - yerel OCR backend'i ve sahte saat kullanılır
+"""
+
+import threading
+import time
+
+import pytest
+
+from ocr_backends import ConcurrentOCR, LocalOCRBackend, TokenBucket, TransientOCRError
+
+PROMPT = "Metni çıkar"
+
+class FakeClock:
+    """sleep() çağrıldığında zamanı ilerleten sahte saat (thread güvenli)"""
+    
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+        self._lock = threading.Lock()
+    
+    def __call__(self) -> float:
+        with self._lock:
+            return self.now
+    
+    def sleep(self, seconds: float):
+        with self._lock:
+            self.sleeps.append(seconds)
+            self.now += seconds
+
+def _images(count):
+    return [f"sayfa-{i}".encode() for i in range(count)]
+
+def test_results_keep_input_order():
+    """Sonuçlar, istekler farklı sürede bitse de girdi sırasıyla döner"""
+    images = _images(6)
+    
+    def respond(image_png):
+        index = int(image_png.decode().split('-')[1])
+        time.sleep(0.005 * (len(images) - index))  # İlk sayfalar en geç biter
+        return f"metin-{index}"
+    
+    runner = ConcurrentOCR(LocalOCRBackend(responses=respond), max_workers=6, rate_per_second=0)
+    
+    assert runner.complete_many(PROMPT, images) == [f"metin-{i}" for i in range(6)]
+
+def test_in_flight_calls_never_exceed_limit():
+    """Aynı anda en fazla max_workers istek çalışır"""
+    backend = LocalOCRBackend(default="metin", delay=0.01)
+    runner = ConcurrentOCR(backend, max_workers=3, rate_per_second=0)
+    
+    assert runner.complete_many(PROMPT, _images(12)) == ["metin"] * 12
+    assert backend.calls == 12
+    assert 1 < backend.max_in_flight <= 3
+
+def test_token_bucket_enforces_rate():
+    """Jeton kovası saatte rate kadar isteğe izin verir, ilk burst kadarı beklemez"""
+    clock = FakeClock()
+    bucket = TokenBucket(rate=2.0, capacity=2, clock=clock, sleep=clock.sleep)
+    
+    times = []
+    for _ in range(6):
+        bucket.acquire()
+        times.append(clock())
+    
+    assert times[:2] == [0.0, 0.0]
+    assert times[-1] == pytest.approx(2.0)
+    assert all(b - a == pytest.approx(0.5) for a, b in zip(times[1:], times[2:]))
+
+def test_concurrent_requests_respect_rate():
+    """Eşzamanlı çalışmada da toplam hız rate'i aşmaz - n istek için en az (n - burst) / rate saniye"""
+    clock = FakeClock()
+    backend = LocalOCRBackend(default="metin")
+    runner = ConcurrentOCR(backend, max_workers=4, rate_per_second=4.0, burst=1, clock=clock, sleep=clock.sleep)
+    
+    assert runner.complete_many(PROMPT, _images(8)) == ["metin"] * 8
+    assert backend.calls == 8
+    assert clock() >= 7 / 4.0 - 1e-9
+
+def test_transient_failures_are_retried():
+    """Geçici hatalar üstel beklemeyle tekrar denenir"""
+    clock = FakeClock()
+    backend = LocalOCRBackend(default="metin", transient_failures=2)
+    runner = ConcurrentOCR(backend, max_workers=2, rate_per_second=0, max_retries=3, clock=clock, sleep=clock.sleep)
+    
+    assert runner.complete_many(PROMPT, _images(3)) == ["metin"] * 3
+    assert backend.calls == 9
+    assert len(clock.sleeps) == 6
+
+def test_retries_are_limited():
+    """Tekrar hakkı biten geçici hata çağırana iletilir"""
+    clock = FakeClock()
+    backend = LocalOCRBackend(default="metin", transient_failures=5)
+    runner = ConcurrentOCR(backend, rate_per_second=0, max_retries=2, clock=clock, sleep=clock.sleep)
+    
+    with pytest.raises(TransientOCRError):
+        runner.complete(PROMPT, b"sayfa")
+    assert backend.calls == 3
+
+def test_permanent_failures_surface_without_retry():
+    """Kalıcı hata tekrar denenmez; toplu işlemde sadece o sayfa boş döner"""
+    clock = FakeClock()
+    
+    def respond(image_png):
+        if image_png == b"bozuk":
+            raise ValueError("Geçersiz görüntü")
+        return "metin"
+    
+    backend = LocalOCRBackend(responses=respond)
+    runner = ConcurrentOCR(backend, max_workers=2, rate_per_second=0, clock=clock, sleep=clock.sleep)
+    
+    with pytest.raises(ValueError):
+        runner.complete(PROMPT, b"bozuk")
+    assert backend.calls == 1
+    assert clock.sleeps == []
+    
+    assert runner.complete_many(PROMPT, [b"iyi", b"bozuk", b"iyi"]) == ["metin", "", "metin"]
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+OCR önbelleği testleri - ağ erişimi yerine yerel OCR backend'i kullanılır
+"""
+
+import os
+
+import pytest
+
+from ocr_backends import ConcurrentOCR, LocalOCRBackend
+from ocr_cache import OCRCache
+
+PROMPT = "Metni çıkar"
+
+def test_key_depends_on_page_bytes_scale_model_and_prompt():
+    """Anahtar sayfa görüntüsü, ölçek, model ve prompt'un hepsine bağlıdır"""
+    key = OCRCache.make_key(b"sayfa-1", 3.0, "local", PROMPT)
+    
+    assert key == OCRCache.make_key(b"sayfa-1", 3.0, "local", PROMPT)
+    assert key != OCRCache.make_key(b"sayfa-2", 3.0, "local", PROMPT)
+    assert key != OCRCache.make_key(b"sayfa-1", 2.0, "local", PROMPT)
+    assert key != OCRCache.make_key(b"sayfa-1", 3.0, "baska-model", PROMPT)
+    assert key != OCRCache.make_key(b"sayfa-1", 3.0, "local", PROMPT + " ")
+
+def test_hit_and_miss(tmp_path):
+    """Yazılan metin aynı anahtarla (başka örnekten de) okunur, yazılmayan anahtar ıskadır"""
+    cache = OCRCache(str(tmp_path))
+    key = OCRCache.make_key(b"sayfa", 3.0, "local", PROMPT)
+    
+    assert cache.get(key) is None
+    cache.put(key, "1. A 2. B", model="local")
+    assert cache.get(key) == "1. A 2. B"
+    assert (cache.hits, cache.misses) == (1, 1)
+    
+    assert OCRCache(str(tmp_path)).get(key) == "1. A 2. B"
+
+def test_size_bounded_eviction_removes_least_recently_used(tmp_path):
+    """Boyut sınırı aşılınca en uzun süre kullanılmayan girdiler silinir"""
+    keys = [OCRCache.make_key(bytes([i]), 3.0, "local", PROMPT) for i in range(4)]
+    probe = OCRCache(str(tmp_path / "olcum"))
+    probe.put(keys[0], "x" * 100)
+    entry_size = probe.total_bytes
+    
+    cache = OCRCache(str(tmp_path / "onbellek"), max_bytes=3 * entry_size)
+    for key in keys[:3]:
+        cache.put(key, "x" * 100)
+    cache.get(keys[0])  # keys[0] yeniden kullanıldı, en eskisi keys[1]
+    cache.put(keys[3], "x" * 100)
+    
+    assert cache.total_bytes == 3 * entry_size
+    assert cache.get(keys[1]) is None
+    assert all(cache.get(key) is not None for key in (keys[0], keys[2], keys[3]))
+
+def test_existing_entries_count_towards_limit(tmp_path):
+    """Önceki çalıştırmalardan kalan dosyalar da sınıra dahildir"""
+    first = OCRCache(str(tmp_path))
+    for i in range(3):
+        first.put(OCRCache.make_key(bytes([i]), 3.0, "local", PROMPT), "x" * 100)
+    
+    cache = OCRCache(str(tmp_path), max_bytes=first.total_bytes)
+    cache.put(OCRCache.make_key(b"yeni", 3.0, "local", PROMPT), "x" * 100)
+    
+    on_disk = sum(len(files) for _, _, files in os.walk(tmp_path))
+    assert on_disk == 3
+    assert cache.total_bytes <= cache.max_bytes
+
+def test_answer_key_ocr_uses_cache(tmp_path):
+    """Metin katmanı olmayan sayfa yerel backend ile OCR'lanır; ikinci çalıştırma backend'i çağırmaz"""
+    fitz = pytest.importorskip("fitz")
+    from answer_key_extractor import AnswerKeyExtractor
+    
+    pdf_path = str(tmp_path / "cevap_anahtari.pdf")
+    with fitz.open() as doc:
+        doc.new_page()
+        doc.save(pdf_path)
+    
+    cache = OCRCache(str(tmp_path / "ocr"))
+    expected = {'TEMEL MATEMATİK TESTİ': {'1': 'A', '2': 'B'}}
+    
+    for expected_calls in (1, 0):
+        backend = LocalOCRBackend(default="TEMEL MATEMATİK TESTİ\n1. A 2. B")
+        extractor = AnswerKeyExtractor(pdf_path, ocr_cache=cache, ocr_runner=ConcurrentOCR(backend, rate_per_second=0))
+        try:
+            assert extractor.extract_answers() == expected
+        finally:
+            extractor.close()
+        assert backend.calls == expected_calls
@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Soru kataloğu testleri - kalıcı soru id'leri
+"""
+
+import os
+
+from question_catalog import CATALOG_FILENAME, QuestionCatalog, write_catalog
+
+def _add_question(output_dir, folder, number):
+    path = os.path.join(output_dir, folder, f"soru_{number}_sayfa_1_sol.png")
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'wb') as f:
+        f.write(b"gorsel")
+    return path
+
+def _load(output_dir):
+    return QuestionCatalog.load(os.path.join(output_dir, CATALOG_FILENAME))
+
+def test_ids_survive_mass_deletion(tmp_path):
+    """Soruların çoğu silinse de kalan id'ler değişmez, yeni sorular sona eklenir"""
+    output_dir = str(tmp_path)
+    paths = [_add_question(output_dir, "kitapcik", number) for number in range(1, 5)]
+    write_catalog(output_dir, answers={})
+    
+    for path in paths[:3]:
+        os.remove(path)
+    new_path = _add_question(output_dir, "yeni", 1)
+    write_catalog(output_dir, answers={})
+    catalog = _load(output_dir)
+    
+    assert catalog.size == 5
+    assert catalog.live_ids == [3, 4]
+    assert catalog.get(3).image_path == paths[3]
+    assert catalog.get(4).image_path == new_path
+    assert catalog.get(0) is None
+
+def test_resolve_checks_stored_image_path():
+    """Saklanan id başka bir soruyu gösteriyorsa soru görsel yolundan bulunur"""
+    row_a = ["kitapcik", 1, 1, "sol", "A", "output/kitapcik/a.png", 10, 10]
+    row_b = ["kitapcik", 2, 1, "sag", "B", "output/kitapcik/b.png", 10, 10]
+    catalog = QuestionCatalog([row_b, None, row_a])
+    
+    assert catalog.resolve(2, "output/kitapcik/a.png")['answer'] == "A"
+    assert catalog.resolve(0, "output/kitapcik/a.png")['id'] == 2
+    assert catalog.resolve(0, None)['answer'] == "B"
+    assert catalog.resolve(1, "output/kitapcik/silindi.png") is None
@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Soru görseli paketi testleri
+"""
+
+import os
+from types import SimpleNamespace
+
+from question_pack import PACK_FILENAME, QuestionPack, write_pack_from_catalog
+
+class _Catalog:
+    """write_pack_from_catalog için en küçük katalog (silinen sorular None)"""
+    
+    def __init__(self, paths):
+        self.entries = [None if path is None else SimpleNamespace(image_path=path) for path in paths]
+    
+    def __len__(self):
+        return sum(entry is not None for entry in self.entries)
+
+def test_pack_is_written_alongside_image_files(tmp_path):
+    """Paket görselleri yol adıyla döndürür; kaynak görsel dosyaları yerinde kalır"""
+    paths = []
+    for i in range(3):
+        path = str(tmp_path / "kitapcik" / f"soru_{i + 1:03d}.png")
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'wb') as f:
+            f.write(f"görsel-{i}".encode())
+        paths.append(path)
+    
+    pack_path = write_pack_from_catalog(str(tmp_path), _Catalog([paths[0], None, paths[1], paths[2]]))
+    
+    assert pack_path == str(tmp_path / PACK_FILENAME)
+    assert all(os.path.exists(path) for path in paths)
+    
+    pack = QuestionPack(pack_path)
+    try:
+        assert len(pack) == 3
+        assert bytes(pack.get_by_name(paths[2])) == "görsel-2".encode()
+        assert pack.get_by_name(str(tmp_path / "yok.png")) is None
+    finally:
+        pack.close()
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Tekrarsız soru örnekleyici testleri
+"""
+
+import random
+
+import pytest
+
+from question_sampler import QuestionSampler, permute
+
+def _draw(sampler, state, size, count):
+    ids = []
+    for _ in range(count):
+        question_id, state = sampler.advance(state, size)
+        ids.append(question_id)
+    return ids, state
+
+@pytest.mark.parametrize("size", [1, 2, 3, 17, 64, 1000])
+def test_permute_is_a_bijection(size):
+    assert sorted(permute(i, size, 12345) for i in range(size)) == list(range(size))
+
+def test_full_round_has_no_repeats():
+    """Bir turda bankadaki her soru tam bir kez gelir"""
+    sampler = QuestionSampler(random.Random(1))
+    state = None
+    for _ in range(5):
+        ids, state = _draw(sampler, state, 40, 40)
+        assert sorted(ids) == list(range(40))
+
+@pytest.mark.parametrize("size", [2, 3, 10])
+def test_new_round_does_not_start_with_last_question(size):
+    """Yeni turun ilk sorusu önceki turun son sorusu değildir"""
+    sampler = QuestionSampler(random.Random(2))
+    state = None
+    previous_last = None
+    for _ in range(200):
+        ids, state = _draw(sampler, state, size, size)
+        assert ids[0] != previous_last
+        previous_last = ids[-1]
+
+def test_growing_bank_finishes_current_round_first():
+    """Banka büyüdüğünde süren tur tekrarsız tamamlanır, yeni sorular sonraki turda gelir"""
+    sampler = QuestionSampler(random.Random(3))
+    first, state = _draw(sampler, None, 10, 4)
+    rest, state = _draw(sampler, state, 15, 6)
+    
+    assert sorted(first + rest) == list(range(10))
+    assert state[1:] == (0, 15)
+    
+    next_round, state = _draw(sampler, state, 15, 15)
+    assert sorted(next_round) == list(range(15))
+    assert next_round[0] != rest[-1]
+
+def test_shrinking_bank_starts_new_round():
+    """Banka küçüldüyse artık olmayan id'ler gelmez"""
+    sampler = QuestionSampler(random.Random(4))
+    _, state = _draw(sampler, None, 20, 3)
+    ids, state = _draw(sampler, state, 5, 5)
+    
+    assert sorted(ids) == list(range(5))
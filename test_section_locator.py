@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Bölüm bulma ve matematik testi çıktı klasörü testleri
+"""
+
+import os
+
+import pytest
+
+from question_extractor import resolve_math_output
+from section_locator import MATH_SECTION, SectionIndex, SectionMarker
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+def _marker(name, page):
+    return SectionMarker(name, page, (0, 0, 1, 1))
+
+def test_last_section_is_not_split():
+    """Belge sonuna kadar süren son bölüm ayrı test sayılmaz"""
+    sections = SectionIndex([_marker(MATH_SECTION, 0)], 12)
+    
+    assert sections.get(MATH_SECTION).end_page == 12
+    assert sections.get_split(MATH_SECTION) is None
+    assert resolve_math_output("2013-ygs", sections) == (None, "2013-ygs")
+
+def test_section_followed_by_another_is_split():
+    """Ardından başka bölüm gelen matematik bölümü ayrılır ve klasör adına ek alır"""
+    sections = SectionIndex([_marker("Türkçe", 2), _marker(MATH_SECTION, 26), _marker("Fen Bilimleri", 38)], 53)
+    
+    assert sections.get_split(MATH_SECTION).end_page == 38
+    assert resolve_math_output("YGSkitapcigi12032017", sections) == ((26, 38), "YGSkitapcigi12032017_matematik")
+
+def test_math_test_pdf_name_gets_no_suffix():
+    """Adı _matematik_testi ile biten PDF'lere ek eklenmez"""
+    sections = SectionIndex([_marker(MATH_SECTION, 0), _marker("Fen Bilimleri", 11)], 14)
+    
+    assert resolve_math_output("Kitapcik_matematik_testi", sections) == ((0, 11), "Kitapcik_matematik_testi")
+
+# Paketteki kitapçıklar ve mevcut output klasörleri (cevap anahtarları bu klasörlerde)
+BUNDLED_OUTPUT_FOLDERS = {
+    '2013-ygs.pdf': '2013-ygs',
+    '2015-YGS.pdf': '2015-YGS',
+    '2016-ygs.pdf': '2016-ygs',
+    '2016_ygs_fizik.pdf': '2016_ygs_fizik',
+    'InternetKitapcigi29032018_matematik_testi.pdf': 'InternetKitapcigi29032018_matematik_testi',
+    'YGSkitapcigi12032017.pdf': 'YGSkitapcigi12032017_matematik',
+    'YGSkitapcigi12032017_matematik_testi.pdf': 'YGSkitapcigi12032017_matematik_testi',
+    'yks_tyt_2025_kitapcik_d250.pdf': 'yks_tyt_2025_kitapcik_d250',
+}
+
+@pytest.mark.pdf
+@pytest.mark.parametrize("pdf_file, folder", sorted(BUNDLED_OUTPUT_FOLDERS.items()))
+def test_bundled_booklets_keep_output_folder(pdf_file, folder):
+    """Sadece matematik testi içeren kitapçıklar mevcut klasör adlarını korur"""
+    pdf_path = os.path.join(ROOT, pdf_file)
+    if not os.path.exists(pdf_path):
+        pytest.skip(f"{pdf_file} bulunamadı")
+    
+    pdf_name = os.path.splitext(pdf_file)[0]
+    _, output_name = resolve_math_output(pdf_name, SectionIndex.from_pdf(pdf_path))
+    assert output_name == folder
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Sohbet başına sıralı güncelleme işleyici testleri
+"""
+
+import asyncio
+import datetime
+
+import pytest
+
+pytest.importorskip("telegram")
+
+from telegram import Chat, Message, Update
+
+from update_processor import PerChatUpdateProcessor
+
+def _update(update_id, chat_id):
+    chat = Chat(chat_id, Chat.PRIVATE)
+    message = Message(update_id, datetime.datetime.now(datetime.timezone.utc), chat, text=f"/soru {update_id}")
+    return Update(update_id, message=message)
+
+class Recorder:
+    """İşlenen güncellemeleri ve aynı anda çalışan işleyici sayısını kaydeder"""
+    
+    def __init__(self):
+        self.order = {}
+        self.in_flight = 0
+        self.max_in_flight = 0
+    
+    async def handle(self, chat_id, update_id, delay):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(delay)
+            self.order.setdefault(chat_id, []).append(update_id)
+        finally:
+            self.in_flight -= 1
+
+async def _dispatch(processor, recorder, updates):
+    """Güncellemeleri Application'ın yaptığı gibi geliş sırasıyla ayrı görevlerde işler"""
+    tasks = []
+    for update_id, chat_id, delay in updates:
+        coroutine = recorder.handle(chat_id, update_id, delay)
+        tasks.append(asyncio.create_task(processor.process_update(_update(update_id, chat_id), coroutine)))
+        await asyncio.sleep(0)
+    await asyncio.gather(*tasks)
+
+def test_same_chat_updates_keep_arrival_order():
+    """İç içe gelen iki sohbetin güncellemeleri kendi sohbetleri içinde geliş sırasıyla işlenir"""
+    # İlk güncellemeler en uzun sürer - kilit olmasa sıra bozulurdu
+    updates = [(i, 100 + i % 2, 0.02 if i < 4 else 0.001) for i in range(10)]
+    processor = PerChatUpdateProcessor(4)
+    recorder = Recorder()
+    
+    asyncio.run(_dispatch(processor, recorder, updates))
+    
+    assert recorder.order == {100: [0, 2, 4, 6, 8], 101: [1, 3, 5, 7, 9]}
+    assert processor._chat_locks == {}
+
+def test_global_limit_is_respected():
+    """Farklı sohbetler paralel işlenir ama aynı anda en fazla max_concurrent_updates güncelleme çalışır"""
+    updates = [(i, 100 + i % 6, 0.01) for i in range(24)]
+    processor = PerChatUpdateProcessor(3)
+    recorder = Recorder()
+    
+    asyncio.run(_dispatch(processor, recorder, updates))
+    
+    assert processor.concurrency_limit == 3
+    assert recorder.max_in_flight == 3
+    assert sum(len(ids) for ids in recorder.order.values()) == 24
+
+def test_waiting_chat_does_not_hold_slots():
+    """Sırasını bekleyen güncellemeler yer tutmaz - yoğun bir sohbet diğerlerini bekletmez"""
+    async def run():
+        processor = PerChatUpdateProcessor(2)
+        recorder = Recorder()
+        busy = [(i, 100, 0.05) for i in range(5)]
+        busy_task = asyncio.create_task(_dispatch(processor, recorder, busy))
+        await asyncio.sleep(0.01)
+        
+        started = asyncio.get_running_loop().time()
+        await processor.process_update(_update(99, 200), recorder.handle(200, 99, 0))
+        elapsed = asyncio.get_running_loop().time() - started
+        await busy_task
+        return recorder, elapsed
+    
+    recorder, elapsed = asyncio.run(run())
+    
+    assert recorder.order[200] == [99]
+    assert elapsed < 0.1
+    assert recorder.max_in_flight <= 2
+
+def test_updates_without_chat_are_limited():
+    """Sohbeti olmayan güncellemeler sadece genel sınıra tabidir"""
+    async def run():
+        processor = PerChatUpdateProcessor(2)
+        recorder = Recorder()
+        await asyncio.gather(*(processor.process_update(object(), recorder.handle(None, i, 0.01)) for i in range(6)))
+        return recorder
+    
+    recorder = asyncio.run(run())
+    
+    assert recorder.max_in_flight == 2
+    assert sorted(recorder.order[None]) == list(range(6))
+
+def test_non_positive_limit_is_rejected():
+    with pytest.raises(ValueError):
+        PerChatUpdateProcessor(0)
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Kullanıcı durumu deposu testleri - kayan pencere kotası, toplu yazma ve bellekten çıkarma
+"""
+
+import sqlite3
+
+import pytest
+
+from user_state import UserStateStore
+
+class FakeClock:
+    def __init__(self, now=0.0):
+        self.now = now
+    
+    def __call__(self):
+        return self.now
+
+class FailingConnection:
+    """İlk failures yazımda sqlite3.Error veren bağlantı sarmalayıcısı"""
+    
+    def __init__(self, conn, failures=1):
+        self.conn = conn
+        self.failures = failures
+    
+    def __enter__(self):
+        return self.conn.__enter__()
+    
+    def __exit__(self, *exc):
+        return self.conn.__exit__(*exc)
+    
+    def executemany(self, sql, rows):
+        if self.failures:
+            self.failures -= 1
+            raise sqlite3.OperationalError("database is locked")
+        return self.conn.executemany(sql, rows)
+    
+    def close(self):
+        self.conn.close()
+
+@pytest.fixture
+def clock():
+    return FakeClock(1000.0)
+
+def _store(tmp_path, clock, **kwargs):
+    return UserStateStore(str(tmp_path / "user_state.sqlite3"), clock=clock, window_seconds=100, **kwargs)
+
+def test_sliding_window_quota(tmp_path, clock):
+    """Önceki pencerenin istekleri geçen süre oranında azalır; kesirli tahmin hakkı erken bitirmez"""
+    store = _store(tmp_path, clock)
+    clock.now = 1000.0  # Pencere 10'un başı
+    for _ in range(3):
+        store.record_question(1, 0)
+    assert store.quota_remaining(1, 3) == 0
+    assert store.quota_remaining(1, 5) == 2
+    
+    clock.now = 1150.0  # Pencere 11'in ortası: 3 * 0.5 = 1.5 kullanılmış sayılır
+    assert store.quota_remaining(1, 2) == 1
+    store.record_question(1, 0)  # 2.5
+    assert store.quota_remaining(1, 3) == 1
+    assert store.quota_remaining(1, 2) == 0
+    
+    clock.now = 1300.0  # İki pencere sonra sayaç sıfırlanır
+    assert store.quota_remaining(1, 2) == 2
+    assert store.quota_remaining(1, None) is None
+    store.close()
+
+def test_last_question_is_persisted_with_image_path(tmp_path, clock):
+    store = _store(tmp_path, clock)
+    store.record_question(7, 12, "output/kitapcik/soru_3_sayfa_1_sol.png")
+    store.set_sampler_state(7, (99, 4, 20))
+    store.close()
+    
+    reopened = _store(tmp_path, clock)
+    assert reopened.last_question(7) == (12, "output/kitapcik/soru_3_sayfa_1_sol.png")
+    assert reopened.sampler_state(7) == (99, 4, 20)
+    assert reopened.last_question(8) == (None, None)
+    reopened.close()
+
+def test_old_database_gets_new_columns(tmp_path, clock):
+    """Görsel yolu sütunu olmayan eski veritabanı açılırken sütun eklenir"""
+    path = tmp_path / "user_state.sqlite3"
+    conn = sqlite3.connect(str(path))
+    conn.execute("CREATE TABLE users (user_id INTEGER PRIMARY KEY, last_question_id INTEGER, sampler_seed INTEGER, "
+                 "sampler_cursor INTEGER, sampler_size INTEGER, window_start INTEGER NOT NULL DEFAULT 0, "
+                 "window_count INTEGER NOT NULL DEFAULT 0, previous_count INTEGER NOT NULL DEFAULT 0, "
+                 "updated_at REAL NOT NULL DEFAULT 0)")
+    conn.execute("INSERT INTO users (user_id, last_question_id) VALUES (5, 3)")
+    conn.commit()
+    conn.close()
+    
+    store = _store(tmp_path, clock)
+    assert store.last_question(5) == (3, None)
+    store.close()
+
+def test_failed_flush_is_retried(tmp_path, clock):
+    """sqlite3.Error sonrası değişiklikler kaybolmaz, sonraki flush'ta yazılır"""
+    store = _store(tmp_path, clock)
+    store._write_conn = FailingConnection(store._write_conn)
+    store.record_question(1, 5, "a.png")
+    
+    assert store.flush() == 0
+    assert store._dirty == {1}
+    assert store.flush() == 1
+    assert store._dirty == set()
+    store.close()
+    
+    reopened = _store(tmp_path, clock)
+    assert reopened.last_question(1) == (5, "a.png")
+    reopened.close()
+
+def test_ttl_eviction_skips_unflushed_entries(tmp_path, clock):
+    """Süresi dolan kullanıcılar çıkarılır, yazılmayı bekleyenler yazılana kadar bellekte kalır"""
+    store = _store(tmp_path, clock, ttl_seconds=60)
+    store.get(1)
+    store.record_question(2, 9, "b.png")
+    
+    clock.now += 120
+    assert store.evict() == 1
+    assert len(store) == 1
+    
+    store.flush()
+    assert store.evict() == 1
+    assert len(store) == 0
+    assert store.last_question(2) == (9, "b.png")
+    store.close()
+
+def test_lru_eviction_removes_least_recently_used(tmp_path, clock):
+    """max_cached aşılınca en uzun süre erişilmeyen (yazılmış) kullanıcılar çıkarılır"""
+    store = _store(tmp_path, clock, max_cached=2)
+    for user_id in (1, 2, 3):
+        store.record_question(user_id, user_id)
+        clock.now += 1
+    store.get(1)  # 1 yeniden kullanıldı, en eskisi 2
+    
+    assert store.evict() == 0  # Hepsi yazılmayı bekliyor
+    store.flush()
+    assert store.evict() == 1
+    assert list(store._cache) == [3, 1]
+    store.close()
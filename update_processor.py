@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Eşzamanlı güncelleme işleme modülü
+Farklı sohbetlerin güncellemelerini paralel, aynı sohbetin güncellemelerini geliş sırasıyla işler
+"""
+
+import asyncio
+import sys
+from typing import Any, Awaitable, Dict, Optional
+
+from telegram import Update
+from telegram.ext import BaseUpdateProcessor
+
+class PerChatUpdateProcessor(BaseUpdateProcessor):
+    def __init__(self, max_concurrent_updates: int):
+        """En fazla max_concurrent_updates güncelleme aynı anda işlenir
+        
+        process_update (PTB'de final) semaforunu sohbet kilidinden önce alır; sırasını bekleyen
+        güncellemeler yer tutmasın diye o semafor sınırsız bırakılır, asıl sınır (concurrency_limit)
+        do_process_update içinde sohbet kilidinden sonra uygulanır.
+        """
+        if max_concurrent_updates < 1:
+            raise ValueError("max_concurrent_updates pozitif bir tam sayı olmalı")
+        super().__init__(sys.maxsize)
+        self.concurrency_limit = max_concurrent_updates
+        self._limit_semaphore = asyncio.BoundedSemaphore(max_concurrent_updates)
+        # chat_id -> [kilit, bekleyen güncelleme sayısı]
+        self._chat_locks: Dict[int, list] = {}
+    
+    @staticmethod
+    def _chat_id(update: object) -> Optional[int]:
+        """Güncellemenin ait olduğu sohbet id'si (yoksa None)"""
+        if isinstance(update, Update) and update.effective_chat:
+            return update.effective_chat.id
+        return None
+    
+    async def do_process_update(self, update: object, coroutine: Awaitable[Any]) -> None:
+        """Sohbet kilidini eşzamanlılık sınırından önce al - aynı sohbetin sırası korunur"""
+        chat_id = self._chat_id(update)
+        if chat_id is None:
+            async with self._limit_semaphore:
+                await coroutine
+            return
+        
+        entry = self._chat_locks.get(chat_id)
+        if entry is None:
+            entry = [asyncio.Lock(), 0]
+            self._chat_locks[chat_id] = entry
+        entry[1] += 1
+        
+        try:
+            # asyncio.Lock bekleyenleri FIFO sırasıyla uyandırır
+            async with entry[0]:
+                async with self._limit_semaphore:
+                    await coroutine
+        finally:
+            entry[1] -= 1
+            if entry[1] == 0:
+                self._chat_locks.pop(chat_id, None)
+    
+    async def initialize(self) -> None:
+        """Başlatılacak kaynak yok"""
+    
+    async def shutdown(self) -> None:
+        """Kapatılacak kaynak yok"""
+        self._chat_locks.clear()
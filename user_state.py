@@ -0,0 +1,274 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Kullanıcı durumu modülü
+Son soru, soru sırası (örnekleyici durumu) ve günlük soru kotası SQLite (WAL) veritabanında tutulur.
+Son soru id'siyle birlikte görsel yolu da saklanır; id katalogda başka bir soruyu gösteriyorsa
+soru görsel yolundan bulunur.
+Handler'lar sadece bellekteki kaydı günceller; değişiklikler arka plan thread'inde toplu yazılır.
+Uzun süre erişilmeyen kullanıcılar bellekten çıkarılır.
+"""
+
+import math
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, List, Optional, Tuple
+
+# Kota penceresi (saniye) - kayan 24 saat
+QUOTA_WINDOW_SECONDS = 24 * 60 * 60
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS users (
+    user_id INTEGER PRIMARY KEY,
+    last_question_id INTEGER,
+    last_question_path TEXT,
+    sampler_seed INTEGER,
+    sampler_cursor INTEGER,
+    sampler_size INTEGER,
+    window_start INTEGER NOT NULL DEFAULT 0,
+    window_count INTEGER NOT NULL DEFAULT 0,
+    previous_count INTEGER NOT NULL DEFAULT 0,
+    updated_at REAL NOT NULL DEFAULT 0
+)
+"""
+
+COLUMNS = [
+    'user_id', 'last_question_id', 'last_question_path', 'sampler_seed', 'sampler_cursor', 'sampler_size',
+    'window_start', 'window_count', 'previous_count', 'updated_at'
+]
+
+# Eski veritabanlarına eklenen sütunlar: ad -> tür
+ADDED_COLUMNS = {
+    'last_question_path': 'TEXT',
+}
+
+class UserState:
+    """Tek kullanıcının durumu - kota sayacı iki sabit pencereden kayan pencere tahmini yapar"""
+    
+    __slots__ = ('user_id', 'last_question_id', 'last_question_path', 'sampler', 'window_start', 'window_count',
+                 'previous_count', 'updated_at', 'last_access')
+    
+    def __init__(self, user_id: int, last_question_id: Optional[int] = None, last_question_path: Optional[str] = None,
+                 sampler: Optional[Tuple[int, int, int]] = None, window_start: int = 0, window_count: int = 0,
+                 previous_count: int = 0, updated_at: float = 0.0):
+        self.user_id = user_id
+        self.last_question_id = last_question_id
+        self.last_question_path = last_question_path
+        self.sampler = sampler  # (tohum, imleç, tur boyutu)
+        self.window_start = window_start  # Geçerli pencerenin sırası (zaman // pencere)
+        self.window_count = window_count
+        self.previous_count = previous_count
+        self.updated_at = updated_at
+        self.last_access = 0.0
+    
+    @classmethod
+    def from_row(cls, row) -> 'UserState':
+        (user_id, last_question_id, last_question_path, seed, cursor, size,
+         window_start, window_count, previous_count, updated_at) = row
+        sampler = (seed, cursor, size) if seed is not None else None
+        return cls(user_id, last_question_id, last_question_path, sampler, window_start, window_count, previous_count, updated_at)
+    
+    def to_row(self) -> tuple:
+        seed, cursor, size = self.sampler if self.sampler else (None, None, None)
+        return (self.user_id, self.last_question_id, self.last_question_path, seed, cursor, size,
+                self.window_start, self.window_count, self.previous_count, self.updated_at)
+    
+    def _roll_window(self, now: float, window: int):
+        """Pencereyi şimdiki zamana kaydır - O(1)"""
+        current = int(now // window)
+        if current == self.window_start:
+            return
+        self.previous_count = self.window_count if current == self.window_start + 1 else 0
+        self.window_count = 0
+        self.window_start = current
+    
+    def quota_used(self, now: float, window: int = QUOTA_WINDOW_SECONDS) -> float:
+        """Son pencere süresindeki istek sayısı tahmini (önceki pencere geçen süre oranında azalır)"""
+        self._roll_window(now, window)
+        elapsed = (now % window) / window
+        return self.previous_count * (1 - elapsed) + self.window_count
+
+class UserStateStore:
+    def __init__(self, path: str, ttl_seconds: float = 3600, max_cached: int = 10000, flush_interval: float = 2.0,
+                 batch_size: int = 256, window_seconds: int = QUOTA_WINDOW_SECONDS, clock: Callable[[], float] = time.time):
+        """Veritabanını aç - start() ile arka plan yazıcısı başlatılır
+        
+        ttl_seconds: bu süre erişilmeyen (ve yazılmayı beklemeyen) kullanıcılar bellekten çıkarılır
+        max_cached: bellekte tutulacak en fazla kullanıcı (aşılırsa en eski erişilenler çıkarılır)
+        flush_interval/batch_size: değişiklikler bu aralıkla veya bu kadar birikince toplu yazılır
+        """
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.max_cached = max_cached
+        self.flush_interval = flush_interval
+        self.batch_size = batch_size
+        self.window_seconds = window_seconds
+        self.clock = clock
+        
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        
+        # Okuma bağlantısı (event loop) ve yazma bağlantısı (arka plan thread'i) ayrıdır - WAL eşzamanlı okumaya izin verir
+        self._write_conn = self._connect()
+        self._write_conn.execute(SCHEMA)
+        existing = {row[1] for row in self._write_conn.execute("PRAGMA table_info(users)")}
+        for name, column_type in ADDED_COLUMNS.items():
+            if name not in existing:
+                self._write_conn.execute(f"ALTER TABLE users ADD COLUMN {name} {column_type}")
+        self._write_conn.commit()
+        self._read_conn = self._connect()
+        
+        self._cache: "OrderedDict[int, UserState]" = OrderedDict()
+        self._dirty = set()
+        self._flushing = set()
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread = None
+    
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+    
+    def start(self):
+        """Arka plan yazıcı thread'ini başlat"""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="user-state-writer", daemon=True)
+            self._thread.start()
+    
+    def close(self):
+        """Yazıcıyı durdur, bekleyen değişiklikleri yaz ve bağlantıları kapat"""
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        self.flush()
+        self._read_conn.close()
+        self._write_conn.close()
+    
+    def __len__(self):
+        return len(self._cache)
+    
+    # Handler tarafı (event loop) - diske yazmaz
+    
+    def get(self, user_id: int) -> UserState:
+        """Kullanıcı durumunu döndür - bellekte yoksa veritabanından (birincil anahtarla) okunur"""
+        with self._lock:
+            state = self._cache.get(user_id)
+            if state is None:
+                row = self._read_conn.execute(
+                    f"SELECT {', '.join(COLUMNS)} FROM users WHERE user_id = ?", (user_id,)
+                ).fetchone()
+                state = UserState.from_row(row) if row else UserState(user_id)
+                self._cache[user_id] = state
+            else:
+                self._cache.move_to_end(user_id)
+            state.last_access = self.clock()
+            return state
+    
+    def _mark_dirty(self, state: UserState):
+        state.updated_at = self.clock()
+        with self._lock:
+            self._dirty.add(state.user_id)
+            pending = len(self._dirty)
+        if pending >= self.batch_size:
+            self._wake.set()
+    
+    def last_question(self, user_id: int) -> Tuple[Optional[int], Optional[str]]:
+        """Kullanıcıya en son gönderilen sorunun (id, görsel yolu) - eski kayıtlarda yol None olabilir"""
+        state = self.get(user_id)
+        return state.last_question_id, state.last_question_path
+    
+    def sampler_state(self, user_id: int) -> Optional[Tuple[int, int, int]]:
+        """Kullanıcının soru sırası durumu"""
+        return self.get(user_id).sampler
+    
+    def set_sampler_state(self, user_id: int, sampler: Tuple[int, int, int]):
+        """Soru sırası durumunu güncelle"""
+        state = self.get(user_id)
+        state.sampler = sampler
+        self._mark_dirty(state)
+    
+    def quota_remaining(self, user_id: int, limit: Optional[int]) -> Optional[int]:
+        """Kayan pencerede kalan soru hakkı (limit yoksa None)"""
+        if not limit:
+            return None
+        used = self.get(user_id).quota_used(self.clock(), self.window_seconds)
+        # Tahmin kesirli olabilir - sınıra ulaşılmadıysa en az bir hak kalır
+        if used >= limit:
+            return 0
+        return math.ceil(limit - used)
+    
+    def record_question(self, user_id: int, question_id: int, image_path: Optional[str] = None):
+        """Gönderilen soruyu (id ve görsel yolu) kaydet ve kota sayacını arttır"""
+        state = self.get(user_id)
+        state.quota_used(self.clock(), self.window_seconds)  # Pencereyi kaydır
+        state.window_count += 1
+        state.last_question_id = question_id
+        state.last_question_path = image_path
+        self._mark_dirty(state)
+    
+    # Arka plan tarafı
+    
+    def flush(self) -> int:
+        """Değişen kullanıcıları tek işlemde yaz - yazılan kayıt sayısını döndürür"""
+        with self._lock:
+            if not self._dirty:
+                return 0
+            rows = [self._cache[user_id].to_row() for user_id in self._dirty if user_id in self._cache]
+            self._flushing = self._dirty
+            self._dirty = set()
+        
+        try:
+            with self._write_conn:
+                self._write_conn.executemany(
+                    f"INSERT OR REPLACE INTO users ({', '.join(COLUMNS)}) VALUES ({', '.join('?' * len(COLUMNS))})",
+                    rows
+                )
+        except sqlite3.Error as e:
+            print(f"Kullanıcı durumu yazılamadı, tekrar denenecek: {e}")
+            with self._lock:
+                self._dirty |= self._flushing
+            return 0
+        finally:
+            with self._lock:
+                flushed = self._flushing
+                self._flushing = set()
+        
+        return len(flushed)
+    
+    def evict(self) -> int:
+        """Süresi dolan veya sınırı aşan (yazılmış) kullanıcıları bellekten çıkar - en eski erişilenden başlar"""
+        now = self.clock()
+        with self._lock:
+            victims = []
+            for user_id, state in self._cache.items():
+                if len(self._cache) - len(victims) <= self.max_cached and now - state.last_access < self.ttl_seconds:
+                    break
+                # Yazılmayı bekleyen kayıt çıkarılmaz (tekrar okunursa eski hali gelirdi)
+                if user_id in self._dirty or user_id in self._flushing:
+                    continue
+                victims.append(user_id)
+            for user_id in victims:
+                del self._cache[user_id]
+        return len(victims)
+    
+    def _run(self):
+        """Periyodik toplu yazma ve bellek temizliği"""
+        while not self._stop.is_set():
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            self.flush()
+            self.evict()
+
+def is_quota_exempt(user_id: int, admin_user_ids: List[int]) -> bool:
+    """Admin kullanıcılar kotadan muaf"""
+    return user_id in (admin_user_ids or ())